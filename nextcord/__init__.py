@@ -29,6 +29,7 @@ from .asset import *
 from .audit_logs import *
 from .auto_moderation import *
 from .bans import *
+from .cache import *
 from .channel import *
 from .client import *
 from .colour import *
@@ -37,6 +38,7 @@ from .embeds import *
 from .emoji import *
 from .enums import *
 from .errors import *
+from .executor import *
 from .file import *
 from .flags import *
 from .guild import *
@@ -45,18 +47,23 @@ from .integrations import *
 from .interactions import *
 from .invite import *
 from .member import *
+from .member_store import *
 from .mentions import *
 from .message import *
 from .object import *
 from .partial_emoji import *
 from .permissions import *
 from .player import *
+from .ratelimits import *
 from .raw_models import *
 from .reaction import *
+from .replay import *
+from .response_cache import *
 from .role import *
 from .role_connections import *
 from .scheduled_events import *
 from .shard import *
+from .shared_cache import *
 from .stage_instance import *
 from .sticker import *
 from .team import *
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import importlib.metadata
 import platform
 import sys
@@ -277,6 +278,26 @@ def newcog(parser, args) -> None:
         print("successfully made cog at", directory)
 
 
+def replay(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    try:
+        stats = asyncio.run(nextcord.replay_gateway(args.trace, trace_memory=args.memory))
+    except (OSError, ValueError) as exc:
+        parser.error(f"could not replay trace ({exc})")
+
+    print(f"{stats.events} events in {stats.elapsed:.3f}s ({stats.events_per_second:.0f} events/s)")
+    if stats.peak_memory is not None:
+        print(f"peak memory: {stats.peak_memory / 1024 / 1024:.1f} MiB")
+    if stats.http_requests:
+        print(f"HTTP requests skipped: {stats.http_requests}")
+
+    print("\nparser CPU time:")
+    times = sorted(stats.parser_times.items(), key=lambda item: item[1], reverse=True)
+    for event, seconds in times[: args.top]:
+        calls = stats.parser_calls[event]
+        per_call = seconds / calls * 1e6
+        print(f"  {event:<40} {seconds * 1000:>10.2f}ms {calls:>8} calls {per_call:>10.1f}us/call")
+
+
 def add_newbot_args(subparser) -> None:
     parser = subparser.add_parser("newbot", help="creates a command bot project quickly")
     parser.set_defaults(func=newbot)
@@ -315,6 +336,25 @@ def add_newcog_args(subparser) -> None:
     parser.add_argument("--full", help="add all special methods as well", action="store_true")
 
 
+def add_replay_args(subparser) -> None:
+    parser = subparser.add_parser(
+        "replay", help="replays a recorded gateway trace and reports how fast it was processed"
+    )
+    parser.set_defaults(func=replay)
+
+    parser.add_argument("trace", help="the trace recorded with nextcord.GatewayRecorder")
+    parser.add_argument(
+        "--memory", help="trace memory allocations to report the peak memory", action="store_true"
+    )
+    parser.add_argument(
+        "--top",
+        help="the amount of parsers to show (default: 20)",
+        type=int,
+        default=20,
+        metavar="<count>",
+    )
+
+
 def parse_args():
     parser = argparse.ArgumentParser(prog="discord", description="Tools for helping with nextcord")
     parser.add_argument("-v", "--version", action="store_true", help="shows the library version")
@@ -323,6 +363,7 @@ def parse_args():
     subparser = parser.add_subparsers(dest="subcommand", title="subcommands")
     add_newbot_args(subparser)
     add_newcog_args(subparser)
+    add_replay_args(subparser)
     return parser, parser.parse_args()
 
 
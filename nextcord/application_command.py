@@ -2072,6 +2072,10 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         self.contexts = None if contexts is None else [InteractionContextType(x) for x in contexts]
 
         self.force_global: bool = force_global
+        # The results of is_interaction_valid, keyed by the shape of the interaction data.
+        # Cleared when the command is added to or removed from the state, as its payload may
+        # have changed.
+        self._interaction_checks: Dict[Tuple[Any, ...], bool] = {}
 
         self.command_ids: Dict[Optional[int], int] = {}
         """
@@ -2461,7 +2465,19 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         if data is None:
             raise ValueError("Discord did not provide us with interaction data")
 
-        our_payload = self.get_payload(data.get("guild_id", None))
+        # Option values don't matter to the check, so interactions with the same options
+        # share the result.
+        shape = _interaction_shape(data)  # type: ignore
+        if (valid := self._interaction_checks.get(shape)) is None:
+            if len(self._interaction_checks) >= 128:
+                self._interaction_checks.clear()
+            valid = self._check_interaction_data(data)  # type: ignore
+            self._interaction_checks[shape] = valid
+
+        return valid
+
+    def _check_interaction_data(self, data: dict) -> bool:
+        our_payload = self.get_payload(data.get("guild_id"))
 
         def _recursive_subcommand_check(inter_pos: dict, cmd_pos: dict) -> bool:
             """A small recursive wrapper that checks for subcommand(s) (group(s)).
@@ -2582,15 +2598,14 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
                 return False  # Interaction has more options than we do.
             return True  # No checks failed.
 
-        # caring  about typeddict specificity will cause issues down the line
-        if not check_dictionary_values(our_payload, data, "name", "guild_id", "type"):  # type: ignore
+        if not check_dictionary_values(our_payload, data, "name", "guild_id", "type"):
             _log.debug("%s Failed basic dictionary check.", self.error_name)
             return False
 
         data_options = data.get("options")
         payload_options = our_payload.get("options")
         if data_options and payload_options:
-            return _recursive_subcommand_check(data, our_payload)  # type: ignore
+            return _recursive_subcommand_check(data, our_payload)
         if data_options is None and payload_options is None:
             return True  # User and Message commands don't have options.
 
@@ -3444,6 +3459,28 @@ def user_command(
     return decorator
 
 
+def _options_shape(options: Optional[List[dict]]) -> Optional[Tuple[Any, ...]]:
+    if options is None:
+        return None
+
+    return tuple(
+        (option.get("name"), option.get("type"), _options_shape(option.get("options")))
+        for option in options
+    )
+
+
+def _interaction_shape(data: dict) -> Tuple[Any, ...]:
+    """Returns the names and types of a command and its options from interaction data,
+    without the option values.
+    """
+    return (
+        data.get("name"),
+        data.get("type"),
+        data.get("guild_id"),
+        _options_shape(data.get("options")),
+    )
+
+
 def check_dictionary_values(dict1: dict, dict2: dict, *keywords) -> bool:
     """Helper function to quickly check if 2 dictionaries share the equal value for the same keyword(s).
     Used primarily for checking against the registered command data from Discord.
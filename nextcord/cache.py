@@ -0,0 +1,284 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    TypeVar,
+    ValuesView,
+)
+
+from .member_store import CompactMemberStore
+
+__all__ = (
+    "CacheBackend",
+    "CachePolicy",
+    "CacheStore",
+    "MemoryCacheBackend",
+)
+
+V = TypeVar("V")
+
+CacheEntity = Literal[
+    "users",
+    "guilds",
+    "emojis",
+    "stickers",
+    "private_channels",
+    "members",
+    "channels",
+    "roles",
+    "threads",
+]
+EvictCallback = Callable[[int, Any], None]
+
+
+class CacheBackend(Protocol):
+    """A protocol for creating the stores that :class:`Client` caches entities in.
+
+    Stores are mutable mappings from IDs to entities. The client-wide entities, ``"users"``,
+    ``"guilds"``, ``"emojis"``, ``"stickers"`` and ``"private_channels"``, get one store each,
+    while every guild gets its own ``"members"``, ``"channels"``, ``"roles"`` and ``"threads"``
+    stores. Cached messages are limited with ``max_messages`` instead.
+
+    .. versionadded:: 3.3
+    """
+
+    def create_store(
+        self, entity: CacheEntity, *, on_evict: Optional[EvictCallback] = None
+    ) -> MutableMapping[int, Any]:
+        """Creates a store for the given entity type.
+
+        Parameters
+        ----------
+        entity: :class:`str`
+            The type of entity that will be stored.
+        on_evict: Optional[Callable[[:class:`int`, Any], None]]
+            A function that the store should call with the ID and entity of anything it drops
+            on its own, for example when it is full. It is not called for entities that the
+            library removes itself.
+
+        Returns
+        -------
+        MutableMapping[:class:`int`, Any]
+            The store.
+        """
+        ...
+
+
+class CachePolicy:
+    """Limits how many entities a :class:`CacheStore` holds and for how long.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    max_size: Optional[:class:`int`]
+        The maximum amount of entities in a store. Once full, the least recently used entity
+        is dropped. For entities stored per guild, this is the maximum per guild.
+    ttl: Optional[:class:`float`]
+        The amount of seconds an entity is kept for after it was last used or updated.
+    """
+
+    __slots__ = ("max_size", "ttl")
+
+    def __init__(self, *, max_size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size cannot be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+
+    def __repr__(self) -> str:
+        return f"<CachePolicy max_size={self.max_size} ttl={self.ttl}>"
+
+
+class CacheStore(MutableMapping[int, V]):
+    """A store that drops entities according to a :class:`CachePolicy`.
+
+    Looking up an entity counts as using it. Iterating over the store does not, and only
+    drops expired entities.
+
+    .. versionadded:: 3.3
+    """
+
+    __slots__ = ("max_size", "ttl", "_data", "_used_at", "_on_evict")
+
+    def __init__(self, policy: CachePolicy, *, on_evict: Optional[EvictCallback] = None) -> None:
+        self.max_size: Optional[int] = policy.max_size
+        self.ttl: Optional[float] = policy.ttl
+        self._data: OrderedDict[int, V] = OrderedDict()
+        """{ID: entity}, least recently used first."""
+        self._used_at: Dict[int, float] = {}
+        """{ID: monotonic time last used}, only filled in when there is a ttl."""
+        self._on_evict: Optional[EvictCallback] = on_evict
+
+    def _evict(self, key: int) -> None:
+        value = self._data.pop(key)
+        self._used_at.pop(key, None)
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def _expire(self) -> None:
+        if self.ttl is None or not self._data:
+            return
+
+        deadline = time.monotonic() - self.ttl
+        used_at = self._used_at
+        while self._data and used_at[key := next(iter(self._data))] <= deadline:
+            self._evict(key)
+
+    def _touch(self, key: int) -> None:
+        self._data.move_to_end(key)
+        if self.ttl is not None:
+            self._used_at[key] = time.monotonic()
+
+    def __getitem__(self, key: int) -> V:
+        value = self._data[key]
+        if self.ttl is not None and self._used_at[key] <= time.monotonic() - self.ttl:
+            self._evict(key)
+            raise KeyError(key)
+
+        self._touch(key)
+        return value
+
+    def get(self, key: int, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: int, value: V) -> None:
+        if self.max_size == 0:
+            return
+
+        self._data[key] = value
+        self._touch(key)
+        self._expire()
+        if self.max_size is not None:
+            while len(self._data) > self.max_size:
+                self._evict(next(iter(self._data)))
+
+    def __delitem__(self, key: int) -> None:
+        del self._data[key]
+        self._used_at.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        self._expire()
+        return key in self._data
+
+    def __iter__(self) -> Iterator[int]:
+        self._expire()
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    # These give views of the underlying dict, so that iterating doesn't count as using them.
+    def keys(self) -> KeysView[int]:
+        self._expire()
+        return self._data.keys()
+
+    def values(self) -> ValuesView[V]:
+        self._expire()
+        return self._data.values()
+
+    def items(self) -> ItemsView[int, V]:
+        self._expire()
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._used_at.clear()
+
+    def copy(self) -> Dict[int, V]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"<CacheStore max_size={self.max_size} ttl={self.ttl} len={len(self._data)}>"
+
+
+class MemoryCacheBackend:
+    """The default :class:`CacheBackend`, which keeps entities in memory.
+
+    Entities without a policy are kept in plain dicts until the library removes them, which is
+    how the library has always cached them. Private channels default to keeping the 128 most
+    recently used ones.
+
+    .. versionadded:: 3.3
+
+    .. warning::
+
+        Dropping guilds, channels or roles makes events referencing them be ignored, and
+        dropping the members of the client itself makes :attr:`Guild.me` ``None``. Policies are
+        mostly meant for members and users.
+
+    Parameters
+    ----------
+    policies: Optional[Mapping[:class:`str`, Optional[:class:`CachePolicy`]]]
+        The policy of each entity type, overriding the defaults. An entity type set to ``None``
+        is not cached at all.
+    compact_members: :class:`bool`
+        Whether to keep members in a :class:`CompactMemberStore`, which takes several times
+        less memory for guilds with many members at the cost of slower attribute access.
+        This cannot be combined with a policy for ``"members"``.
+
+    Examples
+    --------
+
+    Keeping at most 1000 members per guild, and users used in the last hour: ::
+
+        backend = nextcord.MemoryCacheBackend(
+            policies={
+                "members": nextcord.CachePolicy(max_size=1000),
+                "users": nextcord.CachePolicy(ttl=3600),
+            }
+        )
+        client = nextcord.Client(cache_backend=backend)
+    """
+
+    DEFAULT_POLICIES: ClassVar[Dict[str, Optional[CachePolicy]]] = {
+        "private_channels": CachePolicy(max_size=128),
+    }
+
+    def __init__(
+        self,
+        *,
+        policies: Optional[Mapping[str, Optional[CachePolicy]]] = None,
+        compact_members: bool = False,
+    ) -> None:
+        if compact_members and policies is not None and "members" in policies:
+            raise ValueError("compact_members cannot be combined with a policy for members")
+
+        self.policies: Dict[str, Optional[CachePolicy]] = {
+            **self.DEFAULT_POLICIES,
+            **(policies or {}),
+        }
+        self.compact_members: bool = compact_members
+
+    def create_store(
+        self, entity: CacheEntity, *, on_evict: Optional[EvictCallback] = None
+    ) -> MutableMapping[int, Any]:
+        if entity == "members" and self.compact_members:
+            return CompactMemberStore()
+        if entity not in self.policies:
+            return {}
+
+        policy = self.policies[entity]
+        return CacheStore(CachePolicy(max_size=0) if policy is None else policy, on_evict=on_evict)
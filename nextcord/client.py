@@ -4,19 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import inspect
 import logging
+import operator
 import signal
 import sys
 import traceback
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
     Coroutine,
+    Deque,
     Dict,
+    FrozenSet,
     Generator,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -32,7 +38,7 @@ from typing import (
 
 import aiohttp
 
-from . import utils
+from . import snapshot, utils
 from .activity import ActivityTypes, BaseActivity, create_activity
 from .appinfo import AppInfo
 from .application_command import (
@@ -54,14 +60,21 @@ from .enums import (
 from .errors import *
 from .flags import ApplicationFlags, Intents
 from .gateway import *
+from .gateway import (
+    GatewayCompression,
+    GatewayEncoding,
+    _check_gateway_transport,
+    _resolve_ignored_events,
+)
 from .guild import Guild
 from .guild_preview import GuildPreview
-from .http import HTTPClient
+from .http import BatchRequest, BatchResult, HTTPClient
 from .interactions import Interaction
 from .invite import Invite
 from .iterators import guild_iterator
 from .mentions import AllowedMentions
 from .object import Object
+from .profiling import EventProfiler
 from .stage_instance import StageInstance
 from .state import ConnectionState
 from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factory
@@ -82,13 +95,18 @@ if TYPE_CHECKING:
     from .abc import GuildChannel, PrivateChannel, Snowflake, SnowflakeTime
     from .application_command import ClientCog, SlashApplicationSubcommand
     from .asset import Asset
+    from .cache import CacheBackend
     from .channel import DMChannel
     from .enums import IntegrationType, InteractionContextType, Locale
+    from .executor import EventExecutor
     from .file import File
     from .flags import MemberCacheFlags
     from .member import Member
     from .message import Attachment, Message
     from .permissions import Permissions
+    from .ratelimits import RateLimitStore
+    from .replay import GatewayRecorder
+    from .response_cache import ResponseCache
     from .scheduled_events import ScheduledEvent
     from .types.checks import CoroFunc
     from .types.interactions import ApplicationCommand as ApplicationCommandPayload
@@ -102,6 +120,85 @@ InterT = TypeVar("InterT", bound="Interaction")
 
 _log = logging.getLogger(__name__)
 
+_Listener = Tuple[asyncio.Future, Callable[..., bool]]
+# The attribute getter of a wait_for key, and the listeners waiting for each value.
+_KeyedListeners = Tuple[Callable[[Any], Any], Dict[Any, List[_Listener]]]
+
+
+def _resolve_listeners(listeners: List[_Listener], args: Tuple[Any, ...]) -> None:
+    removed = []
+    for i, (future, condition) in enumerate(listeners):
+        if future.cancelled():
+            removed.append(i)
+            continue
+
+        try:
+            result = condition(*args)
+        except Exception as exc:
+            future.set_exception(exc)
+            removed.append(i)
+        else:
+            if result:
+                if len(args) == 0:
+                    future.set_result(None)
+                elif len(args) == 1:
+                    future.set_result(args[0])
+                else:
+                    future.set_result(args)
+                removed.append(i)
+
+    for idx in reversed(removed):
+        del listeners[idx]
+
+
+class _OrderedListener:
+    # Runs a listener for one event at a time per key, in the order the events were
+    # dispatched in, while events with different keys run concurrently. Events that come
+    # in while the listener is running for their key wait in a mailbox, and are run by
+    # the task that is already running the listener for that key.
+    #
+    # The mailbox of a key is looked up before the wrapper first suspends, so events are
+    # ordered by when their handler starts rather than when they are dispatched. Tasks
+    # start in the order they are created, and the workers of an EventExecutor lane take
+    # their next handler and start it without suspending in between, so both start
+    # handlers in dispatch order, however many workers a lane has. Events dropped by a
+    # full lane never reach the wrapper and are skipped.
+
+    def __init__(
+        self, client: Client, func: CoroFunc, name: str, key: Callable[..., Hashable]
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.client: Client = client
+        self.func: CoroFunc = func
+        self.name: str = name
+        self.key: Callable[..., Hashable] = key
+        self._mailboxes: Dict[Hashable, Deque[Tuple[Tuple[Any, ...], Dict[str, Any]]]] = {}
+
+    def __eq__(self, other: object) -> bool:
+        # Lets remove_listener find the listener by the function it wraps.
+        if isinstance(other, _OrderedListener):
+            return self is other
+        return self.func == other
+
+    def __hash__(self) -> int:
+        return hash(self.func)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        key = self.key(*args)
+        mailbox = self._mailboxes.get(key)
+        if mailbox is not None:
+            mailbox.append((args, kwargs))
+            return
+
+        mailbox = self._mailboxes[key] = deque()
+        try:
+            await self.client._run_event(self.func, self.name, *args, **kwargs)
+            while mailbox:
+                args, kwargs = mailbox.popleft()
+                await self.client._run_event(self.func, self.name, *args, **kwargs)
+        finally:
+            del self._mailboxes[key]
+
 
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     tasks = {t for t in asyncio.all_tasks(loop=loop) if not t.done()}
@@ -270,6 +367,112 @@ class Client:
 
         .. versionadded:: 2.3
 
+    gateway_encoding: :class:`str`
+        The encoding to receive gateway payloads in. Can be either ``"json"``, the default,
+        or ``"etf"`` for the Erlang External Term Format.
+
+        .. warning::
+
+            ETF support is experimental. Payloads are decoded in pure Python, which takes
+            several times longer than decoding JSON, and they aren't smaller than compressed
+            JSON payloads, so ``"json"`` should be preferred for performance.
+
+        .. versionadded:: 3.3
+
+    gateway_compression: Optional[:class:`str`]
+        The transport compression to use for the gateway connection. Can be ``"zlib-stream"``,
+        the default, ``"zstd-stream"`` or ``None`` to disable transport compression.
+
+        ``"zstd-stream"`` requires the `zstandard <https://pypi.org/project/zstandard/>`_
+        library, which is installed with the ``speed`` extra.
+
+        .. versionadded:: 3.3
+
+    ignored_events: Optional[Iterable[:class:`str`]]
+        Gateway event names, such as ``"TYPING_START"`` or ``"PRESENCE_UPDATE"``, that should
+        be dropped as soon as they are received. Ignored events are not parsed, do not update
+        the cache and are not dispatched, not even to :func:`on_socket_event_type`. This
+        is useful to cut the cost of high volume events that the bot never consumes.
+
+        ``READY`` and ``RESUMED`` cannot be ignored. Ignoring events that the library relies
+        on to build its cache, such as ``GUILD_CREATE``, will leave the cache out of date.
+
+        .. versionadded:: 3.3
+
+    ratelimit_store: Optional[:class:`RateLimitStore`]
+        A store to share HTTP rate limits through. This is useful when running shards of the
+        same bot in multiple processes, see :class:`UnixSocketRateLimitStore`. If not given,
+        rate limits are only tracked by this client.
+
+        .. versionadded:: 3.3
+
+    response_cache: Optional[:class:`ResponseCache`]
+        A cache for the HTTP responses of routes that rarely change, such as application
+        commands and stickers, and for assets read with :meth:`Asset.read`. If not given,
+        nothing is cached.
+
+        .. versionadded:: 3.3
+
+    cache_backend: Optional[:class:`CacheBackend`]
+        The backend creating the stores that users, guilds, members and other entities are
+        cached in, which can limit how many entities are kept and for how long. Defaults to
+        a :class:`MemoryCacheBackend`, caching everything like previous versions did.
+
+        .. versionadded:: 3.3
+
+    lazy_message_fields: :class:`bool`
+        Whether to defer building the attachments, embeds, reactions, mentions, components,
+        stickers, snapshots, reference and interaction data of received messages until they
+        are first accessed. This makes receiving messages faster when most of them are only
+        read for their content and author. Mentioned users are only cached once
+        :attr:`Message.mentions` is accessed. Defaults to ``False``.
+
+        .. versionadded:: 3.3
+
+    chunk_concurrency: :class:`int`
+        The maximum number of guilds per shard that are waiting for their members at the
+        same time while chunking guilds at start-up. Chunk requests are sent as fast as the
+        gateway rate limit allows, leaving room for other commands such as presence updates.
+        Defaults to ``10``.
+
+        .. versionadded:: 3.3
+
+    chunk_priority: Optional[Callable[[:class:`Guild`], Any]]
+        A key function ordering the guilds that wait to be chunked at start-up, guilds with
+        the lowest keys being chunked first. Defaults to chunking the guilds with the fewest
+        members first, so that most guilds become available quickly. Each guild is
+        dispatched with :func:`.on_guild_available` as soon as it is chunked, and
+        :func:`.on_chunk_progress` reports how many guilds are chunked.
+
+        .. versionadded:: 3.3
+
+    gateway_recorder: Optional[:class:`GatewayRecorder`]
+        A recorder that every payload received from the gateway is written to, so that it
+        can be replayed with :func:`replay_gateway`. Defaults to ``None``, recording nothing.
+
+        .. versionadded:: 3.3
+
+    profile_events: :class:`bool`
+        Whether to record how long each gateway event parser and each :meth:`dispatch` call
+        takes, along with how many memory blocks they allocate, grouped by event name. The
+        stats are returned by :meth:`get_event_stats`. This adds some overhead to every
+        event, so it defaults to ``False``.
+
+        .. versionadded:: 3.3
+
+    event_stats_interval: Optional[:class:`float`]
+        The amount of seconds between each :func:`on_event_stats` dispatch while logged in,
+        if ``profile_events`` is enabled. Defaults to ``None``, never dispatching it.
+
+        .. versionadded:: 3.3
+
+    event_executor: Optional[:class:`EventExecutor`]
+        The executor running event handlers on bounded pools of workers, queueing or
+        dropping them during bursts of events. Defaults to ``None``, starting a task for
+        every handler of every event.
+
+        .. versionadded:: 3.3
+
     Attributes
     ----------
     ws
@@ -306,6 +509,19 @@ class Client:
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        gateway_encoding: GatewayEncoding = "json",
+        gateway_compression: Optional[GatewayCompression] = "zlib-stream",
+        ignored_events: Optional[Iterable[str]] = None,
+        ratelimit_store: Optional[RateLimitStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        lazy_message_fields: bool = False,
+        chunk_concurrency: int = 10,
+        chunk_priority: Optional[Callable[[Guild], Any]] = None,
+        gateway_recorder: Optional[GatewayRecorder] = None,
+        profile_events: bool = False,
+        event_stats_interval: Optional[float] = None,
+        event_executor: Optional[EventExecutor] = None,
     ) -> None:
         # self.ws is set in the connect method
         self.ws: DiscordWebSocket = None  # type: ignore
@@ -314,8 +530,21 @@ class Client:
         except RuntimeError:
             self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
-        self._listeners: Dict[str, List[Tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        self._listeners: Dict[str, List[_Listener]] = {}
+        self._keyed_listeners: Dict[str, Dict[str, _KeyedListeners]] = {}
+        """{"event": {"attribute": (getter, {value: [(future, check), ...]})}}"""
         self.extra_events: Dict[str, List[CoroFunc]] = {}
+        self._dispatch_table: Dict[str, Tuple[str, Tuple[CoroFunc, ...]]] = {}
+        """{"event": ("on_event", (handlers...))}, filled in as events are dispatched."""
+
+        self._event_profiler: Optional[EventProfiler] = None
+        self._event_stats_interval: Optional[float] = event_stats_interval
+        self._event_stats_task: Optional[asyncio.Task[None]] = None
+        self._event_executor: Optional[EventExecutor] = event_executor
+        if profile_events:
+            self._event_profiler = EventProfiler()
+            # Wrapped before anything keeps a reference to the dispatch method.
+            self.dispatch = self._event_profiler.wrap_dispatch(self.dispatch)
 
         self.shard_id: Optional[int] = shard_id
         self.shard_count: Optional[int] = shard_count
@@ -326,6 +555,8 @@ class Client:
             proxy_auth=proxy_auth,
             assume_unsync_clock=assume_unsync_clock,
             dispatch=self.dispatch,
+            ratelimit_store=ratelimit_store,
+            response_cache=response_cache,
         )
 
         self._handlers: Dict[str, Callable] = {"ready": self._handle_ready}
@@ -334,6 +565,12 @@ class Client:
 
         self._enable_debug_events: bool = enable_debug_events
 
+        _check_gateway_transport(gateway_encoding, gateway_compression)
+        self._gateway_encoding: GatewayEncoding = gateway_encoding
+        self._gateway_compression: Optional[GatewayCompression] = gateway_compression
+        self._ignored_events: FrozenSet[str] = _resolve_ignored_events(ignored_events)
+        self._gateway_recorder: Optional[GatewayRecorder] = gateway_recorder
+
         self._connection: ConnectionState = self._get_state(
             max_messages=max_messages,
             application_id=application_id,
@@ -345,14 +582,24 @@ class Client:
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
         )
 
         self._connection.shard_count = self.shard_count
+        if self._event_profiler is not None:
+            parsers = self._connection.parsers
+            for event, func in parsers.items():
+                parsers[event] = self._event_profiler.wrap_parser(event, func)
         self._closed: bool = False
         self._ready: asyncio.Event = asyncio.Event()
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
         self._token: Optional[str] = None
+        self._snapshot_sessions: snapshot.Sessions = {}
+        self._keep_session: bool = False
 
         self._lazy_load_commands: bool = lazy_load_commands
         self._client_cogs: Set[ClientCog] = set()
@@ -392,9 +639,14 @@ class Client:
         intents: Intents,
         chunk_guilds_at_startup: bool,
         member_cache_flags: MemberCacheFlags,
+        cache_backend: Optional[CacheBackend],
+        lazy_message_fields: bool,
+        chunk_concurrency: int,
+        chunk_priority: Optional[Callable[[Guild], Any]],
     ) -> ConnectionState:
         return ConnectionState(
             dispatch=self.dispatch,
+            has_listener=self._has_listener,
             handlers=self._handlers,
             hooks=self._hooks,
             http=self.http,
@@ -409,6 +661,10 @@ class Client:
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
         )
 
     def _handle_ready(self) -> None:
@@ -435,6 +691,55 @@ class Client:
             return self.ws.is_ratelimited()
         return False
 
+    def get_event_stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the event stats collected so far, if ``profile_events``
+        is enabled.
+
+        The snapshot has the stats of each gateway event parser under ``"parsers"``, keyed
+        by gateway event name such as ``"GUILD_MEMBERS_CHUNK"``, and the stats of each
+        dispatched event under ``"dispatch"``, keyed by event name such as ``"message"``.
+        Each has the amount of ``calls``, the total and max ``wall_time`` and ``cpu_time`` in
+        seconds, and the net amount of ``allocated_blocks`` of memory, which stay allocated
+        when events add entities to the cache.
+
+        Dispatch stats only include the time taken to schedule the event handlers, not the
+        time taken to run them.
+
+        .. versionadded:: 3.3
+
+        Raises
+        ------
+        ClientException
+            Event profiling is not enabled.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            The snapshot, which is not updated by later events.
+        """
+        if self._event_profiler is None:
+            raise ClientException("Event profiling is not enabled")
+        return self._event_profiler.to_dict()
+
+    def reset_event_stats(self) -> None:
+        """Resets the event stats collected so far.
+
+        .. versionadded:: 3.3
+
+        Raises
+        ------
+        ClientException
+            Event profiling is not enabled.
+        """
+        if self._event_profiler is None:
+            raise ClientException("Event profiling is not enabled")
+        self._event_profiler.reset()
+
+    async def _dispatch_event_stats(self, interval: float) -> None:
+        while not self.is_closed():
+            await asyncio.sleep(interval)
+            self.dispatch("event_stats", self.get_event_stats())
+
     @property
     def user(self) -> Optional[ClientUser]:
         """Optional[:class:`.ClientUser`]: Represents the connected client. ``None`` if not logged in."""
@@ -543,48 +848,61 @@ class Client:
         # Schedules the task
         return asyncio.create_task(wrapped, name=f"nextcord: {event_name}")
 
+    # The handlers of each event are looked up once, then kept in the dispatch table until
+    # an event or listener is registered or removed.
+    def _get_event_handlers(self, event: str) -> Tuple[str, Tuple[CoroFunc, ...]]:
+        try:
+            return self._dispatch_table[event]
+        except KeyError:
+            pass
+
+        method = "on_" + event
+        handlers = tuple(self.extra_events.get(method, ()))
+        coro = getattr(self, method, None)
+        if coro is not None:
+            handlers = (coro, *handlers)
+
+        entry = self._dispatch_table[event] = (method, handlers)
+        return entry
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug("Dispatching event %s", event)
-        method = "on_" + event
+        method, handlers = self._get_event_handlers(event)
 
         listeners = self._listeners.get(event)
         if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
-                    continue
+            _resolve_listeners(listeners, args)
+            if not listeners:
+                self._listeners.pop(event)
 
+        keyed = self._keyed_listeners.get(event)
+        if keyed and args:
+            for getter, buckets in tuple(keyed.values()):
                 try:
-                    result = condition(*args)
-                except Exception as exc:
-                    future.set_exception(exc)
-                    removed.append(i)
-                else:
-                    if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
-
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+                    listeners = buckets.get(getter(args[0]))
+                except (AttributeError, TypeError):
+                    # The attribute is missing or its value can't be hashed.
+                    continue
 
-        try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
-            self._schedule_event(coro, method, *args, **kwargs)
+                if listeners:
+                    _resolve_listeners(listeners, args)
 
-        for coro in self.extra_events.get(method, []):
-            self._schedule_event(coro, method, *args, **kwargs)
+        executor = self._event_executor
+        for coro in handlers:
+            if executor is None:
+                self._schedule_event(coro, method, *args, **kwargs)
+            else:
+                executor.submit(
+                    event, functools.partial(self._run_event, coro, method, *args, **kwargs)
+                )
+
+    def _has_listener(self, event: str) -> bool:
+        # Lets the state skip work, such as copying objects, that only listeners would see.
+        return bool(
+            self._listeners.get(event)
+            or self._keyed_listeners.get(event)
+            or self._get_event_handlers(event)[1]
+        )
 
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
         """|coro|
@@ -695,6 +1013,15 @@ class Client:
 
         self._connection.user = ClientUser(state=self._connection, data=data)
 
+        if (
+            self._event_profiler is not None
+            and self._event_stats_interval is not None
+            and self._event_stats_task is None
+        ):
+            self._event_stats_task = asyncio.create_task(
+                self._dispatch_event_stats(self._event_stats_interval)
+            )
+
     async def connect(self, *, reconnect: bool = True) -> None:
         """|coro|
 
@@ -725,6 +1052,10 @@ class Client:
             "initial": True,
             "shard_id": self.shard_id,
         }
+        session = self._snapshot_sessions.pop(self.shard_id, None)
+        if session is not None:
+            session_id, sequence, resume_url = session
+            ws_params.update(sequence=sequence, gateway=resume_url, resume=True, session=session_id)
         while not self.is_closed():
             try:
                 coro = DiscordWebSocket.from_client(self, format_gateway=True, **ws_params)
@@ -826,11 +1157,107 @@ class Client:
                 await voice.disconnect(force=True)
 
         if self.ws is not None and self.ws.open:  # pyright: ignore
-            await self.ws.close(code=1000)
+            # Closing with 1000 ends the session, any other code lets it be resumed.
+            await self.ws.close(code=4000 if self._keep_session else 1000)
+
+        if self._event_stats_task is not None:
+            self._event_stats_task.cancel()
+            self._event_stats_task = None
 
         await self.http.close()
         self._ready.clear()
 
+    def _get_sessions(self) -> snapshot.Sessions:
+        ws = self.ws
+        if not ws or ws.session_id is None:
+            return {}
+        return {self.shard_id: (ws.session_id, ws.sequence, ws.resume_url)}  # type: ignore
+
+    async def save_snapshot(self, path: str) -> None:
+        """|coro|
+
+        Closes the client, then saves its cache and gateway session to a file. Loading the
+        file with :meth:`load_snapshot` lets a new process resume the session with the cache
+        it had, instead of receiving every guild again and chunking them from scratch, such
+        as when restarting to deploy a new version.
+
+        The session is left open on Discord's side, but it can only be resumed for a short
+        while. Cached messages, views and modals are not saved.
+
+        .. warning::
+
+            Snapshots are pickled, so only load snapshots that you saved yourself.
+
+        .. versionadded:: 3.3
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the file to save the snapshot to.
+
+        Raises
+        ------
+        ClientException
+            The client has no gateway session to save.
+        """
+        if self.is_closed() or not self._get_sessions():
+            raise ClientException("The client has no gateway session to save")
+
+        self._keep_session = True
+        try:
+            await self.close()
+        finally:
+            self._keep_session = False
+
+        # Saved once closed, so that the session doesn't get past the saved cache.
+        snapshot.save(self._connection, self._get_sessions(), path)
+
+    def load_snapshot(self, path: str) -> None:
+        """Loads a snapshot saved with :meth:`save_snapshot` into the cache, for the next
+        connection to resume its gateway session.
+
+        Once resumed, Discord sends the events missed since the snapshot was saved, and
+        :func:`on_connect` and :func:`on_ready` are called like after connecting from
+        scratch. If the session can't be resumed anymore, the client connects from scratch
+        instead, replacing the cache.
+
+        This must be called before connecting.
+
+        .. versionadded:: 3.3
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the snapshot to load.
+
+        Raises
+        ------
+        ClientException
+            The client is already connected.
+        ValueError
+            The file is not a snapshot, or it was saved with a different shard count. The
+            cache is left untouched.
+        """
+        if self._get_sessions():
+            raise ClientException("Snapshots must be loaded before connecting")
+
+        data = snapshot.load(self._connection, path)
+        shard_count: Optional[int] = data["shard_count"]
+        sessions: snapshot.Sessions = data["sessions"]
+        if self.shard_count is not None and shard_count != self.shard_count:
+            raise ValueError(
+                f"The snapshot was saved with {shard_count} shards instead of {self.shard_count}"
+            )
+        if shard_count is not None and any(
+            shard_id is not None and not 0 <= shard_id < shard_count for shard_id in sessions
+        ):
+            raise ValueError(f"The snapshot has sessions for shards past its {shard_count} shards")
+
+        snapshot.restore(self._connection, data)
+        self.shard_count = self._connection.shard_count = shard_count
+        self._snapshot_sessions = sessions
+        self._connection._restored_shards = set(sessions)
+
     async def clear(self) -> None:
         """Clears the internal state of the bot.
 
@@ -1178,6 +1605,7 @@ class Client:
         *,
         check: Optional[Callable[..., bool]] = None,
         timeout: Optional[float] = None,
+        key: Optional[Tuple[str, Any]] = None,
     ) -> Any:
         """|coro|
 
@@ -1234,6 +1662,10 @@ class Client:
                     else:
                         await channel.send('\N{THUMBS UP SIGN}')
 
+        Waiting for the next message in a channel, without checking every other message: ::
+
+            msg = await client.wait_for('message', key=('channel.id', channel.id))
+
 
         Parameters
         ----------
@@ -1246,6 +1678,13 @@ class Client:
         timeout: Optional[:class:`float`]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        key: Optional[Tuple[:class:`str`, Any]]
+            An attribute of the first argument of the event, which can be dotted such as
+            ``"channel.id"``, and the value it must be equal to. The ``check`` is only called
+            for events with that value, so that many calls waiting for the same event with
+            different values, such as one per channel, don't slow down every event.
+
+            .. versionadded:: 3.3
 
         Raises
         ------
@@ -1269,6 +1708,23 @@ class Client:
             check = _check
 
         ev = event.lower()
+        if key is not None:
+            attribute, value = key
+            keyed = self._keyed_listeners.setdefault(ev, {})
+            try:
+                _, buckets = keyed[attribute]
+            except KeyError:
+                buckets = {}
+                keyed[attribute] = (operator.attrgetter(attribute), buckets)
+
+            entry = (future, check)
+            buckets.setdefault(value, []).append(entry)
+            # Listeners waiting for a value that never comes are removed once they time out.
+            future.add_done_callback(
+                lambda _: self._remove_keyed_listener(ev, attribute, value, entry)
+            )
+            return asyncio.wait_for(future, timeout)
+
         try:
             listeners = self._listeners[ev]
         except KeyError:
@@ -1278,6 +1734,28 @@ class Client:
         listeners.append((future, check))
         return asyncio.wait_for(future, timeout)
 
+    def _remove_keyed_listener(
+        self, event: str, attribute: str, value: Any, entry: _Listener
+    ) -> None:
+        keyed = self._keyed_listeners.get(event)
+        if keyed is None or attribute not in keyed:
+            return
+
+        buckets = keyed[attribute][1]
+        listeners = buckets.get(value)
+        if listeners is None:
+            return
+
+        with contextlib.suppress(ValueError):
+            listeners.remove(entry)
+
+        if not listeners:
+            del buckets[value]
+            if not buckets:
+                del keyed[attribute]
+                if not keyed:
+                    del self._keyed_listeners[event]
+
     # event/listener registration
 
     def event(self, coro: Coro) -> Coro:
@@ -1287,6 +1765,12 @@ class Client:
 
         The events must be a :ref:`coroutine <coroutine>`, if not, :exc:`TypeError` is raised.
 
+        .. note::
+
+            Events assigned to the client directly, such as ``client.on_ready = on_ready``,
+            are not picked up once the event has been dispatched, unless
+            ``client._dispatch_table`` is cleared afterwards. Use this decorator instead.
+
         Example
         -------
 
@@ -1306,10 +1790,17 @@ class Client:
             raise TypeError("event registered must be a coroutine function")
 
         setattr(self, coro.__name__, coro)
+        self._dispatch_table.clear()
         _log.debug("%s has successfully been registered as an event", coro.__name__)
         return coro
 
-    def add_listener(self, func: CoroFunc, name: str = MISSING) -> None:
+    def add_listener(
+        self,
+        func: CoroFunc,
+        name: str = MISSING,
+        *,
+        ordered_by: Optional[Callable[..., Hashable]] = None,
+    ) -> None:
         """The non decorator alternative to :meth:`.listen`.
 
         .. versionadded:: 3.0
@@ -1320,6 +1811,17 @@ class Client:
             The function to call.
         name: :class:`str`
             The name of the event to listen for. Defaults to ``func.__name__``.
+        ordered_by: Optional[Callable[..., Hashable]]
+            A function that takes the arguments of the event and returns a key, such as
+            ``lambda message: message.channel.id``. The listener then runs for one event
+            at a time per key, in the order the events were dispatched in, while events
+            with different keys are still handled concurrently. Defaults to ``None``,
+            running the listener for every event as soon as it is dispatched.
+
+            With an :class:`EventExecutor`, events dropped by a full lane are skipped, and
+            the events waiting for their key don't count towards the queue of the lane.
+
+            .. versionadded:: 3.3
 
         Example
         -------
@@ -1338,10 +1840,14 @@ class Client:
         if not inspect.iscoroutinefunction(func):
             raise TypeError("Listeners must be coroutines")
 
+        if ordered_by is not None:
+            func = _OrderedListener(self, func, name, ordered_by)
+
         if name in self.extra_events:
             self.extra_events[name].append(func)
         else:
             self.extra_events[name] = [func]
+        self._dispatch_table.clear()
 
     def remove_listener(self, func: CoroFunc, name: str = MISSING) -> None:
         """Removes a listener from the pool of listeners.
@@ -1362,8 +1868,11 @@ class Client:
         if name in self.extra_events:
             with contextlib.suppress(ValueError):
                 self.extra_events[name].remove(func)
+            self._dispatch_table.clear()
 
-    def listen(self, name: str = MISSING) -> Callable[[Coro], Coro]:
+    def listen(
+        self, name: str = MISSING, *, ordered_by: Optional[Callable[..., Hashable]] = None
+    ) -> Callable[[Coro], Coro]:
         """A decorator that registers another function as an external
         event listener. Basically this allows you to listen to multiple
         events from different places e.g. such as :func:`.on_ready`
@@ -1389,6 +1898,22 @@ class Client:
 
         Would print one and two in an unspecified order.
 
+        Handling the messages of each channel one at a time, in order: ::
+
+            @client.listen('on_message', ordered_by=lambda message: message.channel.id)
+            async def log_message(message):
+                await database.append(message.channel.id, message.content)
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event to listen for. Defaults to the function's name.
+        ordered_by: Optional[Callable[..., Hashable]]
+            A function that takes the arguments of the event and returns a key, so that
+            the listener runs for one event at a time per key. See :meth:`add_listener`.
+
+            .. versionadded:: 3.3
+
         Raises
         ------
         TypeError
@@ -1396,7 +1921,7 @@ class Client:
         """
 
         def decorator(func: Coro) -> Coro:
-            self.add_listener(func, name)
+            self.add_listener(func, name, ordered_by=ordered_by)
             return func
 
         return decorator
@@ -2003,6 +2528,66 @@ class Client:
         data = await state.http.start_private_message(user.id)
         return state.add_dm_channel(data)
 
+    def bulk(
+        self,
+        requests: Iterable[BatchRequest],
+        *,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Makes many requests concurrently, yielding the outcome of each as it finishes.
+
+        Requests given as a route and the keyword arguments to send it with are grouped by rate
+        limit bucket, sending as many requests to each bucket at once as its rate limit allows
+        while different buckets are worked on concurrently. This is much faster than awaiting the
+        requests one by one, without piling up thousands of requests like :func:`asyncio.gather`
+        would. Awaitables, such as :meth:`Member.add_roles`, are only bounded by
+        ``max_concurrency``.
+
+        Exceptions are yielded rather than raised, and breaking out of the loop cancels the
+        requests that are still running.
+
+        .. versionadded:: 3.3
+
+        Examples
+        --------
+
+        Giving every member of a guild a role: ::
+
+            from nextcord.http import Route
+
+            requests = (
+                (
+                    Route(
+                        "PUT",
+                        "/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
+                        guild_id=guild.id,
+                        user_id=member.id,
+                        role_id=role.id,
+                    ),
+                    {"reason": "Migration"},
+                )
+                for member in guild.members
+            )
+            async for result in client.bulk(requests):
+                if result.exception is not None:
+                    print(f"Request {result.index} failed: {result.exception}")
+
+        Parameters
+        ----------
+        requests: Iterable[Union[Awaitable, Tuple[:class:`~nextcord.http.Route`, Dict[:class:`str`, Any]]]]
+            The requests to make. This is consumed lazily, so it can be a generator.
+        max_concurrency: Optional[:class:`int`]
+            The maximum amount of requests running at once. Defaults to the global rate limit
+            of 50 requests per second.
+
+        Yields
+        ------
+        :class:`~typing.NamedTuple`
+            The ``index`` of the request in ``requests``, its ``result``, and the ``exception``
+            it raised, if any.
+        """
+        return self.http.batch(requests, max_concurrency=max_concurrency)
+
     def add_view(self, view: View, *, message_id: Optional[int] = None) -> None:
         """Registers a :class:`~nextcord.ui.View` for persistent listening or for non-
         persistent storage.
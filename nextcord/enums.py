@@ -55,6 +55,8 @@ __all__ = (
     "MessageReferenceType",
     "SelectDefaultValueType",
     "SeparatorSpacingSize",
+    "RequestPriority",
+    "OverflowPolicy",
 )
 
 
@@ -2135,6 +2137,41 @@ class SeparatorSpacingSize(IntEnum):
     large = 2
 
 
+class RequestPriority(IntEnum):
+    """Represents the priority that an HTTP request waits for rate limits with.
+
+    When requests are waiting on the same rate limit, requests with a higher priority
+    are let through first. Requests made with interaction tokens default to
+    :attr:`interaction`, every other request defaults to :attr:`user`.
+
+    .. versionadded:: 3.3
+    """
+
+    interaction = 0
+    """The request is responding to an interaction and is latency critical."""
+    user = 1
+    """The request is user facing, such as sending a message."""
+    background = 2
+    """The request is part of background maintenance, such as a bulk role update."""
+
+
+class OverflowPolicy(StrEnum):
+    """Specifies what an :class:`EventLane` does with an event once its queue is full.
+
+    .. versionadded:: 3.3
+    """
+
+    drop_oldest = "drop_oldest"
+    """The oldest queued event is dropped to make room for the new one."""
+    drop_newest = "drop_newest"
+    """The new event is dropped."""
+    block = "block"
+    """The new event is queued anyway, and the gateway stops reading events until the
+    queue has room again. Heartbeats are still sent while blocked, but a queue that stays
+    full for too long can make the gateway connection time out.
+    """
+
+
 T = TypeVar("T")
 
 
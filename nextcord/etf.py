@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, Callable, ClassVar, Dict, List
+
+from .errors import DiscordException
+
+__all__ = (
+    "ETFError",
+    "dumps",
+    "loads",
+)
+
+
+class ETFError(DiscordException):
+    """An exception that is thrown for Erlang External Term Format encoding and decoding errors."""
+
+
+# https://www.erlang.org/doc/apps/erts/erl_ext_dist.html
+# https://discord.com/developers/docs/topics/gateway#etf-erlang-term-format
+
+_FORMAT_VERSION = 131
+
+_NEW_FLOAT_EXT = 70
+_COMPRESSED = 80
+_SMALL_INTEGER_EXT = 97
+_INTEGER_EXT = 98
+_FLOAT_EXT = 99
+_ATOM_EXT = 100
+_SMALL_TUPLE_EXT = 104
+_LARGE_TUPLE_EXT = 105
+_NIL_EXT = 106
+_STRING_EXT = 107
+_LIST_EXT = 108
+_BINARY_EXT = 109
+_SMALL_BIG_EXT = 110
+_LARGE_BIG_EXT = 111
+_SMALL_ATOM_EXT = 115
+_MAP_EXT = 116
+_ATOM_UTF8_EXT = 118
+_SMALL_ATOM_UTF8_EXT = 119
+
+_u8 = struct.Struct(">B")
+_u16 = struct.Struct(">H")
+_u32 = struct.Struct(">I")
+_i32 = struct.Struct(">i")
+_f64 = struct.Struct(">d")
+
+_ATOMS: Dict[str, Any] = {"nil": None, "true": True, "false": False}
+
+
+def _is_big(value: Any) -> bool:
+    return type(value) is int and not -0x80000000 <= value <= 0x7FFFFFFF
+
+
+class _Decoder:
+    # Terms are decoded into the same shapes that the JSON gateway sends, so that
+    # ConnectionState parsers don't need to care about the transport encoding:
+    # atoms and binaries become str, ``nil`` becomes None, map keys become str
+    # and snowflakes become str. Integers that don't fit into 32 bits are only
+    # snowflakes under ID keys and in lists, as the millisecond timestamps of
+    # activities are big integers too and the JSON gateway sends those as int.
+
+    __slots__ = ("data", "offset")
+
+    _dispatch: ClassVar[Dict[int, Callable[[_Decoder], Any]]]
+
+    def __init__(self, data: bytes) -> None:
+        self.data: memoryview = memoryview(data)
+        self.offset: int = 0
+
+    def _read(self, size: int) -> memoryview:
+        start = self.offset
+        end = start + size
+        if end > len(self.data):
+            raise ETFError("unexpected end of data")
+        self.offset = end
+        return self.data[start:end]
+
+    def _unpack(self, fmt: struct.Struct) -> Any:
+        value = fmt.unpack_from(self.data, self.offset)[0]
+        self.offset += fmt.size
+        return value
+
+    def decode(self) -> Any:
+        tag = self._unpack(_u8)
+        try:
+            func = self._dispatch[tag]
+        except KeyError:
+            raise ETFError(f"unsupported term tag {tag}") from None
+        return func(self)
+
+    def _small_integer(self) -> int:
+        return self._unpack(_u8)
+
+    def _integer(self) -> int:
+        return self._unpack(_i32)
+
+    def _new_float(self) -> float:
+        return self._unpack(_f64)
+
+    def _float(self) -> float:
+        return float(bytes(self._read(31)).rstrip(b"\x00"))
+
+    def _atom_value(self, size: int) -> Any:
+        name = str(self._read(size), "utf-8")
+        return _ATOMS.get(name, name)
+
+    def _atom(self) -> Any:
+        return self._atom_value(self._unpack(_u16))
+
+    def _small_atom(self) -> Any:
+        return self._atom_value(self._unpack(_u8))
+
+    def _small_tuple(self) -> List[Any]:
+        return [self.decode() for _ in range(self._unpack(_u8))]
+
+    def _large_tuple(self) -> List[Any]:
+        return [self.decode() for _ in range(self._unpack(_u32))]
+
+    def _nil(self) -> List[Any]:
+        return []
+
+    def _string(self) -> List[int]:
+        # STRING_EXT is how Erlang packs a list of small integers
+        return list(self._read(self._unpack(_u16)))
+
+    def _list(self) -> List[Any]:
+        length = self._unpack(_u32)
+        decode = self.decode
+        ret = [decode() for _ in range(length)]
+        for index, value in enumerate(ret):
+            if _is_big(value):
+                ret[index] = str(value)
+        # proper lists are terminated by NIL_EXT
+        tail = decode()
+        if tail != []:
+            raise ETFError("improper lists are not supported")
+        return ret
+
+    def _binary(self) -> str:
+        return str(self._read(self._unpack(_u32)), "utf-8")
+
+    def _big(self, size: int) -> int:
+        sign = self._unpack(_u8)
+        value = int.from_bytes(self._read(size), "little")
+        return -value if sign else value
+
+    def _small_big(self) -> int:
+        return self._big(self._unpack(_u8))
+
+    def _large_big(self) -> int:
+        return self._big(self._unpack(_u32))
+
+    def _map(self) -> Dict[Any, Any]:
+        decode = self.decode
+        ret = {}
+        for _ in range(self._unpack(_u32)):
+            key = decode()
+            value = decode()
+            if type(key) is not str:
+                # JSON objects, such as the resolved data of interactions, are keyed by str.
+                key = str(key)
+            elif _is_big(value) and (key == "id" or key.endswith("_id")):
+                value = str(value)
+            ret[key] = value
+        return ret
+
+
+# Built once rather than for every payload.
+_Decoder._dispatch = {
+    _SMALL_INTEGER_EXT: _Decoder._small_integer,
+    _INTEGER_EXT: _Decoder._integer,
+    _NEW_FLOAT_EXT: _Decoder._new_float,
+    _FLOAT_EXT: _Decoder._float,
+    _ATOM_EXT: _Decoder._atom,
+    _ATOM_UTF8_EXT: _Decoder._atom,
+    _SMALL_ATOM_EXT: _Decoder._small_atom,
+    _SMALL_ATOM_UTF8_EXT: _Decoder._small_atom,
+    _SMALL_TUPLE_EXT: _Decoder._small_tuple,
+    _LARGE_TUPLE_EXT: _Decoder._large_tuple,
+    _NIL_EXT: _Decoder._nil,
+    _STRING_EXT: _Decoder._string,
+    _LIST_EXT: _Decoder._list,
+    _BINARY_EXT: _Decoder._binary,
+    _SMALL_BIG_EXT: _Decoder._small_big,
+    _LARGE_BIG_EXT: _Decoder._large_big,
+    _MAP_EXT: _Decoder._map,
+}
+
+
+def loads(data: bytes) -> Any:
+    """Decodes an Erlang External Term Format payload into JSON-compatible objects.
+
+    Raises
+    ------
+    ETFError
+        The payload is malformed or uses an unsupported term.
+    """
+    if len(data) < 2 or data[0] != _FORMAT_VERSION:
+        raise ETFError("bad format version")
+
+    if data[1] == _COMPRESSED:
+        (size,) = _u32.unpack_from(data, 2)
+        data = bytes([_FORMAT_VERSION]) + zlib.decompress(data[6:], bufsize=size)
+
+    decoder = _Decoder(data)
+    decoder.offset = 1
+    try:
+        return decoder.decode()
+    except struct.error:
+        raise ETFError("unexpected end of data") from None
+
+
+def _encode_int(value: int, out: List[bytes]) -> None:
+    if 0 <= value <= 255:
+        out.append(bytes((_SMALL_INTEGER_EXT, value)))
+    elif -(2**31) <= value < 2**31:
+        out.append(bytes((_INTEGER_EXT,)) + _i32.pack(value))
+    else:
+        sign = value < 0
+        value = abs(value)
+        digits = value.to_bytes((value.bit_length() + 7) // 8, "little")
+        if len(digits) > 255:
+            raise ETFError("integer is too large to encode")
+        out.append(bytes((_SMALL_BIG_EXT, len(digits), sign)) + digits)
+
+
+def _encode(obj: Any, out: List[bytes]) -> None:
+    if obj is None:
+        out.append(b"\x77\x03nil")
+    elif obj is True:
+        out.append(b"\x77\x04true")
+    elif obj is False:
+        out.append(b"\x77\x05false")
+    elif isinstance(obj, int):
+        _encode_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(bytes((_NEW_FLOAT_EXT,)) + _f64.pack(obj))
+    elif isinstance(obj, str):
+        encoded = obj.encode("utf-8")
+        out.append(bytes((_BINARY_EXT,)) + _u32.pack(len(encoded)))
+        out.append(encoded)
+    elif isinstance(obj, dict):
+        out.append(bytes((_MAP_EXT,)) + _u32.pack(len(obj)))
+        for key, value in obj.items():
+            _encode(key, out)
+            _encode(value, out)
+    elif isinstance(obj, (list, tuple)):
+        if obj:
+            out.append(bytes((_LIST_EXT,)) + _u32.pack(len(obj)))
+            for item in obj:
+                _encode(item, out)
+        out.append(bytes((_NIL_EXT,)))
+    else:
+        raise ETFError(f"cannot encode object of type {obj.__class__.__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes JSON-compatible objects into an Erlang External Term Format payload.
+
+    Raises
+    ------
+    ETFError
+        The object contains a value that cannot be encoded.
+    """
+    out: List[bytes] = [bytes((_FORMAT_VERSION,))]
+    _encode(obj, out)
+    return b"".join(out)
@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from .enums import OverflowPolicy
+from .http import _LatencyHistogram
+
+__all__ = (
+    "EventExecutor",
+    "EventLane",
+)
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class EventLane:
+    """A bounded pool of workers running the event handlers of some events, used by an
+    :class:`EventExecutor`.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    events: Iterable[:class:`str`]
+        The events whose handlers run in this lane, without the ``on_`` prefix, for example
+        ``"message"``. Ignored for the default lane of an executor, which runs every other
+        event.
+    workers: :class:`int`
+        The maximum amount of event handlers running at the same time.
+    max_queue: :class:`int`
+        The maximum amount of event handlers waiting for a worker. Each handler of an event
+        is queued separately. Must be at least 1 to block.
+    overflow: :class:`OverflowPolicy`
+        What to do with handlers once the queue is full.
+    """
+
+    def __init__(
+        self,
+        *,
+        events: Iterable[str] = (),
+        workers: int = 16,
+        max_queue: int = 10000,
+        overflow: OverflowPolicy = OverflowPolicy.drop_oldest,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue cannot be negative")
+        if max_queue == 0 and overflow is OverflowPolicy.block:
+            raise ValueError("max_queue must be at least 1 to block")
+
+        self.events: Tuple[str, ...] = tuple(events)
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.overflow: OverflowPolicy = overflow
+
+        self._queue: Deque[Tuple[float, Job]] = deque()
+        self._running: int = 0
+        self._busy: int = 0
+        """The amount of workers running a handler, the others are about to take one."""
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._max_depth: int = 0
+        self._processed: int = 0
+        self._dropped: int = 0
+        self._wait: _LatencyHistogram = _LatencyHistogram()
+        self._latency: _LatencyHistogram = _LatencyHistogram()
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventLane events={self.events!r} workers={self.workers} "
+            f"max_queue={self.max_queue} overflow={self.overflow}>"
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """:class:`int`: The amount of event handlers waiting for a worker."""
+        return len(self._queue)
+
+    def _is_full(self) -> bool:
+        # Handlers about to be taken by an idle or starting worker don't count as queued.
+        return len(self._queue) >= self.max_queue + self.workers - self._busy
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self._max_depth,
+            "processed": self._processed,
+            "dropped": self._dropped,
+            "wait": self._wait.to_dict(),
+            "latency": self._latency.to_dict(),
+        }
+
+
+class EventExecutor:
+    """Runs event handlers on bounded pools of workers instead of starting a task for
+    every handler of every event, so that bursts of events, such as during a raid, queue
+    up or get dropped instead of piling up tasks until the bot runs out of memory.
+
+    Pass the executor to a client with the ``event_executor`` parameter. Listeners waiting
+    with :meth:`Client.wait_for` are not affected by the executor.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    lanes: Mapping[:class:`str`, :class:`EventLane`]
+        Lanes for specific events, keyed by a name used in :meth:`stats`.
+    default: Optional[:class:`EventLane`]
+        The lane for events that aren't in any other lane. Defaults to an :class:`EventLane`
+        with its default settings.
+
+    Raises
+    ------
+    ValueError
+        An event is in more than one lane, or a lane is named ``"default"``.
+    """
+
+    def __init__(
+        self,
+        lanes: Optional[Mapping[str, EventLane]] = None,
+        *,
+        default: Optional[EventLane] = None,
+    ) -> None:
+        lanes = lanes or {}
+        if "default" in lanes:
+            raise ValueError('"default" is reserved for the default lane')
+
+        self.default: EventLane = EventLane() if default is None else default
+        self.lanes: Dict[str, EventLane] = {**lanes, "default": self.default}
+        self._event_lanes: Dict[str, EventLane] = {}
+        for lane in lanes.values():
+            for event in lane.events:
+                if event in self._event_lanes:
+                    raise ValueError(f"The {event!r} event is in more than one lane")
+                self._event_lanes[event] = lane
+
+        self._full: Set[EventLane] = set()
+        """The lanes blocking the gateway until their queue has room."""
+        self._room: Optional[asyncio.Future[None]] = None
+
+    def __repr__(self) -> str:
+        return f"<EventExecutor lanes={self.lanes!r}>"
+
+    def submit(self, event: str, job: Job) -> None:
+        """Queues a handler of an event to run once a worker of its lane is free. This is
+        called by :meth:`Client.dispatch`.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event, without the ``on_`` prefix.
+        job: Callable[[], Awaitable[Any]]
+            A function returning the awaitable that runs the handler.
+        """
+        lane = self._event_lanes.get(event, self.default)
+        queue = lane._queue
+        if lane._is_full():
+            if lane.overflow is OverflowPolicy.block:
+                self._full.add(lane)
+            elif lane.overflow is OverflowPolicy.drop_newest or not queue:
+                lane._dropped += 1
+                return
+            else:
+                queue.popleft()
+                lane._dropped += 1
+
+        queue.append((time.perf_counter(), job))
+        lane._max_depth = max(lane._max_depth, len(queue))
+        if lane._running < lane.workers:
+            lane._running += 1
+            task = asyncio.create_task(self._work(lane), name="nextcord: event executor")
+            lane._tasks.add(task)
+            task.add_done_callback(lane._tasks.discard)
+
+    async def _work(self, lane: EventLane) -> None:
+        queue = lane._queue
+        try:
+            while queue:
+                queued_at, job = queue.popleft()
+                lane._busy += 1
+                if lane in self._full and not lane._is_full():
+                    self._full.discard(lane)
+                    if not self._full and self._room is not None:
+                        self._room.set_result(None)
+                        self._room = None
+
+                start = time.perf_counter()
+                lane._wait.observe(start - queued_at)
+                try:
+                    await job()
+                finally:
+                    lane._busy -= 1
+                lane._latency.observe(time.perf_counter() - start)
+                lane._processed += 1
+        finally:
+            lane._running -= 1
+
+    @property
+    def blocked(self) -> bool:
+        """:class:`bool`: Whether a lane with the :attr:`OverflowPolicy.block` policy is
+        full, blocking the gateway.
+        """
+        return bool(self._full)
+
+    async def wait_for_room(self) -> None:
+        """|coro|
+
+        Waits until no lane is blocking the gateway. This is called by the gateway before
+        reading each event.
+        """
+        while self._full:
+            if self._room is None:
+                self._room = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self._room)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the metrics of each lane, keyed by lane name.
+
+        Each lane has the amount of handlers ``running`` and queued (``queue_depth``), the
+        highest queue depth reached, and the amount of handlers ``processed`` and
+        ``dropped``. ``wait`` and ``latency`` are histograms of the seconds handlers spent
+        queued and running, with the count, sum and max, and the amount of values in each
+        bucket keyed by its upper bound.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            The snapshot, which is not updated by later events.
+        """
+        return {name: lane.to_dict() for name, lane in self.lanes.items()}
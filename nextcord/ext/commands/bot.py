@@ -20,12 +20,14 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -46,10 +48,17 @@ if TYPE_CHECKING:
     import aiohttp
 
     from nextcord.activity import BaseActivity
+    from nextcord.cache import CacheBackend
     from nextcord.enums import Status
+    from nextcord.executor import EventExecutor
     from nextcord.flags import MemberCacheFlags
+    from nextcord.gateway import GatewayCompression, GatewayEncoding
+    from nextcord.guild import Guild
     from nextcord.mentions import AllowedMentions
     from nextcord.message import Message
+    from nextcord.ratelimits import RateLimitStore
+    from nextcord.replay import GatewayRecorder
+    from nextcord.response_cache import ResponseCache
 
     from ._types import Check, CoroFunc
 
@@ -142,6 +151,7 @@ _NonCallablePrefix = Union[str, Sequence[str]]
 
 class BotBase(GroupMixin):
     extra_events: Dict[str, List[CoroFunc]]
+    _dispatch_table: Dict[str, Tuple[str, Tuple[CoroFunc, ...]]]
 
     def __init__(
         self,
@@ -476,8 +486,14 @@ class BotBase(GroupMixin):
     # listener registration
 
     @nextcord.utils.copy_doc(nextcord.Client.add_listener)
-    def add_listener(self, func: CoroFunc, name: str = MISSING) -> None:
-        super().add_listener(func, name)  # type: ignore
+    def add_listener(
+        self,
+        func: CoroFunc,
+        name: str = MISSING,
+        *,
+        ordered_by: Optional[Callable[..., Hashable]] = None,
+    ) -> None:
+        super().add_listener(func, name, ordered_by=ordered_by)  # type: ignore
 
     @nextcord.utils.copy_doc(nextcord.Client.remove_listener)
     def remove_listener(self, func: CoroFunc, name: str = MISSING) -> None:
@@ -620,6 +636,7 @@ class BotBase(GroupMixin):
 
             for index in reversed(remove):
                 del event_list[index]
+        self._dispatch_table.clear()
 
     def _call_module_finalizers(self, lib: types.ModuleType, key: str) -> None:
         try:
@@ -1436,7 +1453,7 @@ class Bot(BotBase, nextcord.Client):
         .. versionadded:: 1.7
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         command_prefix: Union[
             _NonCallablePrefix,
@@ -1473,6 +1490,19 @@ class Bot(BotBase, nextcord.Client):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        gateway_encoding: GatewayEncoding = "json",
+        gateway_compression: Optional[GatewayCompression] = "zlib-stream",
+        ignored_events: Optional[Iterable[str]] = None,
+        ratelimit_store: Optional[RateLimitStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        lazy_message_fields: bool = False,
+        chunk_concurrency: int = 10,
+        chunk_priority: Optional[Callable[[Guild], Any]] = None,
+        gateway_recorder: Optional[GatewayRecorder] = None,
+        profile_events: bool = False,
+        event_stats_interval: Optional[float] = None,
+        event_executor: Optional[EventExecutor] = None,
         owner_id: Optional[int] = None,
         owner_ids: Optional[Iterable[int]] = None,
         strip_after_prefix: bool = False,
@@ -1505,6 +1535,19 @@ class Bot(BotBase, nextcord.Client):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            gateway_encoding=gateway_encoding,
+            gateway_compression=gateway_compression,
+            ignored_events=ignored_events,
+            ratelimit_store=ratelimit_store,
+            response_cache=response_cache,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
+            gateway_recorder=gateway_recorder,
+            profile_events=profile_events,
+            event_stats_interval=event_stats_interval,
+            event_executor=event_executor,
         )
 
         BotBase.__init__(
@@ -1524,7 +1567,7 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
     :class:`nextcord.AutoShardedClient` instead.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         command_prefix: Union[
             _NonCallablePrefix,
@@ -1562,6 +1605,19 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        gateway_encoding: GatewayEncoding = "json",
+        gateway_compression: Optional[GatewayCompression] = "zlib-stream",
+        ignored_events: Optional[Iterable[str]] = None,
+        ratelimit_store: Optional[RateLimitStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        lazy_message_fields: bool = False,
+        chunk_concurrency: int = 10,
+        chunk_priority: Optional[Callable[[Guild], Any]] = None,
+        gateway_recorder: Optional[GatewayRecorder] = None,
+        profile_events: bool = False,
+        event_stats_interval: Optional[float] = None,
+        event_executor: Optional[EventExecutor] = None,
         owner_id: Optional[int] = None,
         owner_ids: Optional[Iterable[int]] = None,
         strip_after_prefix: bool = False,
@@ -1595,6 +1651,19 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            gateway_encoding=gateway_encoding,
+            gateway_compression=gateway_compression,
+            ignored_events=ignored_events,
+            ratelimit_store=ratelimit_store,
+            response_cache=response_cache,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
+            gateway_recorder=gateway_recorder,
+            profile_events=profile_events,
+            event_stats_interval=event_stats_interval,
+            event_executor=event_executor,
         )
 
         BotBase.__init__(
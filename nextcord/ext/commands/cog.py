@@ -4,7 +4,19 @@ from __future__ import annotations
 
 import contextlib
 import inspect
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generator, List, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generator,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import nextcord.utils
 from nextcord.application_command import ClientCog, _cog_special_method
@@ -254,7 +266,9 @@ class Cog(ClientCog, metaclass=CogMeta):
         return [(name, getattr(self, method_name)) for name, method_name in self.__cog_listeners__]
 
     @classmethod
-    def listener(cls, name: str = MISSING) -> Callable[[FuncT], FuncT]:
+    def listener(
+        cls, name: str = MISSING, *, ordered_by: Optional[Callable[..., Hashable]] = None
+    ) -> Callable[[FuncT], FuncT]:
         """A decorator that marks a function as a listener.
 
         This is the cog equivalent of :meth:`.Bot.listen`.
@@ -264,6 +278,12 @@ class Cog(ClientCog, metaclass=CogMeta):
         name: :class:`str`
             The name of the event being listened to. If not provided, it
             defaults to the function's name.
+        ordered_by: Optional[Callable[..., Hashable]]
+            A function that takes the arguments of the event and returns a key, so that
+            the listener runs for one event at a time per key. See
+            :meth:`.Bot.add_listener`.
+
+            .. versionadded:: 3.3
 
         Raises
         ------
@@ -284,6 +304,7 @@ class Cog(ClientCog, metaclass=CogMeta):
             if not inspect.iscoroutinefunction(actual):
                 raise TypeError("Listener function must be a coroutine function.")
             actual.__cog_listener__ = True
+            actual.__cog_listener_ordered_by__ = ordered_by
             to_assign = name or actual.__name__
             try:
                 actual.__cog_listener_names__.append(to_assign)
@@ -425,7 +446,10 @@ class Cog(ClientCog, metaclass=CogMeta):
         # already, thus this should never raise.
         # Outside of, memory errors and the like...
         for name, method_name in self.__cog_listeners__:
-            bot.add_listener(getattr(self, method_name), name)
+            method = getattr(self, method_name)
+            bot.add_listener(
+                method, name, ordered_by=getattr(method, "__cog_listener_ordered_by__", None)
+            )
 
         return self
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import logging
+import re
 import struct
 import sys
 import threading
@@ -12,11 +13,25 @@ import time
 import traceback
 import zlib
 from collections import deque, namedtuple
-from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 
 import aiohttp
 
-from . import utils
+from . import etf, utils
 from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
@@ -25,6 +40,8 @@ if TYPE_CHECKING:
     from typing import Any, Protocol
 
     from .client import Client
+    from .executor import EventExecutor
+    from .replay import GatewayRecorder
     from .state import ConnectionState
     from .types.activity import Activity
     from .types.voice import VoiceIdentify
@@ -33,6 +50,18 @@ if TYPE_CHECKING:
     class VariadicArgNone(Protocol):
         def __call__(self, *args: Any) -> None: ...
 
+    import zstandard
+
+
+has_zstd: bool
+
+try:
+    import zstandard
+
+    has_zstd = True
+except ImportError:
+    has_zstd = False
+
 
 _log = logging.getLogger(__name__)
 
@@ -60,6 +89,119 @@ class WebSocketClosure(Exception):
 
 EventListener = namedtuple("EventListener", "predicate event result future")  # type: ignore
 
+# Discord serialises dispatches as {"t":...,"s":...,"op":0,"d":...}, which lets the
+# event name and sequence be peeked at without parsing the whole payload.
+_DISPATCH_HEAD = re.compile(rb'\{"t":"([A-Z_]+)","s":(\d+),')
+
+# Events that the websocket itself relies on and thus can never be ignored.
+_UNIGNORABLE_EVENTS = frozenset(("READY", "RESUMED"))
+
+GatewayEncoding = Literal["json", "etf"]
+GatewayCompression = Literal["zlib-stream", "zstd-stream"]
+
+# Every complete zlib-stream payload is terminated by a Z_SYNC_FLUSH marker.
+_ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+class _JSONEncoding:
+    name: ClassVar[str] = "json"
+    loads: ClassVar[Callable[[Union[str, bytes]], Any]] = staticmethod(utils.from_json)
+    dumps: ClassVar[Callable[[Any], Union[str, bytes]]] = staticmethod(utils.to_json)
+
+
+class _ETFEncoding:
+    name: ClassVar[str] = "etf"
+    dumps: ClassVar[Callable[[Any], Union[str, bytes]]] = staticmethod(etf.dumps)
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        # Discord only sends ETF payloads in binary frames.
+        if isinstance(data, str):
+            raise etf.ETFError("ETF payloads must be binary")
+        return etf.loads(data)
+
+
+class _ZlibStreamInflator:
+    __slots__ = ("_zlib", "_buffer")
+
+    def __init__(self) -> None:
+        self._zlib = zlib.decompressobj()
+        self._buffer: bytearray = bytearray()
+
+    def decompress(self, data: bytes) -> Optional[bytes]:
+        buffer = self._buffer
+        if not data.endswith(_ZLIB_SUFFIX):
+            buffer.extend(data)
+            return None
+
+        if buffer:
+            buffer.extend(data)
+            data = self._zlib.decompress(buffer)
+            buffer.clear()
+            return data
+
+        # The common case: the whole payload arrived in a single frame,
+        # so it can be inflated without being copied into the buffer.
+        return self._zlib.decompress(data)
+
+
+class _ZstdStreamInflator:
+    __slots__ = ("_zstd",)
+
+    def __init__(self) -> None:
+        # The whole connection is a single zstd frame that Discord flushes at the
+        # end of every payload, so every message inflates to one complete payload.
+        self._zstd = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> Optional[bytes]:
+        return self._zstd.decompress(data)
+
+
+_GATEWAY_ENCODINGS: Dict[str, Union[Type[_JSONEncoding], Type[_ETFEncoding]]] = {
+    "json": _JSONEncoding,
+    "etf": _ETFEncoding,
+}
+
+_GATEWAY_COMPRESSIONS: Dict[
+    Optional[str], Optional[Union[Type[_ZlibStreamInflator], Type[_ZstdStreamInflator]]]
+] = {
+    None: None,
+    "zlib-stream": _ZlibStreamInflator,
+    "zstd-stream": _ZstdStreamInflator,
+}
+
+
+def _check_gateway_transport(encoding: str, compression: Optional[str]) -> None:
+    if encoding not in _GATEWAY_ENCODINGS:
+        raise InvalidArgument(
+            f"gateway_encoding must be one of {', '.join(map(repr, _GATEWAY_ENCODINGS))}, "
+            f"not {encoding!r}"
+        )
+
+    if compression not in _GATEWAY_COMPRESSIONS:
+        raise InvalidArgument(
+            "gateway_compression must be None or one of "
+            f"{', '.join(repr(c) for c in _GATEWAY_COMPRESSIONS if c)}, not {compression!r}"
+        )
+
+    if compression == "zstd-stream" and not has_zstd:
+        raise RuntimeError("zstandard library needed in order to use zstd-stream compression")
+
+
+def _resolve_ignored_events(events: Optional[Iterable[str]]) -> FrozenSet[str]:
+    if events is None:
+        return frozenset()
+
+    if isinstance(events, str):
+        raise InvalidArgument("ignored_events must be an iterable of event names, not a str")
+
+    ret = frozenset(event.upper() for event in events)
+    if not ret.isdisjoint(_UNIGNORABLE_EVENTS):
+        raise InvalidArgument(
+            f"ignored_events cannot contain {', '.join(sorted(ret & _UNIGNORABLE_EVENTS))}"
+        )
+    return ret
+
 
 class GatewayRatelimiter:
     def __init__(self, count: int = 110, per: float = 60.0) -> None:
@@ -95,6 +237,13 @@ class GatewayRatelimiter:
 
         return 0.0
 
+    def get_reserved_delay(self, reserved: int) -> float:
+        # The delay before a send would leave at least `reserved` sends in the current window.
+        current = time.time()
+        if current > self.window + self.per or self.remaining > reserved:
+            return 0.0
+        return self.per - (current - self.window)
+
     async def block(self) -> None:
         async with self.lock:
             delta = self.get_delay()
@@ -295,7 +444,8 @@ class DiscordWebSocket:
         # an empty dispatcher to prevent crashes
         self._dispatch: VariadicArgNone = lambda *_args: None
         # generic event listeners
-        self._dispatch_listeners: List[EventListener] = []
+        self._dispatch_listeners: Dict[str, List[EventListener]] = {}
+        """{"EVENT_NAME": [EventListener, ...]}"""
         # the keep alive
         self._keep_alive: Optional[KeepAliveHandler] = None
         self.thread_id: int = threading.get_ident()
@@ -304,10 +454,16 @@ class DiscordWebSocket:
         self.session_id: Optional[str] = None
         self.resume_url: Optional[str] = None
         self.sequence: Optional[int] = None
-        self._zlib = zlib.decompressobj()
-        self._buffer: bytearray = bytearray()
+        self._encoding: Union[Type[_JSONEncoding], Type[_ETFEncoding]] = _JSONEncoding
+        self._inflator: Optional[Union[_ZlibStreamInflator, _ZstdStreamInflator]] = (
+            _ZlibStreamInflator()
+        )
         self._close_code: Optional[int] = None
         self._rate_limiter: GatewayRatelimiter = GatewayRatelimiter()
+        self._ignored_events: FrozenSet[str] = frozenset()
+        self._ignored_event_names: FrozenSet[bytes] = frozenset()
+        self._recorder: Optional[GatewayRecorder] = None
+        self._event_executor: Optional[EventExecutor] = None
 
     @property
     def open(self) -> bool:
@@ -316,9 +472,18 @@ class DiscordWebSocket:
     def is_ratelimited(self) -> bool:
         return self._rate_limiter.is_ratelimited()
 
-    def debug_log_receive(self, data: Any, /) -> None:
+    def debug_log_receive(self, data: Union[str, bytes], /) -> None:
+        # JSON payloads are handed to on_socket_raw_receive as a str, so only
+        # pay for the decode when debug events are actually enabled.
+        if type(data) is bytes and self._encoding is _JSONEncoding:
+            data = data.decode("utf-8")
         self._dispatch("socket_raw_receive", data)
 
+    def _set_transport(self, encoding: str, compression: Optional[str]) -> None:
+        self._encoding = _GATEWAY_ENCODINGS[encoding]
+        inflator = _GATEWAY_COMPRESSIONS[compression]
+        self._inflator = inflator() if inflator is not None else None
+
     def log_receive(self, _, /) -> None:
         pass
 
@@ -339,13 +504,20 @@ class DiscordWebSocket:
 
         This is for internal use only.
         """
+        encoding = client._gateway_encoding
+        compression = client._gateway_compression
         if not gateway:
-            gateway = await client.http.get_gateway()
+            gateway = await client.http.get_gateway(encoding=encoding, compress=compression)
         elif format_gateway:
-            gateway = client.http.format_websocket_url(gateway)
+            gateway = client.http.format_websocket_url(gateway, encoding, compress=compression)
 
         socket = await client.http.ws_connect(gateway)
         ws = cls(socket, loop=client.loop)
+        ws._set_transport(encoding, compression)
+        ws._ignored_events = client._ignored_events
+        ws._ignored_event_names = frozenset(event.encode() for event in client._ignored_events)
+        ws._recorder = client._gateway_recorder
+        ws._event_executor = client._event_executor
 
         # dynamically add attributes needed
         ws.token = client._token  # type: ignore
@@ -404,7 +576,7 @@ class DiscordWebSocket:
 
         future = self.loop.create_future()
         entry = EventListener(event=event, predicate=predicate, result=result, future=future)
-        self._dispatch_listeners.append(entry)
+        self._dispatch_listeners.setdefault(event, []).append(entry)
         return future
 
     async def identify(self) -> None:
@@ -420,7 +592,9 @@ class DiscordWebSocket:
                     "browser": "nextcord",
                     "device": "nextcord",
                 },
-                "compress": True,
+                # Without transport compression, payload compression would send
+                # standalone zlib blobs that the inflators here don't handle.
+                "compress": self._inflator is not None,
                 "large_threshold": 250,
                 "intents": state._intents.value,
             },
@@ -452,23 +626,34 @@ class DiscordWebSocket:
         _log.info("Shard ID %s has sent the RESUME payload.", self.shard_id)
 
     async def received_message(self, msg: Union[str, bytes], /) -> None:
-        if type(msg) is bytes:
-            self._buffer.extend(msg)
-
-            if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
+        executor = self._event_executor
+        if executor is not None and executor.blocked:
+            # Backpressure from event handlers that can't keep up.
+            await executor.wait_for_room()
+
+        if type(msg) is bytes and self._inflator is not None:
+            inflated = self._inflator.decompress(msg)
+            if not inflated:
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
-            self._buffer = bytearray()
+            msg = inflated
 
         self.log_receive(msg)
-        message: Dict[str, Any] = utils.from_json(msg)
+        if self._recorder is not None:
+            self._recorder.record(self.shard_id, self._encoding.name, msg)
 
-        _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, msg)
-        event = message.get("t")
-        if event:
-            self._dispatch("socket_event_type", event)
+        if self._ignored_event_names and type(msg) is bytes and self._encoding is _JSONEncoding:
+            head = _DISPATCH_HEAD.match(msg)
+            if head is not None and head.group(1) in self._ignored_event_names:
+                self.sequence = int(head.group(2))
+                if self._keep_alive:
+                    self._keep_alive.tick()
+                return
+
+        # Both orjson and json accept bytes, so the inflated payload is parsed
+        # directly without an intermediate str.
+        message: Dict[str, Any] = self._encoding.loads(msg)
 
+        _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, message)
         op: int = message["op"]
         data: Dict[str, Any] = message["d"]
         seq: Optional[int] = message["s"]
@@ -478,6 +663,13 @@ class DiscordWebSocket:
         if self._keep_alive:
             self._keep_alive.tick()
 
+        event = message.get("t")
+        if event:
+            # payloads that couldn't be peeked at above, e.g. ETF ones
+            if event in self._ignored_events:
+                return
+            self._dispatch("socket_event_type", event)
+
         if op != self.DISPATCH:
             if op == self.RECONNECT:
                 # "reconnect" can only be handled by the Client
@@ -557,11 +749,14 @@ class DiscordWebSocket:
             func(data)
 
         # remove the dispatched listeners
-        removed = []
-        for index, entry in enumerate(self._dispatch_listeners):
-            if entry.event != event:
-                continue
+        if event is None:
+            return
+        listeners = self._dispatch_listeners.get(event)
+        if not listeners:
+            return
 
+        removed = []
+        for index, entry in enumerate(listeners):
             future = entry.future
             if future.cancelled():
                 removed.append(index)
@@ -578,8 +773,11 @@ class DiscordWebSocket:
                     future.set_result(ret)
                     removed.append(index)
 
-        for index in reversed(removed):
-            del self._dispatch_listeners[index]
+        if len(removed) == len(listeners):
+            del self._dispatch_listeners[event]
+        else:
+            for index in reversed(removed):
+                del listeners[index]
 
     @property
     def latency(self) -> float:
@@ -637,15 +835,22 @@ class DiscordWebSocket:
     async def debug_send(self, data: Any, /) -> None:
         await self._rate_limiter.block()
         self._dispatch("socket_raw_send", data)
-        await self.socket.send_str(data)
+        await self._send_raw(data)
 
     async def send(self, data: Any, /) -> None:
         await self._rate_limiter.block()
-        await self.socket.send_str(data)
+        await self._send_raw(data)
+
+    async def _send_raw(self, data: Union[str, bytes]) -> None:
+        if isinstance(data, bytes):
+            await self.socket.send_bytes(data)
+        else:
+            await self.socket.send_str(data)
 
     async def send_as_json(self, data: Any) -> None:
+        # despite the name, this encodes the payload using the negotiated gateway encoding
         try:
-            await self.send(utils.to_json(data))
+            await self.send(self._encoding.dumps(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -653,7 +858,7 @@ class DiscordWebSocket:
     async def send_heartbeat(self, data: Any) -> None:
         # This bypasses the rate limit handling code since it has a higher priority
         try:
-            await self.socket.send_str(utils.to_json(data))
+            await self._send_raw(self._encoding.dumps(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -680,9 +885,8 @@ class DiscordWebSocket:
             "d": {"activities": activities, "afk": False, "since": since, "status": status},
         }
 
-        sent = utils.to_json(payload)
-        _log.debug('Sending "%s" to change status', sent)
-        await self.send(sent)
+        _log.debug('Sending "%s" to change status', payload)
+        await self.send_as_json(payload)
 
     async def request_chunks(
         self,
@@ -14,6 +14,7 @@ from typing import (
     ClassVar,
     Dict,
     List,
+    MutableMapping,
     NamedTuple,
     Optional,
     Sequence,
@@ -322,11 +323,12 @@ class Guild(Hashable):
     }
 
     def __init__(self, *, data: GuildPayload, state: ConnectionState) -> None:
-        self._channels: Dict[int, GuildChannel] = {}
-        self._members: Dict[int, Member] = {}
+        backend = state._cache_backend
+        self._channels: MutableMapping[int, GuildChannel] = backend.create_store("channels")
+        self._members: MutableMapping[int, Member] = backend.create_store("members")
         self._scheduled_events: Dict[int, ScheduledEvent] = {}
         self._voice_states: Dict[int, VoiceState] = {}
-        self._threads: Dict[int, Thread] = {}
+        self._threads: MutableMapping[int, Thread] = backend.create_store("threads")
         self._application_commands: Dict[int, BaseApplicationCommand] = {}
         self._state: ConnectionState = state
         self._from_data(data)
@@ -470,8 +472,8 @@ class Guild(Hashable):
         self._banner: Optional[str] = guild.get("banner")
         self.unavailable: bool = guild.get("unavailable", False)
         self.id: int = int(guild["id"])
-        self._roles: Dict[int, Role] = {}
         state = self._state  # speed up attribute access
+        self._roles: MutableMapping[int, Role] = state._cache_backend.create_store("roles")
         for r in guild.get("roles", []):
             role = Role(guild=self, data=r, state=state)
             self._roles[role.id] = role
@@ -2795,7 +2797,7 @@ class Guild(Hashable):
         data = await self._state.http.get_roles(self.id)
         roles = [Role(guild=self, state=self._state, data=d) for d in data]
         if cache:
-            self._roles: Dict[int, Role] = {}
+            self._roles = self._state._cache_backend.create_store("roles")
             for role in roles:
                 self._roles[role.id] = role
 
@@ -3,19 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
+import hashlib
+import inspect
 import logging
+import string
 import sys
+import time
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     ClassVar,
     Coroutine,
+    Deque,
     Dict,
+    Generator,
     Iterable,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
@@ -29,6 +44,7 @@ from urllib.parse import quote as _uriquote
 import aiohttp
 
 from . import __version__, utils
+from .enums import RequestPriority
 from .errors import (
     DiscordException,
     DiscordServerError,
@@ -49,6 +65,8 @@ _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .enums import AuditLogAction, InteractionResponseType
+    from .ratelimits import RateLimitStore
+    from .response_cache import ResponseCache
     from .types import (
         appinfo,
         audit_log,
@@ -84,7 +102,9 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    "BatchResult",
     "HTTPClient",
+    "RequestMetrics",
     "Route",
 )
 
@@ -115,18 +135,75 @@ def _get_logging_auth(auth: Optional[str]) -> str:
     return f"{auth[:12]}[redacted]"
 
 
+def _copy_json(obj: Any) -> Any:
+    # Faster than copy.deepcopy, as decoded JSON only ever nests dicts and lists of immutables.
+    if type(obj) is dict:
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
+def _get_store_auth(auth: Optional[str]) -> str:
+    # Rate limit stores may live in another process, so don't hand them the token itself.
+    if auth is None:
+        return "None"
+
+    return hashlib.sha256(auth.encode("utf-8")).hexdigest()[:32]
+
+
+_request_priority: ContextVar[Optional[RequestPriority]] = ContextVar(
+    "_request_priority", default=None
+)
+
+
+class _RouteTemplate:
+    """A route path parsed once, so that routes only need to fill in their parameters."""
+
+    __slots__ = ("url", "format_string", "fields")
+
+    def __init__(self, base: str, path: str) -> None:
+        self.url: str = base + path
+        """The unformatted url, used as is by routes without parameters."""
+        parsed = list(string.Formatter().parse(path))
+        self.fields: Tuple[str, ...] = tuple(
+            field for _, field, _, _ in parsed if field is not None
+        )
+        """Names of the parameters, in the order they appear in the path."""
+        self.format_string: str = base.replace("{", "{{").replace("}", "}}") + "".join(
+            literal.replace("{", "{{").replace("}", "}}") + ("{}" if field is not None else "")
+            for literal, field, _, _ in parsed
+        )
+        """The url with positional fields, as filling those in is faster than format_map."""
+
+    def format(self, parameters: Dict[str, Any]) -> str:
+        return self.format_string.format(
+            *[
+                _uriquote(value) if isinstance(value := parameters[field], str) else value
+                for field in self.fields
+            ]
+        )
+
+
 class Route:
     BASE: ClassVar[str] = f"https://discord.com/api/v{_API_VERSION}"
 
-    def __init__(self, method: str, path: str, **parameters: Any) -> None:
+    _templates: ClassVar[Dict[Tuple[str, str], _RouteTemplate]] = {}
+    """{("BASE", "path"): _RouteTemplate}, shared by every route with the same path."""
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        *,
+        priority: Optional[RequestPriority] = None,
+        **parameters: Any,
+    ) -> None:
         self.path: str = path
         self.method: str = method
-        url = self.BASE + self.path
-        if parameters:
-            url = url.format_map(
-                {k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()}
-            )
-        self.url: str = url
+        if (template := self._templates.get((self.BASE, path))) is None:
+            template = self._templates[self.BASE, path] = _RouteTemplate(self.BASE, path)
+        self.url: str = template.format(parameters) if parameters else template.url
 
         # major parameters:
         self.channel_id: Optional[Snowflake] = parameters.get("channel_id")
@@ -134,10 +211,25 @@ class Route:
         self.webhook_id: Optional[Snowflake] = parameters.get("webhook_id")
         self.webhook_token: Optional[str] = parameters.get("webhook_token")
 
+        if priority is None and "interaction_token" in parameters:
+            priority = RequestPriority.interaction
+        self.priority: Optional[RequestPriority] = priority
+
+        # IDs may be given as str or int, which must share the same rate limits.
+        self.bucket_key: Tuple[Optional[int], Optional[int], str] = (
+            None if self.channel_id is None else int(self.channel_id),
+            None if self.guild_id is None else int(self.guild_id),
+            path,
+        )
+        """Hashable equivalent of :attr:`bucket`, used to look up rate limits."""
+        self._bucket: Optional[str] = None
+
     @property
     def bucket(self) -> str:
         # the bucket is just method + path w/ major parameters
-        return f"{self.channel_id}:{self.guild_id}:{self.path}"
+        if self._bucket is None:
+            self._bucket = f"{self.channel_id}:{self.guild_id}:{self.path}"
+        return self._bucket
 
 
 class RateLimitMigrating(DiscordException): ...
@@ -195,6 +287,16 @@ class RateLimit:
         """When this RateLimit is being deprecated and acquiring requests need to migrate to a different RateLimit, this
         variable should be set to the different RateLimit/buckets string name.
         """
+        self._waiting: List[int] = [0] * len(RequestPriority)
+        """Amount of requests waiting to acquire this RateLimit, indexed by their priority."""
+        self._store: Optional[RateLimitStore] = None
+        """Store used to share this rate limit with other processes, if any."""
+        self._store_key: str = ""
+        """Key identifying this rate limit in the store."""
+        self._store_scope: str = ""
+        """The major parameters and auth of the route, keying the rate limit in the store along
+        with its Discord bucket once known.
+        """
 
         self._ratelimit_ready.set()
 
@@ -218,6 +320,9 @@ class RateLimit:
             pass  # Don't need to set it again.
         elif self.bucket is None:
             self.bucket = x_bucket
+            if x_bucket is not None and self._store_scope:
+                # Routes sharing a Discord bucket share their rate limit in the store too.
+                self._store_key = f"{x_bucket}:{self._store_scope}"
         else:
             raise IncorrectBucket(
                 f"Update given for bucket {x_bucket}, but this RateLimit is for bucket {self.bucket}!"
@@ -291,6 +396,10 @@ class RateLimit:
         if self._first_update:
             self._first_update = False
 
+        # Let other processes sharing this rate limit know that it's exhausted.
+        if self._store is not None and self.remaining <= 0:
+            await self._store.block(self._store_key, self.reset_after)
+
         _log.debug(
             "Bucket %s: Updated with limit %s, remaining %s, reset %s, and reset_after %s seconds.",
             self.bucket,
@@ -370,7 +479,25 @@ class RateLimit:
     def locked(self) -> bool:
         return self.remaining <= 0
 
-    async def acquire(self) -> bool:
+    @contextlib.asynccontextmanager
+    async def acquiring(
+        self, priority: RequestPriority = RequestPriority.user
+    ) -> AsyncGenerator[float, None]:
+        """Async context manager that acquires this rate limit with the given priority.
+        Gives the amount of seconds spent waiting to acquire.
+        """
+        start = time.perf_counter()
+        await self.acquire(priority)
+        try:
+            yield time.perf_counter() - start
+        finally:
+            self.release()
+
+    def _outranked(self, priority: RequestPriority) -> bool:
+        """Returns True if requests with a higher priority are waiting to acquire."""
+        return any(self._waiting[:priority])
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.user) -> bool:
         # If no more requests can be made but the event is set, clear it.
         if self.locked and self._ratelimit_ready.is_set():
             _log.debug(
@@ -383,19 +510,34 @@ class RateLimit:
                 self.start_reset_task()
 
         # Waits in a loop for the event to be set, clearing the event as needed and looping.
-        while not self._ratelimit_ready.is_set():
-            _log.debug("Bucket %s: Not set yet, waiting for it to be set.", self.bucket)
-            await self._ratelimit_ready.wait()
-
-            if self.locked and self._ratelimit_ready.is_set():
-                _log.debug(
-                    "Bucket %s: Hit the remaining limit of %s, locking until reset.",
-                    self.bucket,
-                    self.limit,
-                )
-                self._ratelimit_ready.clear()
-                if not self.resetting:
-                    self.start_reset_task()
+        # Every waiter is woken up in arrival order once the event is set, so waiters outranked
+        #  by a higher priority waiter yield once to let those take the remaining requests first.
+        if not self._ratelimit_ready.is_set() or self._outranked(priority):
+            self._waiting[priority] += 1
+            try:
+                yielded = False
+                while True:
+                    if not self._ratelimit_ready.is_set():
+                        _log.debug("Bucket %s: Not set yet, waiting for it to be set.", self.bucket)
+                        await self._ratelimit_ready.wait()
+                        yielded = False
+                    elif not yielded and self._outranked(priority):
+                        yielded = True
+                        await asyncio.sleep(0)
+                    else:
+                        break
+
+                    if self.locked and self._ratelimit_ready.is_set():
+                        _log.debug(
+                            "Bucket %s: Hit the remaining limit of %s, locking until reset.",
+                            self.bucket,
+                            self.limit,
+                        )
+                        self._ratelimit_ready.clear()
+                        if not self.resetting:
+                            self.start_reset_task()
+            finally:
+                self._waiting[priority] -= 1
 
         if self.migrating:
             raise RateLimitMigrating(
@@ -404,8 +546,32 @@ class RateLimit:
 
         _log.debug("Bucket %s: Continuing with request.", self.bucket)
         self.remaining -= 1
+
+        if self._store is not None and self._shared_limit_known:
+            await self._reserve_shared()
+
         return True
 
+    @property
+    def _shared_limit_known(self) -> bool:
+        """If the limit is known well enough to be coordinated through the store."""
+        return not self._first_update
+
+    async def _reserve_shared(self) -> None:
+        """Waits until the store allows a request, as other processes may share this rate limit."""
+        store = self._store
+        while (
+            delay := await store.reserve(  # pyright: ignore [reportOptionalMemberAccess]
+                self._store_key, self.limit, self._tracked_reset_time
+            )
+        ) > 0:
+            _log.debug(
+                "Bucket %s: Exhausted in the shared rate limit store, waiting %.2f seconds.",
+                self.bucket,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
     def release(self) -> None:
         # Basically a placeholder, could probably be removed ;)
         pass
@@ -421,8 +587,13 @@ class GlobalRateLimit(RateLimit):
     def __init__(self, time_offset: float = 0.0, *args, **kwargs) -> None:
         super().__init__(time_offset=time_offset, use_reset_timestamp=False)
 
-    async def acquire(self) -> bool:
-        ret = await super().acquire()
+    @property
+    def _shared_limit_known(self) -> bool:
+        # The global limit is configured instead of discovered through headers.
+        return True
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.user) -> bool:
+        ret = await super().acquire(priority)
         # As updates are little weird, it's best to start the reset task as soon as the first request has acquired.
         if not self.resetting:
             self.start_reset_task()
@@ -453,6 +624,9 @@ class GlobalRateLimit(RateLimit):
 
                 self.start_reset_task()
 
+                if self._store is not None:
+                    await self._store.block(self._store_key, self.reset_after)
+
             self._ratelimit_ready.clear()
             if not self.resetting:
                 self.start_reset_task()
@@ -460,6 +634,181 @@ class GlobalRateLimit(RateLimit):
             _log.warning("Cleared global ratelimit, waiting for reset.")
 
 
+class RequestMetrics(NamedTuple):
+    """Metrics of a single request made by :class:`HTTPClient`, given to request observers.
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the request.
+    path: :class:`str`
+        The route path of the request, for example ``"/channels/{channel_id}/messages"``.
+    bucket: Optional[:class:`str`]
+        The rate limit bucket Discord put the route in, if known.
+    status: Optional[:class:`int`]
+        The status of the last response, or ``None`` if no response was received.
+    latency: :class:`float`
+        The total amount of seconds the request took, including rate limit waits and retries.
+    route_wait: :class:`float`
+        The amount of seconds spent waiting for the route rate limit.
+    global_wait: :class:`float`
+        The amount of seconds spent waiting for the global rate limit.
+    retries: :class:`int`
+        The amount of times the request was retried.
+    exception: Optional[:class:`BaseException`]
+        The exception the request raised, if any.
+    """
+
+    method: str
+    path: str
+    bucket: Optional[str]
+    status: Optional[int]
+    latency: float
+    route_wait: float
+    global_wait: float
+    retries: int
+    exception: Optional[BaseException]
+
+
+BatchRequest = Union[Awaitable[Any], Tuple[Route, Dict[str, Any]]]
+"""A request for :meth:`HTTPClient.batch`, either an awaitable or a route with the keyword
+arguments of :meth:`HTTPClient.request`.
+"""
+
+
+class BatchResult(NamedTuple):
+    """The outcome of a request made through :meth:`HTTPClient.batch`.
+
+    Attributes
+    ----------
+    index: :class:`int`
+        The position of the request in the given requests.
+    result: Any
+        What the request returned, or ``None`` if it raised.
+    exception: Optional[:class:`BaseException`]
+        The exception the request raised, if any.
+    """
+
+    index: int
+    result: Any
+    exception: Optional[BaseException]
+
+
+class _LatencyHistogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    BOUNDS: ClassVar[Tuple[float, ...]] = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    """Upper bounds in seconds of each bucket, values above the last one go into an extra bucket."""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(self.BOUNDS) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "buckets": dict(zip((*map(str, self.BOUNDS), "inf"), self.counts, strict=True)),
+        }
+
+
+class _RequestStats:
+    __slots__ = (
+        "requests",
+        "errors",
+        "retries",
+        "statuses",
+        "latency",
+        "route_wait",
+        "global_wait",
+    )
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.statuses: Dict[int, int] = {}
+        self.latency: _LatencyHistogram = _LatencyHistogram()
+        self.route_wait: _LatencyHistogram = _LatencyHistogram()
+        self.global_wait: _LatencyHistogram = _LatencyHistogram()
+
+    def record(self, metrics: RequestMetrics) -> None:
+        self.requests += 1
+        self.retries += metrics.retries
+        if metrics.exception is not None:
+            self.errors += 1
+        if metrics.status is not None:
+            self.statuses[metrics.status] = self.statuses.get(metrics.status, 0) + 1
+        self.latency.observe(metrics.latency)
+        self.route_wait.observe(metrics.route_wait)
+        self.global_wait.observe(metrics.global_wait)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": self.statuses.copy(),
+            "latency": self.latency.to_dict(),
+            "route_wait": self.route_wait.to_dict(),
+            "global_wait": self.global_wait.to_dict(),
+        }
+
+
+class _HTTPStats:
+    def __init__(self) -> None:
+        self.in_flight: int = 0
+        self.ratelimited: int = 0
+        """Amount of 429s received for route rate limits."""
+        self.global_ratelimited: int = 0
+        """Amount of 429s received for the global rate limit."""
+        self.migrations: int = 0
+        self.incorrect_buckets: int = 0
+        self.shed_ratelimits: int = 0
+        self.total: _RequestStats = _RequestStats()
+        self.routes: Dict[Tuple[str, str], _RequestStats] = {}
+        """{("METHOD", "/route/{path}"): _RequestStats}"""
+        self.buckets: Dict[str, _RequestStats] = {}
+        """{"Discord bucket name": _RequestStats}"""
+
+    def record(self, metrics: RequestMetrics) -> None:
+        self.total.record(metrics)
+
+        route_key = (metrics.method, metrics.path)
+        if (route_stats := self.routes.get(route_key)) is None:
+            route_stats = self.routes[route_key] = _RequestStats()
+        route_stats.record(metrics)
+
+        if metrics.bucket is not None:
+            if (bucket_stats := self.buckets.get(metrics.bucket)) is None:
+                bucket_stats = self.buckets[metrics.bucket] = _RequestStats()
+            bucket_stats.record(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "ratelimited": self.ratelimited,
+            "global_ratelimited": self.global_ratelimited,
+            "migrations": self.migrations,
+            "incorrect_buckets": self.incorrect_buckets,
+            "shed_ratelimits": self.shed_ratelimits,
+            **self.total.to_dict(),
+            "routes": {
+                f"{method} {path}": value.to_dict() for (method, path), value in self.routes.items()
+            },
+            "buckets": {key: value.to_dict() for key, value in self.buckets.items()},
+        }
+
+
 # For some reason, the Discord voice websocket expects this header to be
 # completely lowercase while aiohttp respects spec and does it as case-insensitive
 aiohttp.hdrs.WEBSOCKET = "websocket"  # type: ignore
@@ -514,6 +863,11 @@ class HTTPClient:
     ratelimit_shed_threshold: :class:`int`
         Minimum time in seconds after a rate limit has been reset before shedding it. The higher the number, the longer
         an unused rate limit will be kept. Should be greater or equal to 0.
+    ratelimit_store: Optional[:class:`RateLimitStore`]
+        Store to share rate limits through, for example with other processes using the same token. If ``None``, rate
+        limits are only tracked by this client.
+    response_cache: Optional[:class:`ResponseCache`]
+        Cache for the responses of rarely changing routes and CDN assets. If ``None``, nothing is cached.
     """
 
     def __init__(
@@ -529,6 +883,8 @@ class HTTPClient:
         dispatch: DispatchProtocol,
         ratelimit_shed_timer: Optional[int] = 300,
         ratelimit_shed_threshold: int = 600,
+        ratelimit_store: Optional[RateLimitStore] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._connector = connector
@@ -544,6 +900,14 @@ class HTTPClient:
         self._ratelimit_shed_timer = ratelimit_shed_timer
         self._ratelimit_shed_threshold = ratelimit_shed_threshold
         self._ratelimit_shed_task: Optional[asyncio.Task[None]] = None
+        self._ratelimit_store: Optional[RateLimitStore] = ratelimit_store
+        self._inflight_requests: Dict[Tuple[Any, ...], List[asyncio.Future[Any]]] = {}
+        """{(url, auth, params, retry_request): [futures of joined callers]} of GET requests that can be
+        joined.
+        """
+        self._response_cache: Optional[ResponseCache] = response_cache
+        self._stats: _HTTPStats = _HTTPStats()
+        self._request_observers: List[Callable[[RequestMetrics], Any]] = []
 
         # to mitigate breaking changes
         self._user_agent: str = _USER_AGENT
@@ -552,8 +916,8 @@ class HTTPClient:
         """{"Discord bucket name": RateLimit}"""
         self._global_rate_limits: dict[Optional[str], GlobalRateLimit] = {}
         """{"Auth string": RateLimit}, None for auth-less ratelimit."""
-        self._url_rate_limits: dict[tuple[str, str, Optional[str]], RateLimit] = {}
-        """{("METHOD", "Route.bucket", "auth string"): RateLimit} auth string may be None to indicate auth-less."""
+        self._url_rate_limits: dict[tuple[str, Tuple[Any, ...], Optional[str]], RateLimit] = {}
+        """{("METHOD", Route.bucket_key, "auth string"): RateLimit} auth string may be None to indicate auth-less."""
 
         if self._ratelimit_shed_timer is not None and self._ratelimit_shed_timer < 0:
             raise ValueError(
@@ -577,6 +941,8 @@ class HTTPClient:
         rate_limit.remaining = max_per_second
         rate_limit.reset_after = 1 + self._time_offset
         rate_limit.bucket = f"Global {log_auth if auth else 'Unauthorized'}"
+        rate_limit._store = self._ratelimit_store
+        rate_limit._store_key = f"global:{_get_store_auth(auth)}"
 
         self._global_rate_limits[auth] = rate_limit
         return rate_limit
@@ -588,22 +954,87 @@ class HTTPClient:
         ret = RateLimit(
             time_offset=self._time_offset, use_reset_timestamp=self._ratelimit_use_timestamp
         )
-        self._url_rate_limits[(method, route.bucket, auth)] = ret
+        ret._store = self._ratelimit_store
+        ret._store_key = f"{method}:{route.bucket}:{_get_store_auth(auth)}"
+        channel_id, guild_id, _ = route.bucket_key
+        ret._store_scope = f"{channel_id}:{guild_id}:{_get_store_auth(auth)}"
+        self._url_rate_limits[(method, route.bucket_key, auth)] = ret
         return ret
 
     def _set_url_rate_limit(
         self, method: str, route: Route, auth: Optional[str], rate_limit: RateLimit
     ) -> None:
-        self._url_rate_limits[(method, route.bucket, auth)] = rate_limit
+        self._url_rate_limits[(method, route.bucket_key, auth)] = rate_limit
 
     def _get_url_rate_limit(
         self, method: str, route: Route, auth: Optional[str]
     ) -> Optional[RateLimit]:
-        return self._url_rate_limits.get((method, route.bucket, auth), None)
+        return self._url_rate_limits.get((method, route.bucket_key, auth), None)
 
     def set_default_auth(self, auth: Optional[str]) -> None:
         self._default_auth = auth
 
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the request metrics collected so far.
+
+        The snapshot has totals for every request, along with the same metrics grouped per route
+        under ``"routes"`` and per Discord rate limit bucket under ``"buckets"``. Latencies and
+        rate limit waits are histograms with the count, sum and max in seconds, and the amount
+        of values in each bucket keyed by its upper bound.
+
+        Returns
+        -------
+        Dict[:class:`str`, Any]
+            The snapshot, which is not updated by later requests.
+        """
+        return self._stats.to_dict()
+
+    def reset_stats(self) -> None:
+        """Resets the request metrics collected so far. Requests in flight are still counted."""
+        in_flight = self._stats.in_flight
+        self._stats = _HTTPStats()
+        self._stats.in_flight = in_flight
+
+    def add_request_observer(self, observer: Callable[[RequestMetrics], Any]) -> None:
+        """Adds a function that is called with the :class:`RequestMetrics` of every finished request.
+
+        Observers are called synchronously and should return quickly, exceptions they raise are
+        logged and ignored.
+        """
+        self._request_observers.append(observer)
+
+    def remove_request_observer(self, observer: Callable[[RequestMetrics], Any]) -> None:
+        """Removes a function added with :meth:`add_request_observer`."""
+        with contextlib.suppress(ValueError):
+            self._request_observers.remove(observer)
+
+    def _record_request(self, metrics: RequestMetrics) -> None:
+        self._stats.record(metrics)
+        for observer in self._request_observers:
+            try:
+                observer(metrics)
+            except Exception:
+                _log.exception("Request observer %s raised an exception, ignoring.", observer)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def request_priority(priority: RequestPriority) -> Generator[None, None, None]:
+        """Context manager that sets the default priority of requests made inside of it.
+
+        This also applies to tasks created inside of it. Routes and requests given an explicit
+        priority, and requests made with an interaction token, are not affected.
+
+        Parameters
+        ----------
+        priority: :class:`RequestPriority`
+            The priority to make requests with.
+        """
+        token = _request_priority.set(priority)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
     def _make_headers(
         self,
         original_headers: dict[str, str],
@@ -711,8 +1142,127 @@ class HTTPClient:
                 _log.debug("Allowing bucket %s to be garbage collected.", value.bucket)
 
         if old_len != (new_len := len(self._url_rate_limits)):
+            self._stats.shed_ratelimits += old_len - new_len
             _log.info("Allowed %s rate limits to be garbage collected.", old_len - new_len)
 
+    def _get_batch_key(self, request: BatchRequest) -> Optional[Tuple[Any, ...]]:
+        """Returns the url rate limit key of a ``(route, kwargs)`` request, or ``None`` if the
+        request is an awaitable.
+        """
+        if not isinstance(request, tuple):
+            return None
+
+        route, kwargs = request
+        auth = kwargs.get("auth", MISSING)
+        return (route.method, route.bucket_key, self._default_auth if auth is MISSING else auth)
+
+    def _start_batch_request(self, request: BatchRequest) -> asyncio.Future[Any]:
+        if isinstance(request, tuple):
+            route, kwargs = request
+            return asyncio.ensure_future(self.request(route, **kwargs))
+        return asyncio.ensure_future(request)
+
+    def _get_batch_window(self, key: Optional[Tuple[Any, ...]], max_concurrency: int) -> int:
+        if key is None:
+            return max_concurrency
+
+        rate_limit = self._url_rate_limits.get(key)
+        if rate_limit is None or rate_limit._first_update:
+            # Send a single request until the limit of the bucket is discovered.
+            return 1
+
+        return max(1, rate_limit.limit)
+
+    async def batch(
+        self,
+        requests: Iterable[BatchRequest],
+        *,
+        max_concurrency: Optional[int] = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[BatchResult]:
+        """Runs many requests concurrently, yielding their results as they finish.
+
+        Requests given as a ``(route, kwargs)`` tuple are sent with :meth:`request` and grouped by
+        their rate limit bucket. Each bucket sends as many requests at once as its discovered limit
+        allows, while different buckets run concurrently. Awaitables are run as they come, only
+        bounded by ``max_concurrency``.
+
+        Exceptions raised by requests are yielded instead of being raised. Breaking out of the loop
+        cancels the requests that are still running.
+
+        Parameters
+        ----------
+        requests: Iterable[Union[Awaitable, Tuple[:class:`Route`, Dict[:class:`str`, Any]]]]
+            The requests to make. This is consumed lazily, so it can be a generator.
+        max_concurrency: Optional[:class:`int`]
+            The maximum amount of requests running at once. Defaults to ``max_global_requests``.
+        prefetch: :class:`int`
+            The maximum amount of requests taken from ``requests`` ahead of being run, used to find
+            requests for other buckets while a bucket is busy.
+
+        Yields
+        ------
+        :class:`BatchResult`
+            The outcome of each request, in the order they finished.
+        """
+        if max_concurrency is None:
+            max_concurrency = self._max_global_requests
+
+        source = enumerate(requests)
+        exhausted = False
+        pending: Dict[Optional[Tuple[Any, ...]], Deque[Tuple[int, BatchRequest]]] = {}
+        """{url rate limit key or None: deque((index, request))}, None is for awaitables without a known bucket."""
+        pending_count = 0
+        running: Dict[asyncio.Future[Any], Tuple[int, Optional[Tuple[Any, ...]]]] = {}
+        active: Dict[Optional[Tuple[Any, ...]], int] = {}
+
+        try:
+            while True:
+                while not exhausted and pending_count < prefetch:
+                    try:
+                        index, request = next(source)
+                    except StopIteration:
+                        exhausted = True
+                    else:
+                        pending.setdefault(self._get_batch_key(request), deque()).append(
+                            (index, request)
+                        )
+                        pending_count += 1
+
+                for key, queue in list(pending.items()):
+                    window = self._get_batch_window(key, max_concurrency)
+                    while queue and len(running) < max_concurrency and active.get(key, 0) < window:
+                        index, request = queue.popleft()
+                        pending_count -= 1
+                        running[self._start_batch_request(request)] = (index, key)
+                        active[key] = active.get(key, 0) + 1
+                    if not queue:
+                        del pending[key]
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index, key = running.pop(future)
+                    active[key] -= 1
+                    if not active[key]:
+                        del active[key]
+
+                    if future.cancelled():
+                        yield BatchResult(index, None, asyncio.CancelledError())
+                    elif (exception := future.exception()) is not None:
+                        yield BatchResult(index, None, exception)
+                    else:
+                        yield BatchResult(index, future.result(), None)
+        finally:
+            for future in running:
+                future.cancel()
+            for queue in pending.values():
+                for _, request in queue:
+                    if inspect.iscoroutine(request):
+                        request.close()
+
     async def request(
         self,
         route: Route,
@@ -721,12 +1271,17 @@ class HTTPClient:
         form: Optional[Iterable[Dict[str, Any]]] = None,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
+        priority: Optional[RequestPriority] = None,
         **kwargs: Any,
     ) -> Any:
         """|coro|
 
         Makes an API request to Discord, handling authorization (if needed), rate limits, and limited error handling.
 
+        GET requests without files, forms or custom headers that are identical to a request already in flight
+        are not sent again, and instead wait for the response of that request. Each caller receives its own
+        copy of the response.
+
         Parameters
         ----------
         route: :class:`Route`
@@ -745,6 +1300,9 @@ class HTTPClient:
             or 429s. (ratelimit issues)
             If `False`, the request will raise an exception immediately if a 500 or 429 error is encountered or if the
             internally tracked rate limits are locked.
+        priority: Optional[:class:`RequestPriority`]
+            The priority to wait for rate limits with. If not set, the priority of the route is used, then the priority
+            set with :meth:`request_priority`, then :attr:`RequestPriority.user`.
         kwargs
             This is purposefully undocumented. Behavior of extra kwargs may change in a breaking way at any point, and
             extra kwargs may not be allowed in the future.
@@ -754,6 +1312,101 @@ class HTTPClient:
         A JSON payload response from Discord. They JSON payload's type will usually be a :class:`list` or :class:`dict`
         """
 
+        # Identical GET requests already in flight are joined rather than sent again, as they would
+        #  otherwise only use up rate limits to get the same response.
+        cache = self._response_cache
+        if route.method == "GET" and not files and not form and kwargs.keys() <= {"params"}:
+            params = kwargs.get("params")
+            try:
+                cache_key = (
+                    route.url,
+                    self._default_auth if auth is MISSING else auth,
+                    frozenset(params.items()) if params else None,
+                )
+                key = (*cache_key, retry_request)
+                hash(key)
+            except TypeError:
+                # Unhashable params, this can't be coalesced.
+                pass
+            else:
+                ttl = cache._get_ttl(route.path) if cache is not None else None
+                if ttl is not None:
+                    cached = cache._get(cache_key)  # pyright: ignore [reportOptionalMemberAccess]
+                    if cached is not MISSING:
+                        return _copy_json(cached)
+
+                while (waiters := self._inflight_requests.get(key)) is not None:
+                    _log.debug("Joining in-flight request for %s %s.", route.method, route.url)
+                    waiter: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+                    waiters.append(waiter)
+                    result = await waiter
+                    if result is not MISSING:
+                        return result
+                    # The caller that sent the request was cancelled, so it is sent again.
+
+                waiters = self._inflight_requests[key] = []
+                generation = cache._generation if cache is not None else 0
+                try:
+                    result = await self._request(
+                        route, auth=auth, retry_request=retry_request, priority=priority, **kwargs
+                    )
+                except asyncio.CancelledError:
+                    self._finish_inflight_request(key, waiters, MISSING)
+                    raise
+                except Exception as exc:
+                    self._finish_inflight_request(key, waiters, MISSING, exc)
+                    raise
+
+                # Joined callers get their copies before this caller can change the response.
+                self._finish_inflight_request(key, waiters, result)
+                if ttl is not None and cache is not None:
+                    cache._set(cache_key, _copy_json(result), ttl, generation)
+                return result
+
+        try:
+            return await self._request(
+                route,
+                files=files,
+                form=form,
+                auth=auth,
+                retry_request=retry_request,
+                priority=priority,
+                **kwargs,
+            )
+        finally:
+            if cache is not None and route.method != "GET":
+                # Edits and deletions make cached responses of the resource and its parents stale.
+                cache.invalidate_url(route.url)
+
+    def _finish_inflight_request(
+        self,
+        key: Tuple[Any, ...],
+        waiters: List[asyncio.Future[Any]],
+        result: Any,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        if self._inflight_requests.get(key) is waiters:
+            del self._inflight_requests[key]
+
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if exception is not None:
+                waiter.set_exception(exception)
+            else:
+                waiter.set_result(result if result is MISSING else _copy_json(result))
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        files: Optional[Sequence[File]] = None,
+        form: Optional[Iterable[Dict[str, Any]]] = None,
+        auth: Optional[str] = MISSING,
+        retry_request: bool = True,
+        priority: Optional[RequestPriority] = None,
+        **kwargs: Any,
+    ) -> Any:
         await self.recreate()
 
         headers = self._make_headers(kwargs.pop("headers", {}), auth=auth)
@@ -768,6 +1421,14 @@ class HTTPClient:
 
         auth = headers.get("Authorization")
 
+        # RequestPriority.interaction is 0, so this can't use ``or`` chaining.
+        if priority is None:
+            priority = route.priority
+        if priority is None:
+            priority = _request_priority.get()
+        if priority is None:
+            priority = RequestPriority.user
+
         # If a global rate limit for this authorization doesn't exist yet, make it.
         if (global_rate_limit := self._global_rate_limits.get(auth)) is None:
             global_rate_limit = self._make_global_rate_limit(auth, self._max_global_requests)
@@ -785,195 +1446,234 @@ class HTTPClient:
         ret: Union[Optional[str], Dict[str, Any]] = None
         response: Optional[aiohttp.ClientResponse] = None
 
-        # If retry_request is False and any of the rate limits are locked, don't continue and raise immediately.
-        if retry_request is False:
-            if global_rate_limit.locked:
-                _log.info(
-                    "Path %s was called with retry_request=False while the global rate limit is locked.",
-                    rate_limit_path,
-                )
-                raise HTTPInternalRatelimitLocked(
-                    "Request would exceed the global ratelimit and retries are disabled."
-                )
+        # Request metrics, retry_count is also the loop variable below.
+        start, route_wait, global_wait, retry_count = time.perf_counter(), 0.0, 0.0, 0
+        exception: Optional[BaseException] = None
+        self._stats.in_flight += 1
 
-            if url_rate_limit.locked:
-                _log.info(
-                    "Path %s was called with retry_request=False while the URL rate limit is locked.",
-                    rate_limit_path,
-                )
-                raise HTTPInternalRatelimitLocked(
-                    "Request would exceed the route ratelimit and retries are disabled."
-                )
+        try:
+            # If retry_request is False and any of the rate limits are locked, don't continue and raise immediately.
+            if retry_request is False:
+                if global_rate_limit.locked:
+                    _log.info(
+                        "Path %s was called with retry_request=False while the global rate limit is locked.",
+                        rate_limit_path,
+                    )
+                    raise HTTPInternalRatelimitLocked(
+                        "Request would exceed the global ratelimit and retries are disabled."
+                    )
 
-        # The loop is to allow migration to a different RateLimit if needed.
-        # If we hit this loop max_retry_count times, something is wrong. Either we're migrating buckets way
-        #  too much, 429s keep getting hit, or something is internally wrong.
-        for retry_count in range(max_retry_count):  # To prevent infinite loops.
-            should_retry = False
-            try:
-                async with global_rate_limit, url_rate_limit:
-                    # This check is for asyncio.gather()'d requests where the rate limit can change.
-                    if (
-                        temp := self._get_url_rate_limit(route.method, route, auth)
-                    ) is not url_rate_limit and temp is not None:
-                        _log.debug(
-                            "Route %s had the rate limit changed, resetting and retrying.",
-                            rate_limit_path,
-                        )
-                        url_rate_limit = temp
-                        continue
+                if url_rate_limit.locked:
+                    _log.info(
+                        "Path %s was called with retry_request=False while the URL rate limit is locked.",
+                        rate_limit_path,
+                    )
+                    raise HTTPInternalRatelimitLocked(
+                        "Request would exceed the route ratelimit and retries are disabled."
+                    )
 
-                    if retry_count > 0 and files:
-                        for f in files:
-                            f.reset(seek=True)
-
-                    if form:
-                        form_data = aiohttp.FormData(quote_fields=False)
-                        for params in form:
-                            form_data.add_field(**params)
-                        kwargs["data"] = form_data
-
-                    async with self.__session.request(
-                        method=route.method,
-                        url=route.url,
-                        headers=headers,
-                        proxy=self._proxy,
-                        proxy_auth=self._proxy_auth,
-                        **kwargs,
-                    ) as response:
-                        _log.debug(
-                            "%s %s with %s has returned %s",
-                            route.method,
-                            route.url,
-                            kwargs.get("data"),
-                            response.status,
-                        )
+            # The loop is to allow migration to a different RateLimit if needed.
+            # If we hit this loop max_retry_count times, something is wrong. Either we're migrating buckets way
+            #  too much, 429s keep getting hit, or something is internally wrong.
+            for retry_count in range(max_retry_count):  # To prevent infinite loops.
+                should_retry = False
+                try:
+                    # The route rate limit is acquired first so that requests queued up behind a busy bucket don't
+                    #  use up the global rate limit while they wait, letting requests to other buckets through.
+                    async with (
+                        url_rate_limit.acquiring(priority) as url_waited,
+                        global_rate_limit.acquiring(priority) as global_waited,
+                    ):
+                        route_wait += url_waited
+                        global_wait += global_waited
+
+                        # This check is for asyncio.gather()'d requests where the rate limit can change.
+                        if (
+                            temp := self._get_url_rate_limit(route.method, route, auth)
+                        ) is not url_rate_limit and temp is not None:
+                            _log.debug(
+                                "Route %s had the rate limit changed, resetting and retrying.",
+                                rate_limit_path,
+                            )
+                            url_rate_limit = temp
+                            continue
+
+                        if retry_count > 0 and files:
+                            for f in files:
+                                f.reset(seek=True)
+
+                        if form:
+                            form_data = aiohttp.FormData(quote_fields=False)
+                            for params in form:
+                                form_data.add_field(**params)
+                            kwargs["data"] = form_data
+
+                        async with self.__session.request(
+                            method=route.method,
+                            url=route.url,
+                            headers=headers,
+                            proxy=self._proxy,
+                            proxy_auth=self._proxy_auth,
+                            **kwargs,
+                        ) as response:
+                            _log.debug(
+                                "%s %s with %s has returned %s",
+                                route.method,
+                                route.url,
+                                kwargs.get("data"),
+                                response.status,
+                            )
 
-                        await global_rate_limit.update(response)
-                        try:
-                            await url_rate_limit.update(response)
-                        except IncorrectBucket:
-                            # This condition can be met when doing asyncio.gather()'d requests.
-                            if (
-                                temp := self._buckets.get(
-                                    # Defaulting to "" makes pyright happy because None is an invalid type of key.
-                                    response.headers.get("X-RateLimit-Bucket", "")
-                                )
-                            ) is not None:
-                                _log.debug(
-                                    "Route %s was given a different bucket, found it.",
-                                    rate_limit_path,
-                                )
-                                url_rate_limit = temp
-                                self._set_url_rate_limit(route.method, route, auth, url_rate_limit)
-                                await url_rate_limit.update(response)
-                            else:
-                                url_rate_limit = self._make_url_rate_limit(
-                                    route.method, route, auth
-                                )
+                            await global_rate_limit.update(response)
+                            try:
                                 await url_rate_limit.update(response)
+                            except IncorrectBucket:
+                                self._stats.incorrect_buckets += 1
+                                # This condition can be met when doing asyncio.gather()'d requests.
+                                if (
+                                    temp := self._buckets.get(
+                                        # Defaulting to "" makes pyright happy because None is an invalid type of key.
+                                        response.headers.get("X-RateLimit-Bucket", "")
+                                    )
+                                ) is not None:
+                                    _log.debug(
+                                        "Route %s was given a different bucket, found it.",
+                                        rate_limit_path,
+                                    )
+                                    url_rate_limit = temp
+                                    self._set_url_rate_limit(
+                                        route.method, route, auth, url_rate_limit
+                                    )
+                                    await url_rate_limit.update(response)
+                                else:
+                                    url_rate_limit = self._make_url_rate_limit(
+                                        route.method, route, auth
+                                    )
+                                    await url_rate_limit.update(response)
+                                    _log.debug(
+                                        "Route %s was given a different bucket, made a new one: %s",
+                                        rate_limit_path,
+                                        url_rate_limit.bucket,
+                                    )
+
+                            if url_rate_limit.bucket is not None and self._buckets.get(
+                                url_rate_limit.bucket
+                            ) not in (url_rate_limit, None):
+                                # If the current RateLimit bucket name exists, but the stored RateLimit is not the
+                                #  current RateLimit, finish up and signal that the current bucket should be migrated
+                                #  to the stored one.
                                 _log.debug(
-                                    "Route %s was given a different bucket, made a new one: %s",
+                                    "Route %s with bucket %s already exists, migrating other possible requests to "
+                                    "that bucket.",
                                     rate_limit_path,
                                     url_rate_limit.bucket,
                                 )
-
-                        if url_rate_limit.bucket is not None and self._buckets.get(
-                            url_rate_limit.bucket
-                        ) not in (url_rate_limit, None):
-                            # If the current RateLimit bucket name exists, but the stored RateLimit is not the
-                            #  current RateLimit, finish up and signal that the current bucket should be migrated
-                            #  to the stored one.
-                            _log.debug(
-                                "Route %s with bucket %s already exists, migrating other possible requests to "
-                                "that bucket.",
-                                rate_limit_path,
-                                url_rate_limit.bucket,
-                            )
-                            correct_rate_limit = self._buckets[url_rate_limit.bucket]
-                            self._set_url_rate_limit(route.method, route, auth, correct_rate_limit)
-                            if correct_rate_limit.bucket:
-                                # Signals to all requests waiting to acquire to migrate.
-                                url_rate_limit.migrate_to(correct_rate_limit.bucket)
-                            else:
-                                raise ValueError(
-                                    f"Migrating to bucket {correct_rate_limit.bucket}, but "
-                                    f"correct_rate_limit.bucket is falsey. This is likely an internal Nextcord "
-                                    f"issue and should be reported."
+                                correct_rate_limit = self._buckets[url_rate_limit.bucket]
+                                self._set_url_rate_limit(
+                                    route.method, route, auth, correct_rate_limit
                                 )
-                            # Update the correct RateLimit object with our findings.
-                            await correct_rate_limit.update(response)
-                        elif url_rate_limit.bucket is not None:
-                            self._buckets[url_rate_limit.bucket] = url_rate_limit
-
-                        # even errors have text involved in them so this is safe to call
-                        ret = await json_or_text(response)
-
-                        # This will raise HTTP exceptions as needed.
-                        should_retry = await self._handle_http_response_errors(
-                            response=response,
-                            return_value=ret,
-                            rate_limit_path=rate_limit_path,
-                            retry_request=retry_request,
-                            retry_count=retry_count,
-                            url_rate_limit=url_rate_limit,
-                            global_rate_limit=global_rate_limit,
-                        )
+                                if correct_rate_limit.bucket:
+                                    # Signals to all requests waiting to acquire to migrate.
+                                    url_rate_limit.migrate_to(correct_rate_limit.bucket)
+                                else:
+                                    raise ValueError(
+                                        f"Migrating to bucket {correct_rate_limit.bucket}, but "
+                                        f"correct_rate_limit.bucket is falsey. This is likely an internal Nextcord "
+                                        f"issue and should be reported."
+                                    )
+                                # Update the correct RateLimit object with our findings.
+                                await correct_rate_limit.update(response)
+                            elif url_rate_limit.bucket is not None:
+                                self._buckets[url_rate_limit.bucket] = url_rate_limit
+
+                            # even errors have text involved in them so this is safe to call
+                            ret = await json_or_text(response)
+
+                            # This will raise HTTP exceptions as needed.
+                            should_retry = await self._handle_http_response_errors(
+                                response=response,
+                                return_value=ret,
+                                rate_limit_path=rate_limit_path,
+                                retry_request=retry_request,
+                                retry_count=retry_count,
+                                url_rate_limit=url_rate_limit,
+                                global_rate_limit=global_rate_limit,
+                            )
 
-            # This is handling exceptions from the request
-            except OSError as e:
-                # Connection reset by peer
-                if retry_count < max_retry_count - 1 and e.errno in (54, 10054):
-                    await asyncio.sleep(1 + retry_count * 2)
-                    continue
+                # This is handling exceptions from the request
+                except OSError as e:
+                    # Connection reset by peer
+                    if retry_count < max_retry_count - 1 and e.errno in (54, 10054):
+                        await asyncio.sleep(1 + retry_count * 2)
+                        continue
 
-                raise
+                    raise
+
+                except RateLimitMigrating as e:
+                    self._stats.migrations += 1
+                    if url_rate_limit.migrating is None:
+                        raise ValueError(
+                            "RateLimitMigrating raised, but RateLimit.migrating is None. This is an internal Nextcord "
+                            "error and should be reported!"
+                        ) from e
+
+                    old_rate_limit = url_rate_limit
+                    url_rate_limit = self._buckets.get(url_rate_limit.migrating)
+                    if url_rate_limit is None:
+                        # This means we have an internal issue that we need to fix.
+                        _log.error(
+                            "RateLimit said to migrate, but the RateLimit to migrate to was not found. This is an "
+                            "internal Nextcord error and should be reported.\n"
+                            "Migrating RateLimit.migrate_to: %s\n"
+                            "Migrating RateLimit.bucket: %s\n"
+                            "Route: %s",
+                            old_rate_limit.migrating,
+                            old_rate_limit.bucket,
+                            route,
+                            exc_info=e,
+                        )
+                        raise ValueError(
+                            "RateLimit said to migrate, but the RateLimit to migrate was not found? This is an "
+                            "internal Nextcord error and should be reported!"
+                        ) from e
 
-            except RateLimitMigrating as e:
-                if url_rate_limit.migrating is None:
-                    raise ValueError(
-                        "RateLimitMigrating raised, but RateLimit.migrating is None. This is an internal Nextcord "
-                        "error and should be reported!"
-                    ) from e
+                else:
+                    if not should_retry:
+                        break
 
-                old_rate_limit = url_rate_limit
-                url_rate_limit = self._buckets.get(url_rate_limit.migrating)
-                if url_rate_limit is None:
-                    # This means we have an internal issue that we need to fix.
+                if retry_count >= max_retry_count - 1:
                     _log.error(
-                        "RateLimit said to migrate, but the RateLimit to migrate to was not found. This is an "
-                        "internal Nextcord error and should be reported.\n"
-                        "Migrating RateLimit.migrate_to: %s\n"
-                        "Migrating RateLimit.bucket: %s\n"
-                        "Route: %s",
-                        old_rate_limit.migrating,
-                        old_rate_limit.bucket,
-                        route,
-                        exc_info=e,
+                        "Hit retry %s/%s on %s, either something is wrong with Discord or Nextcord.",
+                        retry_count + 1,
+                        max_retry_count,
+                        rate_limit_path,
                     )
-                    raise ValueError(
-                        "RateLimit said to migrate, but the RateLimit to migrate was not found? This is an "
-                        "internal Nextcord error and should be reported!"
-                    ) from e
+                    if response is not None:
+                        if response.status >= 500:
+                            raise DiscordServerError(response, ret)
 
-            else:
-                if not should_retry:
-                    break
+                        raise HTTPException(response, ret)
 
-            if retry_count >= max_retry_count - 1:
-                _log.error(
-                    "Hit retry %s/%s on %s, either something is wrong with Discord or Nextcord.",
-                    retry_count + 1,
-                    max_retry_count,
-                    rate_limit_path,
+            return ret
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            self._stats.in_flight -= 1
+            self._record_request(
+                RequestMetrics(
+                    route.method,
+                    route.path,
+                    # None if the rate limit to migrate to went missing.
+                    getattr(url_rate_limit, "bucket", None),
+                    None if response is None else response.status,
+                    time.perf_counter() - start,
+                    route_wait,
+                    global_wait,
+                    retry_count,
+                    exception,
                 )
-                if response is not None:
-                    if response.status >= 500:
-                        raise DiscordServerError(response, ret)
-
-                    raise HTTPException(response, ret)
-
-        return ret
+            )
 
     # This exists to make the main request function smaller and easier to work with.
     # I'm on a 1440p 21:9 monitor and even with PyCharm split into multiple panes, the request method with all of
@@ -1051,6 +1751,7 @@ class HTTPClient:
                     response.headers.get("X-RateLimit-Global") != "true"
                     and response.headers.get("X-RateLimit-Scope") != "global"
                 ):
+                    self._stats.ratelimited += 1
                     self._dispatch(
                         "http_ratelimit",
                         url_rate_limit.limit,
@@ -1060,6 +1761,7 @@ class HTTPClient:
                         response.headers.get("X-RateLimit-Scope"),
                     )
                 else:
+                    self._stats.global_ratelimited += 1
                     self._dispatch("global_http_ratelimit", global_rate_limit.reset_after)
 
                 if not response.headers.get("Via") or isinstance(return_value, str):
@@ -1090,9 +1792,28 @@ class HTTPClient:
         return should_retry
 
     async def get_from_cdn(self, url: str) -> bytes:
-        async with self.__session.get(url) as resp:
+        cache = self._response_cache
+        entry = cache._get_asset(url) if cache is not None else None
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.expires > time.monotonic():
+                return entry.data
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        async with self.__session.get(url, headers=headers) as resp:
+            if resp.status == 304 and entry is not None:
+                cache._refresh_asset(url, entry)  # pyright: ignore [reportOptionalMemberAccess]
+                return entry.data
             if resp.status == 200:
-                return await resp.read()
+                data = await resp.read()
+                if cache is not None:
+                    cache._set_asset(
+                        url, data, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+                    )
+                return data
             if resp.status == 404:
                 raise NotFound(resp, "asset not found")
             if resp.status == 403:
@@ -4480,18 +5201,23 @@ class HTTPClient:
         )
 
     @staticmethod
-    def format_websocket_url(url: str, encoding: str = "json", zlib: bool = True) -> str:
-        if zlib:
-            value = "{url}?encoding={encoding}&v={version}&compress=zlib-stream"
+    def format_websocket_url(
+        url: str, encoding: str = "json", zlib: bool = True, *, compress: Optional[str] = MISSING
+    ) -> str:
+        if compress is MISSING:
+            compress = "zlib-stream" if zlib else None
+        if compress:
+            value = "{url}?encoding={encoding}&v={version}&compress={compress}"
         else:
             value = "{url}?encoding={encoding}&v={version}"
-        return value.format(url=url, encoding=encoding, version=_API_VERSION)
+        return value.format(url=url, encoding=encoding, version=_API_VERSION, compress=compress)
 
     async def get_gateway(
         self,
         *,
         encoding: str = "json",
         zlib: bool = True,
+        compress: Optional[str] = MISSING,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
     ) -> str:
@@ -4504,13 +5230,14 @@ class HTTPClient:
         except HTTPException as exc:
             raise GatewayNotFound from exc
 
-        return self.format_websocket_url(data["url"], encoding, zlib)
+        return self.format_websocket_url(data["url"], encoding, zlib, compress=compress)
 
     async def get_bot_gateway(
         self,
         *,
         encoding: str = "json",
         zlib: bool = True,
+        compress: Optional[str] = MISSING,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
     ) -> Tuple[int, str]:
@@ -4523,7 +5250,9 @@ class HTTPClient:
         except HTTPException as exc:
             raise GatewayNotFound from exc
 
-        return data["shards"], self.format_websocket_url(data["url"], encoding, zlib)
+        return data["shards"], self.format_websocket_url(
+            data["url"], encoding, zlib, compress=compress
+        )
 
     def get_user(
         self,
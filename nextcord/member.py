@@ -343,10 +343,12 @@ class Member(abc.Messageable, _UserTag):
     def _copy(cls, member: Self) -> Self:
         self = cls.__new__(cls)  # to bypass __init__
 
-        self._roles = utils.SnowflakeList(member._roles, is_sorted=True)
+        # Updates replace the roles and client status instead of changing them in place,
+        # so copies share them until the original is updated.
+        self._roles = member._roles
         self.joined_at = member.joined_at
         self.premium_since = member.premium_since
-        self._client_status = member._client_status.copy()
+        self._client_status = member._client_status
         self.guild = member.guild
         self.nick = member.nick
         self.pending = member.pending
@@ -428,7 +430,7 @@ class Member(abc.Messageable, _UserTag):
     @status.setter
     def status(self, value: Status) -> None:
         # internal use only
-        self._client_status[None] = str(value)
+        self._client_status = {**self._client_status, None: str(value)}
 
     @property
     def mobile_status(self) -> Status:
@@ -0,0 +1,334 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import datetime
+import sys
+import weakref
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Tuple,
+)
+
+from . import utils
+from .member import Member
+
+if TYPE_CHECKING:
+    from .activity import ActivityTypes
+    from .guild import Guild
+    from .state import ConnectionState
+    from .user import User
+
+__all__ = ("CompactMemberStore",)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_NO_TIME = -(2**63)
+_OFFLINE: Dict[Optional[str], str] = {None: "offline"}
+
+
+def _encode_time(value: Optional[datetime.datetime]) -> int:
+    return _NO_TIME if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_time(value: int) -> Optional[datetime.datetime]:
+    return None if value == _NO_TIME else _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# {"Member attribute": (column, encode, decode)} of the attributes kept in plain columns.
+_COLUMNS: Dict[str, Tuple[str, Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "joined_at": ("_joined_at", _encode_time, _decode_time),
+    "premium_since": ("_premium_since", _encode_time, _decode_time),
+    "_timeout": ("_timeout", _encode_time, _decode_time),
+    "_flags": ("_flags", _identity, _identity),
+    "pending": ("_pending", int, bool),
+    "nick": ("_nicks", _intern, _identity),
+    "_avatar": ("_avatars", _identity, _identity),
+    "_banner": ("_banners", _identity, _identity),
+}
+# The Member attributes that views read from their store.
+_STORED = (*_COLUMNS, "_roles", "_client_status", "activities", "_user")
+
+
+class _MemberView(Member):
+    # A member whose attributes are read from a CompactMemberStore. Once the member is
+    # removed from the store, its attributes are copied into the slots inherited from
+    # Member and read from there.
+
+    __slots__ = ("_store", "_id", "__weakref__")
+
+    if TYPE_CHECKING:
+        _store: Optional[CompactMemberStore]
+        _id: int
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @classmethod
+    def _copy(cls, member: Member) -> Member:
+        # Copies are snapshots, which must not write to the store.
+        return Member._copy(member)
+
+    def _detach(self) -> None:
+        values = [getattr(self, name) for name in _STORED]
+        self._store = None
+        for name, value in zip(_STORED, values, strict=True):
+            setattr(self, name, value)
+
+
+def _stored_attribute(
+    name: str, get: Callable[[CompactMemberStore, int], Any], set: Callable[..., None]
+) -> property:
+    slot = Member.__dict__[name]
+
+    def getter(self: _MemberView) -> Any:
+        store = self._store
+        if store is None:
+            return slot.__get__(self, _MemberView)
+        return get(store, store._rows[self._id])
+
+    def setter(self: _MemberView, value: Any) -> None:
+        store = self._store
+        if store is None:
+            slot.__set__(self, value)
+        else:
+            set(store, store._rows[self._id], value)
+
+    return property(getter, setter)
+
+
+def _column_attribute(
+    name: str, column: str, encode: Callable[[Any], Any], decode: Callable[[Any], Any]
+) -> property:
+    def get(store: CompactMemberStore, row: int) -> Any:
+        return decode(getattr(store, column)[row])
+
+    def set(store: CompactMemberStore, row: int, value: Any) -> None:
+        getattr(store, column)[row] = encode(value)
+
+    return _stored_attribute(name, get, set)
+
+
+for _name, (_column, _encode, _decode) in _COLUMNS.items():
+    setattr(_MemberView, _name, _column_attribute(_name, _column, _encode, _decode))
+
+
+def _presence_attribute(name: str, position: int, default: Callable[[], Any]) -> property:
+    def getter(self: _MemberView) -> Any:
+        store = self._store
+        if store is None:
+            return slot.__get__(self, _MemberView)
+        presence = store._presences.get(self._id)
+        if presence is None:
+            return default()
+        return presence[position]
+
+    def setter(self: _MemberView, value: Any) -> None:
+        store = self._store
+        if store is None:
+            slot.__set__(self, value)
+            return
+        presence: List[Any] = list(store._presences.get(self._id, ({None: "offline"}, ())))
+        presence[position] = value
+        store._presences[self._id] = (presence[0], presence[1])
+
+    slot = Member.__dict__[name]
+    return property(getter, setter)
+
+
+_MemberView._client_status = _presence_attribute("_client_status", 0, _OFFLINE.copy)  # type: ignore
+_MemberView.activities = _presence_attribute("activities", 1, tuple)  # type: ignore
+
+
+class CompactMemberStore(MutableMapping[int, Member]):
+    """A store for the members of a guild that keeps them in columns of compact arrays.
+
+    Members are kept as their IDs, timestamps as integers, nicknames as interned strings and
+    roles as packed arrays shared by every member with the same roles. Only members with a
+    status or activities keep them in a dict. Looking up a member gives a lightweight
+    :class:`Member` that reads its attributes from the store, which changes to it are
+    written back to. The same object is given back while it is still referenced.
+
+    This is what :class:`MemoryCacheBackend` uses for members with ``compact_members``.
+
+    .. versionadded:: 3.3
+    """
+
+    def __init__(self) -> None:
+        self._guild: Optional[Guild] = None
+        self._state: Optional[ConnectionState] = None
+        self._rows: Dict[int, int] = {}
+        """{member ID: row}"""
+        self._ids: array[int] = array("q")
+        self._users: List[User] = []
+        self._joined_at: array[int] = array("q")
+        self._premium_since: array[int] = array("q")
+        self._timeout: array[int] = array("q")
+        self._flags: array[int] = array("q")
+        self._pending: bytearray = bytearray()
+        self._nicks: List[Optional[str]] = []
+        self._avatars: List[Optional[str]] = []
+        self._banners: List[Optional[str]] = []
+        self._role_set_of: array[int] = array("I")
+        """{row: role set}"""
+        self._role_sets: List[utils.SnowflakeList] = []
+        self._role_set_refs: List[int] = []
+        self._role_set_ids: Dict[bytes, int] = {}
+        """{packed roles: role set}"""
+        self._free_role_sets: List[int] = []
+        self._presences: Dict[int, Tuple[Dict[Optional[str], str], Tuple[ActivityTypes, ...]]] = {}
+        """{member ID: (client status, activities)} of members that aren't offline."""
+        self._views: weakref.WeakValueDictionary[int, _MemberView] = weakref.WeakValueDictionary()
+
+    def _acquire_role_set(self, roles: utils.SnowflakeList) -> int:
+        key = roles.tobytes()
+        index = self._role_set_ids.get(key)
+        if index is not None:
+            self._role_set_refs[index] += 1
+            return index
+
+        stored = utils.SnowflakeList(roles, is_sorted=True)
+        if self._free_role_sets:
+            index = self._free_role_sets.pop()
+            self._role_sets[index] = stored
+            self._role_set_refs[index] = 1
+        else:
+            index = len(self._role_sets)
+            self._role_sets.append(stored)
+            self._role_set_refs.append(1)
+        self._role_set_ids[key] = index
+        return index
+
+    def _release_role_set(self, index: int) -> None:
+        self._role_set_refs[index] -= 1
+        if not self._role_set_refs[index]:
+            del self._role_set_ids[self._role_sets[index].tobytes()]
+            self._role_sets[index] = utils.SnowflakeList((), is_sorted=True)
+            self._free_role_sets.append(index)
+
+    def _set_roles(self, row: int, roles: utils.SnowflakeList) -> None:
+        index = self._acquire_role_set(roles)
+        self._release_role_set(self._role_set_of[row])
+        self._role_set_of[row] = index
+
+    def _columns(self) -> Tuple[MutableSequence[Any], ...]:
+        return (
+            self._ids,
+            self._users,
+            self._role_set_of,
+            *(getattr(self, column) for column, _, _ in _COLUMNS.values()),
+        )
+
+    def _view(self, member_id: int) -> _MemberView:
+        member = self._views.get(member_id)
+        if member is None:
+            member = _MemberView.__new__(_MemberView)
+            member._store = self
+            member._id = member_id
+            member.guild = self._guild  # type: ignore
+            member._state = self._state  # type: ignore
+            self._views[member_id] = member
+        return member
+
+    def __getitem__(self, key: int) -> Member:
+        if key not in self._rows:
+            raise KeyError(key)
+        return self._view(key)
+
+    def get(self, key: int, default: Any = None) -> Any:
+        if key not in self._rows:
+            return default
+        return self._view(key)
+
+    def __setitem__(self, key: int, value: Member) -> None:
+        if isinstance(value, _MemberView) and value._store is self:
+            return
+
+        if self._guild is None:
+            self._guild = value.guild
+            self._state = value._state
+
+        row = self._rows.get(key)
+        if row is None:
+            self._rows[key] = len(self._ids)
+            self._ids.append(key)
+            self._users.append(value._user)
+            self._role_set_of.append(self._acquire_role_set(value._roles))
+            for name, (column, encode, _) in _COLUMNS.items():
+                getattr(self, column).append(encode(getattr(value, name)))
+        else:
+            self._users[row] = value._user
+            self._set_roles(row, value._roles)
+            for name, (column, encode, _) in _COLUMNS.items():
+                getattr(self, column)[row] = encode(getattr(value, name))
+
+        if value._client_status != _OFFLINE or value.activities:
+            self._presences[key] = (value._client_status, value.activities)
+        else:
+            self._presences.pop(key, None)
+
+    def __delitem__(self, key: int) -> None:
+        row = self._rows[key]
+        view = self._views.pop(key, None)
+        if view is not None:
+            view._detach()
+
+        del self._rows[key]
+        self._presences.pop(key, None)
+        self._release_role_set(self._role_set_of[row])
+
+        # Move the last row into the removed one, so that rows stay contiguous.
+        last = len(self._ids) - 1
+        columns = self._columns()
+        if row != last:
+            self._rows[self._ids[last]] = row
+            for column in columns:
+                column[row] = column[last]
+        for column in columns:
+            del column[last]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<CompactMemberStore len={len(self._rows)} role_sets={len(self._role_set_ids)}>"
+
+
+def _get_roles(store: CompactMemberStore, row: int) -> utils.SnowflakeList:
+    return utils.SnowflakeList(store._role_sets[store._role_set_of[row]], is_sorted=True)
+
+
+def _get_user(store: CompactMemberStore, row: int) -> User:
+    return store._users[row]
+
+
+def _set_user(store: CompactMemberStore, row: int, user: User) -> None:
+    store._users[row] = user
+
+
+_MemberView._roles = _stored_attribute("_roles", _get_roles, CompactMemberStore._set_roles)  # type: ignore
+_MemberView._user = _stored_attribute("_user", _get_user, _set_user)  # type: ignore
@@ -20,6 +20,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    TypeVar,
     Union,
     overload,
 )
@@ -76,6 +77,7 @@ if TYPE_CHECKING:
         Reaction as ReactionPayload,
         RoleSubscriptionData as RoleSubscriptionDataPayload,
     )
+    from .types.snowflake import SnowflakeList as SnowflakeListPayload
     from .types.threads import Thread as ThreadPayload, ThreadArchiveDuration
     from .types.user import User as UserPayload
     from .ui.view import View
@@ -96,6 +98,9 @@ __all__ = (
     "PartialMessage",
 )
 
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
 
 def convert_emoji_reaction(emoji):
     if isinstance(emoji, Reaction):
@@ -525,7 +530,7 @@ class MessageReference:
         self = cls.__new__(cls)
         self.type = MessageReferenceType(data.get("type", 0))
         self.message_id = utils.get_as_snowflake(data, "message_id")
-        self.channel_id = int(data.pop("channel_id"))
+        self.channel_id = int(data.get("channel_id", 0))
         self.guild_id = utils.get_as_snowflake(data, "guild_id")
         self.fail_if_not_exists = data.get("fail_if_not_exists", True)
         self._state = state
@@ -604,6 +609,23 @@ class MessageReference:
     to_message_reference_dict = to_dict
 
 
+class _LazySlotProperty(utils.CachedSlotProperty[T, T_co]):
+    # A cached slot property that can also be assigned, for attributes that are built
+    # from the payload on first access but are replaced when the message is edited.
+
+    def __set__(self, instance: T, value: Any) -> None:
+        setattr(instance, self.name, value)
+
+
+def _lazy_slot_property(
+    name: str,
+) -> Callable[[Callable[[T], T_co]], _LazySlotProperty[T, T_co]]:
+    def decorator(func: Callable[[T], T_co]) -> _LazySlotProperty[T, T_co]:
+        return _LazySlotProperty(name, func)
+
+    return decorator
+
+
 def flatten_handlers(cls):
     prefix = len("_handle_")
     handlers = [
@@ -1091,31 +1113,32 @@ class Message(Hashable):
         "_cs_raw_role_mentions",
         "_cs_system_content",
         "_edited_timestamp",
+        "_lazy_data",
+        "_lz_attachments",
+        "_lz_call",
+        "_lz_components",
+        "_lz_embeds",
+        "_lz_interaction",
+        "_lz_interaction_metadata",
+        "_lz_mentions",
+        "_lz_reactions",
+        "_lz_reference",
+        "_lz_role_mentions",
+        "_lz_role_subscription",
+        "_lz_snapshots",
+        "_lz_stickers",
         "_state",
         "activity",
         "application",
-        "attachments",
         "author",
-        "call",
         "channel",
-        "components",
         "content",
-        "embeds",
         "flags",
         "guild",
         "id",
-        "interaction",
-        "interaction_metadata",
         "mention_everyone",
-        "mentions",
         "nonce",
         "pinned",
-        "reactions",
-        "reference",
-        "role_mentions",
-        "role_subscription",
-        "snapshots",
-        "stickers",
         "tts",
         "type",
         "webhook_id",
@@ -1125,10 +1148,24 @@ class Message(Hashable):
         _HANDLERS: ClassVar[List[Tuple[str, Callable[..., None]]]]
         _CACHED_SLOTS: ClassVar[List[str]]
         guild: Optional[Guild]
-        reference: Optional[MessageReference]
-        mentions: List[Union[User, Member]]
         author: Union[User, Member]
-        role_mentions: List[Role]
+
+    # Built from the payload when first accessed if the state has lazy_message_fields set.
+    _LAZY_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "reactions",
+        "attachments",
+        "embeds",
+        "stickers",
+        "components",
+        "call",
+        "snapshots",
+        "reference",
+        "mentions",
+        "role_mentions",
+        "interaction",
+        "interaction_metadata",
+        "role_subscription",
+    )
 
     def __init__(
         self,
@@ -1140,13 +1177,6 @@ class Message(Hashable):
         self._state: ConnectionState = state
         self.id: int = int(data["id"])
         self.webhook_id: Optional[int] = utils.get_as_snowflake(data, "webhook_id")
-        self.reactions: List[Reaction] = [
-            Reaction(message=self, data=d) for d in data.get("reactions", [])
-        ]
-        self.attachments: List[Attachment] = [
-            Attachment(data=a, state=self._state) for a in data["attachments"]
-        ]
-        self.embeds: List[Embed] = [Embed.from_dict(a) for a in data["embeds"]]
         self.application: Optional[MessageApplicationPayload] = data.get("application")
         self.activity: Optional[MessageActivityPayload] = data.get("activity")
         self.channel: MessageableChannel = channel
@@ -1160,18 +1190,8 @@ class Message(Hashable):
         self.tts: bool = data["tts"]
         self.content: str = data["content"]
         self.nonce: Optional[Union[int, str]] = data.get("nonce")
-        self.stickers: List[StickerItem] = [
-            StickerItem(data=d, state=state) for d in data.get("sticker_items", [])
-        ]
-        self.components: list[Component] = [
-            resolve_component(comp_data) for comp_data in data.get("components", [])
-        ]
         self._background_tasks: Set[asyncio.Task[None]] = set()
 
-        self.call: Optional[MessageCall] = None
-        if _call := data.get("call"):
-            self.call = MessageCall(state=state, data=_call)
-
         try:
             # if the channel doesn't have a guild attribute, we handle that
             self.guild = channel.guild  # type: ignore
@@ -1188,50 +1208,16 @@ class Message(Hashable):
         ):
             self.guild._store_thread(thread_data)
 
-        self.snapshots: List[MessageSnapshot] = [
-            MessageSnapshot(state=self._state, data=s) for s in data.get("message_snapshots", [])
-        ]
-
-        self.reference = None
-        if ref := data.get("message_reference"):
-            self.reference = ref = MessageReference.with_state(state, ref)
-
-            if "referenced_message" in data:
-                resolved = data["referenced_message"]
-                if resolved is None:
-                    ref.resolved = DeletedReferencedMessage(ref)
-                else:
-                    # Right now the channel IDs match but maybe in the future they won't.
-                    if ref.channel_id == channel.id:
-                        chan = channel
-                    else:
-                        chan, _ = state._get_guild_channel(resolved)
-
-                    # the channel will be the correct type here
-                    ref.resolved = self.__class__(channel=chan, data=resolved, state=state)  # type: ignore
-
-        for handler in ("author", "member", "mentions", "mention_roles"):
+        for handler in ("author", "member"):
             if handler in data:
                 # Even after this check, pyright believes this may error out.
                 getattr(self, f"_handle_{handler}")(data[handler])  # pyright: ignore
 
-        self.interaction: Optional[MessageInteraction] = (
-            MessageInteraction(data=data["interaction"], guild=self.guild, state=self._state)
-            if "interaction" in data
-            else None
-        )
-        self.interaction_metadata: Optional[MessageInteractionMetadata] = (
-            MessageInteractionMetadata(
-                data=data["interaction_metadata"], guild=self.guild, state=self._state
-            )
-            if "interaction_metadata" in data
-            else None
-        )
-        self.role_subscription: Optional[MessageRoleSubscription] = (
-            MessageRoleSubscription(data=data["role_subscription_data"])
-            if "role_subscription_data" in data
-            else None
-        )
+        self._lazy_data: MessagePayload = data
+        if not getattr(state, "lazy_message_fields", False):
+            for name in self._LAZY_FIELDS:
+                getattr(self, name)
+            del self._lazy_data
 
     def __repr__(self) -> str:
         name = self.__class__.__name__
@@ -1389,7 +1375,7 @@ class Message(Hashable):
             else:
                 r.append(Member._try_upgrade(data=mention, guild=guild, state=state))
 
-    def _handle_mention_roles(self, role_mentions: List[int]) -> None:
+    def _handle_mention_roles(self, role_mentions: SnowflakeListPayload) -> None:
         self.role_mentions = []
         if isinstance(self.guild, Guild):
             for role_id in map(int, role_mentions):
@@ -1404,6 +1390,98 @@ class Message(Hashable):
         if thread:
             self.guild._store_thread(thread)  # type: ignore
 
+    @_lazy_slot_property("_lz_reactions")
+    def reactions(self) -> List[Reaction]:
+        return [Reaction(message=self, data=d) for d in self._lazy_data.get("reactions", [])]
+
+    @_lazy_slot_property("_lz_attachments")
+    def attachments(self) -> List[Attachment]:
+        return [Attachment(data=a, state=self._state) for a in self._lazy_data["attachments"]]
+
+    @_lazy_slot_property("_lz_embeds")
+    def embeds(self) -> List[Embed]:
+        return [Embed.from_dict(a) for a in self._lazy_data["embeds"]]
+
+    @_lazy_slot_property("_lz_stickers")
+    def stickers(self) -> List[StickerItem]:
+        return [
+            StickerItem(data=d, state=self._state) for d in self._lazy_data.get("sticker_items", [])
+        ]
+
+    @_lazy_slot_property("_lz_components")
+    def components(self) -> List[Component]:
+        return [resolve_component(comp_data) for comp_data in self._lazy_data.get("components", [])]
+
+    @_lazy_slot_property("_lz_call")
+    def call(self) -> Optional[MessageCall]:
+        if call := self._lazy_data.get("call"):
+            return MessageCall(state=self._state, data=call)
+        return None
+
+    @_lazy_slot_property("_lz_snapshots")
+    def snapshots(self) -> List[MessageSnapshot]:
+        return [
+            MessageSnapshot(state=self._state, data=s)
+            for s in self._lazy_data.get("message_snapshots", [])
+        ]
+
+    @_lazy_slot_property("_lz_reference")
+    def reference(self) -> Optional[MessageReference]:
+        data = self._lazy_data
+        if not (ref_data := data.get("message_reference")):
+            return None
+
+        state = self._state
+        ref = MessageReference.with_state(state, ref_data)
+        if "referenced_message" in data:
+            resolved = data["referenced_message"]
+            if resolved is None:
+                ref.resolved = DeletedReferencedMessage(ref)
+            else:
+                # Right now the channel IDs match but maybe in the future they won't.
+                if ref.channel_id == self.channel.id:
+                    chan = self.channel
+                else:
+                    chan, _ = state._get_guild_channel(resolved)
+
+                # the channel will be the correct type here
+                ref.resolved = self.__class__(channel=chan, data=resolved, state=state)  # type: ignore
+        return ref
+
+    @_lazy_slot_property("_lz_mentions")
+    def mentions(self) -> List[Union[User, Member]]:
+        # Upgrading mentions to members pops from their payloads, which copies of this
+        # message may still have to build their own mentions from.
+        self._handle_mentions([m and m.copy() for m in self._lazy_data.get("mentions", [])])
+        return self.mentions
+
+    @_lazy_slot_property("_lz_role_mentions")
+    def role_mentions(self) -> List[Role]:
+        self._handle_mention_roles(self._lazy_data.get("mention_roles", []))
+        return self.role_mentions
+
+    @_lazy_slot_property("_lz_interaction")
+    def interaction(self) -> Optional[MessageInteraction]:
+        if "interaction" not in self._lazy_data:
+            return None
+        return MessageInteraction(
+            data=self._lazy_data["interaction"], guild=self.guild, state=self._state
+        )
+
+    @_lazy_slot_property("_lz_interaction_metadata")
+    def interaction_metadata(self) -> Optional[MessageInteractionMetadata]:
+        if "interaction_metadata" not in self._lazy_data:
+            return None
+        return MessageInteractionMetadata(
+            data=self._lazy_data["interaction_metadata"], guild=self.guild, state=self._state
+        )
+
+    @_lazy_slot_property("_lz_role_subscription")
+    def role_subscription(self) -> Optional[MessageRoleSubscription]:
+        if "role_subscription_data" not in self._lazy_data:
+            return None
+        return MessageRoleSubscription(data=self._lazy_data["role_subscription_data"])
+
     def _rebind_cached_references(
         self, new_guild: Guild, new_channel: Union[TextChannel, Thread]
     ) -> None:
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+__all__ = ()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _CallStats:
+    __slots__ = (
+        "calls",
+        "wall_time",
+        "max_wall_time",
+        "cpu_time",
+        "max_cpu_time",
+        "allocated_blocks",
+    )
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.wall_time: float = 0.0
+        self.max_wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self.max_cpu_time: float = 0.0
+        self.allocated_blocks: int = 0
+        """The net amount of memory blocks allocated, which can be negative."""
+
+    def record(self, wall_time: float, cpu_time: float, allocated_blocks: int) -> None:
+        self.calls += 1
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+        self.allocated_blocks += allocated_blocks
+        self.max_wall_time = max(self.max_wall_time, wall_time)
+        self.max_cpu_time = max(self.max_cpu_time, cpu_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "max_wall_time": self.max_wall_time,
+            "cpu_time": self.cpu_time,
+            "max_cpu_time": self.max_cpu_time,
+            "allocated_blocks": self.allocated_blocks,
+        }
+
+
+class EventProfiler:
+    """Times the gateway event parsers of a :class:`ConnectionState` and the events
+    dispatched by a :class:`Client`, grouped by event name.
+
+    Parsers are keyed by gateway event name, such as ``"PRESENCE_UPDATE"``, and dispatches
+    by client event name, such as ``"presence_update"``. Only the time spent in the call
+    itself is recorded, not the event handlers that dispatching schedules.
+    """
+
+    def __init__(self) -> None:
+        self.parsers: Dict[str, _CallStats] = {}
+        self.dispatches: Dict[str, _CallStats] = {}
+
+    def _record(
+        self, stats: Dict[str, _CallStats], name: str, wall: float, cpu: float, blocks: int
+    ) -> None:
+        wall = time.perf_counter() - wall
+        cpu = time.thread_time() - cpu
+        blocks = sys.getallocatedblocks() - blocks
+        if (entry := stats.get(name)) is None:
+            entry = stats[name] = _CallStats()
+        entry.record(wall, cpu, blocks)
+
+    def wrap_parser(self, event: str, func: Callable[[Any], None]) -> Callable[[Any], None]:
+        def parser(data: Any) -> None:
+            blocks = sys.getallocatedblocks()
+            cpu = time.thread_time()
+            wall = time.perf_counter()
+            try:
+                func(data)
+            finally:
+                self._record(self.parsers, event, wall, cpu, blocks)
+
+        return parser
+
+    def wrap_dispatch(self, func: F) -> F:
+        def dispatch(event: str, *args: Any, **kwargs: Any) -> None:
+            blocks = sys.getallocatedblocks()
+            cpu = time.thread_time()
+            wall = time.perf_counter()
+            try:
+                func(event, *args, **kwargs)
+            finally:
+                self._record(self.dispatches, event, wall, cpu, blocks)
+
+        return dispatch  # type: ignore
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "parsers": {event: stats.to_dict() for event, stats in self.parsers.items()},
+            "dispatch": {event: stats.to_dict() for event, stats in self.dispatches.items()},
+        }
+
+    def reset(self) -> None:
+        self.parsers = {}
+        self.dispatches = {}
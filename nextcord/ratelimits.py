@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Protocol, Tuple
+
+from . import utils
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = (
+    "RateLimitStore",
+    "MemoryRateLimitStore",
+    "UnixSocketRateLimitStore",
+    "serve_rate_limit_store",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class RateLimitStore(Protocol):
+    """A protocol for sharing rate limit state between multiple :class:`HTTPClient` instances,
+    for example when several processes run shards of the same bot.
+
+    Keys identify a rate limit and are the same for every process using the same token.
+
+    .. versionadded:: 3.3
+    """
+
+    async def reserve(self, key: str, limit: int, per: float) -> float:
+        """|coro|
+
+        Tries to reserve a request for the given rate limit, which allows ``limit`` requests
+        every ``per`` seconds.
+
+        Returns
+        -------
+        :class:`float`
+            ``0.0`` if the request was reserved, otherwise the amount of seconds to wait
+            before trying again.
+        """
+        ...
+
+    async def block(self, key: str, delay: float) -> None:
+        """|coro|
+
+        Prevents any request from being reserved for the given rate limit for ``delay`` seconds,
+        for example after hitting a 429 or running out of remaining requests.
+        """
+        ...
+
+
+class MemoryRateLimitStore:
+    """A :class:`RateLimitStore` that keeps rate limit windows in memory.
+
+    This is only shared between clients in the same process, but it is also what
+    :func:`serve_rate_limit_store` uses to coordinate other processes.
+
+    .. versionadded:: 3.3
+    """
+
+    _prune_threshold = 4096
+
+    def __init__(self) -> None:
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        """{"key": (window end, requests used)}"""
+
+    def _prune(self, now: float) -> None:
+        self._windows = {key: value for key, value in self._windows.items() if value[0] > now}
+
+    async def reserve(self, key: str, limit: int, per: float) -> float:
+        now = time.monotonic()
+        end, used = self._windows.get(key, (0.0, 0))
+        if now >= end:
+            if len(self._windows) >= self._prune_threshold:
+                self._prune(now)
+            end, used = now + per, 0
+
+        if used < limit:
+            self._windows[key] = (end, used + 1)
+            return 0.0
+
+        return end - now
+
+    async def block(self, key: str, delay: float) -> None:
+        end = time.monotonic() + delay
+        current_end, _ = self._windows.get(key, (0.0, 0))
+        self._windows[key] = (max(end, current_end), sys.maxsize)
+
+
+class UnixSocketRateLimitStore:
+    """A :class:`RateLimitStore` that coordinates with a store served by :func:`serve_rate_limit_store`
+    over a Unix socket, letting multiple processes on the same host share rate limits.
+
+    Requests are pipelined over a single connection, so concurrent requests don't wait for
+    each other's responses. If the socket can't be reached, requests fall back to only being
+    limited by the rate limits of their own process until the connection can be made again.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix socket to connect to.
+    retry_delay: :class:`float`
+        The amount of seconds to wait before reconnecting after the connection failed.
+    """
+
+    def __init__(self, path: str, *, retry_delay: float = 5.0) -> None:
+        self.path: str = path
+        self.retry_delay: float = retry_delay
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._pending: Deque[asyncio.Future[Optional[Dict[str, Any]]]] = deque()
+        """Requests waiting for a response, which the store sends back in the same order."""
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
+        self._retry_at: float = 0.0
+
+    async def _connect(self) -> Optional[asyncio.StreamWriter]:
+        async with self._connect_lock:
+            if self._writer is not None:
+                return self._writer
+
+            if time.monotonic() < self._retry_at:
+                return None
+
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError as exc:
+                _log.warning(
+                    "Could not connect to the rate limit store at %s, retrying in %s seconds: %s",
+                    self.path,
+                    self.retry_delay,
+                    exc,
+                )
+                self._retry_at = time.monotonic() + self.retry_delay
+                return None
+
+            self._writer = writer
+            self._reader_task = asyncio.create_task(
+                self._read(reader, writer), name="nextcord: rate limit store reader"
+            )
+            return writer
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending = self._pending
+        try:
+            while line := await reader.readline():
+                future = pending.popleft()
+                if not future.done():
+                    future.set_result(utils.from_json(line))
+            raise ConnectionResetError("rate limit store closed the connection")
+        except (OSError, ValueError, IndexError) as exc:
+            if self._writer is writer:
+                _log.warning("Lost connection to the rate limit store at %s: %s", self.path, exc)
+                self._retry_at = time.monotonic() + self.retry_delay
+            self._disconnect(writer)
+
+    def _disconnect(self, writer: asyncio.StreamWriter) -> None:
+        if self._writer is not writer:
+            return
+
+        self._writer = None
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        self._reader_task = None
+        writer.close()
+
+        # Requests that were sent without a response fall back to the local rate limits.
+        pending = self._pending
+        while pending:
+            future = pending.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    async def _request(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Requests are pipelined over a single connection, so they don't wait for each other.
+        writer = self._writer or await self._connect()
+        if writer is None:
+            return None
+
+        future: asyncio.Future[Optional[Dict[str, Any]]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.append(future)
+        try:
+            writer.write(utils.to_json(payload).encode("utf-8") + b"\n")
+            await writer.drain()
+        except OSError as exc:
+            _log.warning("Lost connection to the rate limit store at %s: %s", self.path, exc)
+            self._retry_at = time.monotonic() + self.retry_delay
+            self._disconnect(writer)
+
+        return await future
+
+    async def reserve(self, key: str, limit: int, per: float) -> float:
+        data = await self._request({"op": "reserve", "key": key, "limit": limit, "per": per})
+        return 0.0 if data is None else data["delay"]
+
+    async def block(self, key: str, delay: float) -> None:
+        await self._request({"op": "block", "key": key, "delay": delay})
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the connection to the rate limit store.
+        """
+        writer = self._writer
+        if writer is not None:
+            self._disconnect(writer)
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+async def serve_rate_limit_store(
+    path: str, *, store: Optional[RateLimitStore] = None
+) -> asyncio.AbstractServer:
+    """|coro|
+
+    Serves a rate limit store over a Unix socket for :class:`UnixSocketRateLimitStore` to connect to.
+
+    This should be run once per host, either in a dedicated process or in one of the bot processes.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix socket to listen on.
+    store: Optional[:class:`RateLimitStore`]
+        The store to serve. Defaults to a new :class:`MemoryRateLimitStore`.
+
+    Returns
+    -------
+    :class:`asyncio.AbstractServer`
+        The running server.
+    """
+    if store is None:
+        store = MemoryRateLimitStore()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                data = utils.from_json(line)
+                if data["op"] == "reserve":
+                    delay = await store.reserve(data["key"], data["limit"], data["per"])
+                    response: Dict[str, Any] = {"delay": delay}
+                else:
+                    await store.block(data["key"], data["delay"])
+                    response = {}
+
+                writer.write(utils.to_json(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (OSError, ValueError, KeyError) as exc:
+            _log.debug("Dropping rate limit store connection: %s", exc)
+        finally:
+            writer.close()
+
+    return await asyncio.start_unix_server(handle, path=path)
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import struct
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+from .client import Client
+from .flags import Intents
+from .gateway import _GATEWAY_ENCODINGS, DiscordWebSocket
+from .http import HTTPClient, Route
+
+__all__ = (
+    "GatewayRecorder",
+    "ReplayStats",
+    "replay_gateway",
+)
+
+_MAGIC = b"NCGT"
+_FORMAT = 1
+# The shard ID (-1 for None), encoding and length of each payload.
+_FRAME = struct.Struct("<iBI")
+_ENCODINGS = tuple(_GATEWAY_ENCODINGS)
+
+
+def _read_frames(path: str) -> Iterator[Tuple[Optional[int], str, bytes]]:
+    with gzip.open(path, "rb") as file:
+        header = file.read(len(_MAGIC) + 1)
+        if header != _MAGIC + bytes((_FORMAT,)):
+            raise ValueError(
+                f"{path} is not a gateway trace recorded by this version of the library"
+            )
+
+        while True:
+            head = file.read(_FRAME.size)
+            if len(head) < _FRAME.size:
+                # A recorder that wasn't closed may have left a partial frame behind.
+                return
+            shard_id, encoding, length = _FRAME.unpack(head)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+            yield (None if shard_id == -1 else shard_id), _ENCODINGS[encoding], payload
+
+
+class GatewayRecorder:
+    """Records the payloads a client receives from the gateway to a gzip-compressed trace
+    file, which can be replayed offline with :func:`replay_gateway` to benchmark how fast
+    events are processed.
+
+    Payloads are recorded once decompressed, before they are parsed, including the events
+    ignored through ``ignored_events``. Pass the recorder to a client with the
+    ``gateway_recorder`` parameter.
+
+    .. warning::
+
+        Traces contain everything the client received, such as message contents and the
+        members of every guild, so they should be kept as private as the bot token is.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file to record the trace to. It is overwritten if it already exists.
+    compresslevel: :class:`int`
+        The gzip compression level of the trace, from 1 (fastest) to 9 (smallest).
+    """
+
+    def __init__(self, path: str, *, compresslevel: int = 6) -> None:
+        self.path: str = path
+        file = gzip.GzipFile(path, "wb", compresslevel=compresslevel)
+        file.write(_MAGIC + bytes((_FORMAT,)))
+        self._file: Optional[gzip.GzipFile] = file
+        self.frames: int = 0
+        """The amount of payloads recorded so far."""
+
+    def __enter__(self) -> GatewayRecorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether the recorder is closed."""
+        return self._file is None
+
+    def record(self, shard_id: Optional[int], encoding: str, payload: Union[str, bytes]) -> None:
+        """Records a payload received from the gateway. This is called by the gateway and
+        does nothing once the recorder is closed.
+
+        Parameters
+        ----------
+        shard_id: Optional[:class:`int`]
+            The ID of the shard that received the payload.
+        encoding: :class:`str`
+            The gateway encoding of the payload, ``"json"`` or ``"etf"``.
+        payload: Union[:class:`str`, :class:`bytes`]
+            The decompressed payload.
+        """
+        file = self._file
+        if file is None:
+            return
+
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        shard = -1 if shard_id is None else shard_id
+        file.write(_FRAME.pack(shard, _ENCODINGS.index(encoding), len(payload)))
+        file.write(payload)
+        self.frames += 1
+
+    def close(self) -> None:
+        """Stops recording and closes the trace file. The trace can't be replayed
+        completely before the recorder is closed.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ReplayStats(NamedTuple):
+    """The results of replaying a gateway trace with :func:`replay_gateway`.
+
+    .. versionadded:: 3.3
+
+    Attributes
+    ----------
+    events: :class:`int`
+        The amount of dispatch events that were parsed.
+    elapsed: :class:`float`
+        The amount of seconds the replay took, including running the event handlers that
+        the events dispatched.
+    parser_times: Dict[:class:`str`, :class:`float`]
+        The CPU time in seconds spent in the parser of each event type, keyed by event name,
+        for example ``"MESSAGE_CREATE"``.
+    parser_calls: Dict[:class:`str`, :class:`int`]
+        The amount of times the parser of each event type was called.
+    peak_memory: Optional[:class:`int`]
+        The peak size of the memory allocated during the replay in bytes, or ``None`` if
+        memory wasn't traced.
+    http_requests: :class:`int`
+        The amount of HTTP requests that were attempted. These are not sent anywhere and
+        return ``None``.
+    """
+
+    events: int
+    elapsed: float
+    parser_times: Dict[str, float]
+    parser_calls: Dict[str, int]
+    peak_memory: Optional[int]
+    http_requests: int
+
+    @property
+    def events_per_second(self) -> float:
+        """:class:`float`: The average amount of events processed per second."""
+        return self.events / self.elapsed if self.elapsed else float("inf")
+
+
+class _ReplayHTTPClient(HTTPClient):
+    # Stands in for the HTTP client of the client being replayed to, so that nothing is
+    # sent to Discord and the timings don't depend on the network.
+
+    def __init__(self, client: Client) -> None:
+        super().__init__(dispatch=client.dispatch)
+        self.requests: int = 0
+
+    async def request(self, route: Route, **kwargs: Any) -> Any:
+        self.requests += 1
+        return None
+
+    async def get_from_cdn(self, url: str) -> bytes:
+        self.requests += 1
+        return b""
+
+
+class _ReplayClient(Client):
+    async def on_connect(self) -> None:
+        # Application commands aren't synced while replaying.
+        pass
+
+
+async def replay_gateway(
+    path: str, *, client: Optional[Client] = None, trace_memory: bool = False
+) -> ReplayStats:
+    """|coro|
+
+    Replays a trace recorded with :class:`GatewayRecorder`, feeding its events through the
+    parsers of the client's connection state and dispatching them like the gateway would,
+    as fast as possible. Requests to the HTTP API are not sent, so traces can be replayed
+    offline, for example to compare the performance of two versions of a bot or of the
+    library.
+
+    The client's event handlers are run between events, and count towards
+    :attr:`ReplayStats.elapsed`. The events dispatched once the trace is done, such as
+    :func:`on_ready`, are waited for but not timed.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the trace to replay.
+    client: Optional[:class:`Client`]
+        The client to replay the trace to, which must not be logged in. Its HTTP client is
+        replaced for the replay. Guilds should not be chunked at start-up, as the member
+        chunks received while recording are replayed. Defaults to a client with all intents
+        that doesn't chunk guilds or sync application commands.
+    trace_memory: :class:`bool`
+        Whether to trace memory allocations with :mod:`tracemalloc` to report
+        :attr:`ReplayStats.peak_memory`. This slows the replay down a lot, so event
+        timings are best measured without it.
+
+    Raises
+    ------
+    ValueError
+        The file is not a gateway trace.
+
+    Returns
+    -------
+    :class:`ReplayStats`
+        The results of the replay.
+    """
+    if client is None:
+        client = _ReplayClient(intents=Intents.all(), chunk_guilds_at_startup=False)
+
+    state = client._connection
+    http = _ReplayHTTPClient(client)
+    client.http = state.http = http
+    shards_launched = getattr(state, "shards_launched", None)
+    if shards_launched is not None:
+        shards_launched.set()
+
+    parsers = state.parsers
+    ignored = client._ignored_events
+    dispatch = client.dispatch
+    parser_times: Dict[str, float] = {}
+    parser_calls: Dict[str, int] = {}
+    events = 0
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        for shard_id, encoding, payload in _read_frames(path):
+            message = _GATEWAY_ENCODINGS[encoding].loads(payload)
+            event = message.get("t")
+            if message["op"] != DiscordWebSocket.DISPATCH or not event or event in ignored:
+                continue
+
+            data = message["d"]
+            if event in ("READY", "RESUMED"):
+                data["__shard_id__"] = shard_id
+
+            dispatch("socket_event_type", event)
+            func = parsers.get(event)
+            if func is not None:
+                cpu = time.process_time()
+                func(data)
+                parser_times[event] = parser_times.get(event, 0.0) + time.process_time() - cpu
+                parser_calls[event] = parser_calls.get(event, 0) + 1
+            events += 1
+
+            # Lets the event handlers that were scheduled run before the next event.
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+
+        ready_task = getattr(state, "_ready_task", None)
+        if ready_task is not None:
+            await ready_task
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return ReplayStats(
+        events=events,
+        elapsed=elapsed,
+        parser_times=parser_times,
+        parser_calls=parser_calls,
+        peak_memory=peak_memory,
+        http_requests=http.requests,
+    )
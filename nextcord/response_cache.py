@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, Iterator, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .http import Route
+from .utils import MISSING
+
+__all__ = ("ResponseCache",)
+
+
+# Past this many invalidated urls, they are forgotten and every response that was requested
+# before is dropped instead.
+_MAX_INVALIDATIONS = 4096
+
+
+def _parent_urls(url: str) -> Iterator[str]:
+    while (index := url.rfind("/")) > len(Route.BASE):
+        url = url[:index]
+        yield url
+
+
+class _Entry(NamedTuple):
+    expires: float
+    value: Any
+
+
+class _AssetEntry(NamedTuple):
+    expires: float
+    data: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ResponseCache:
+    """An opt-in cache for REST responses that rarely change, such as application commands,
+    stickers or guild previews, and for CDN assets read through :meth:`Asset.read`.
+
+    Responses are kept for the TTL of their route, and the least recently used responses
+    are evicted once the cache is full. Cached responses are invalidated early when the
+    client edits or deletes the resource, or when a gateway event reports that it changed.
+
+    Expired assets are revalidated with the ``ETag`` and ``Last-Modified`` headers that the
+    CDN sent, so unchanged assets are not downloaded again.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    ttls: Optional[Mapping[:class:`str`, Optional[:class:`float`]]]
+        Overrides the amount of seconds responses are cached for, keyed by route path as
+        found in :attr:`DEFAULT_TTLS`, for example ``"/stickers/{sticker_id}"``. Setting a path
+        to ``None`` stops caching it, and paths not found in :attr:`DEFAULT_TTLS` can be added.
+    max_entries: :class:`int`
+        The maximum amount of REST responses to cache.
+    asset_ttl: Optional[:class:`float`]
+        The amount of seconds assets are used without being revalidated. If ``None``,
+        assets are not cached.
+    max_asset_bytes: :class:`int`
+        The maximum total size of the cached assets in bytes.
+
+    Attributes
+    ----------
+    DEFAULT_TTLS: Dict[:class:`str`, :class:`float`]
+        The route paths that are cached by default and their TTL in seconds.
+    """
+
+    DEFAULT_TTLS: ClassVar[Dict[str, float]] = {
+        "/applications/{application_id}/commands": 3600.0,
+        "/applications/{application_id}/guilds/{guild_id}/commands": 3600.0,
+        "/guilds/templates/{code}": 300.0,
+        "/guilds/{guild_id}/preview": 300.0,
+        "/stickers/{sticker_id}": 3600.0,
+        "/sticker-packs": 3600.0,
+        "/oauth2/applications/@me": 3600.0,
+    }
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        max_entries: int = 1024,
+        asset_ttl: Optional[float] = 3600.0,
+        max_asset_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        merged: Dict[str, Optional[float]] = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self._ttls: Dict[str, float] = {
+            path: ttl for path, ttl in merged.items() if ttl is not None
+        }
+        self.max_entries: int = max_entries
+        self.asset_ttl: Optional[float] = asset_ttl
+        self.max_asset_bytes: int = max_asset_bytes
+
+        self._entries: OrderedDict[Tuple[Any, ...], _Entry] = OrderedDict()
+        """{(url, auth, params): _Entry}, least recently used first."""
+        self._keys_by_url: Dict[str, Set[Tuple[Any, ...]]] = {}
+        """{"url": {keys}} to invalidate every auth and params variant of a url."""
+        self._urls_within: Dict[str, Set[str]] = {}
+        """{"url": {cached urls}} of the cached urls that are the url or one of its children."""
+        self._assets: OrderedDict[str, _AssetEntry] = OrderedDict()
+        """{"asset url": _AssetEntry}, least recently used first."""
+        self._asset_bytes: int = 0
+        self._generation: int = 0
+        """Bumped by invalidations, so that responses requested before them are not stored."""
+        self._invalidated: Dict[str, int] = {}
+        """{"url": generation} of the urls invalidated along with their children."""
+        self._invalidated_within: Dict[str, int] = {}
+        """{"url": generation} of the urls that were invalidated, or had a child invalidated."""
+        self._forgotten: int = 0
+        """The generation up to which invalidations were forgotten."""
+
+    def _get_ttl(self, path: str) -> Optional[float]:
+        return self._ttls.get(path)
+
+    def _get(self, key: Tuple[Any, ...]) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _is_stale(self, url: str, generation: int) -> bool:
+        if generation < self._forgotten:
+            return True
+        if self._invalidated_within.get(url, 0) > generation:
+            return True
+        return any(self._invalidated.get(parent, 0) > generation for parent in _parent_urls(url))
+
+    def _set(self, key: Tuple[Any, ...], value: Any, ttl: float, generation: int) -> None:
+        url = key[0]
+        if generation != self._generation and self._is_stale(url, generation):
+            # The resource was invalidated while the response was on its way.
+            return
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = _Entry(time.monotonic() + ttl, value)
+        if (keys := self._keys_by_url.get(url)) is None:
+            keys = self._keys_by_url[url] = set()
+            self._urls_within.setdefault(url, set()).add(url)
+            for parent in _parent_urls(url):
+                self._urls_within.setdefault(parent, set()).add(url)
+        keys.add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        del self._entries[key]
+        url = key[0]
+        keys = self._keys_by_url[url]
+        keys.discard(key)
+        if keys:
+            return
+
+        del self._keys_by_url[url]
+        for parent in (url, *_parent_urls(url)):
+            urls = self._urls_within[parent]
+            urls.discard(url)
+            if not urls:
+                del self._urls_within[parent]
+
+    def _remove_url(self, url: str) -> None:
+        for key in list(self._keys_by_url.get(url, ())):
+            self._remove(key)
+
+    def _bump_generation(self) -> int:
+        self._generation += 1
+        if len(self._invalidated_within) > _MAX_INVALIDATIONS:
+            self._invalidated.clear()
+            self._invalidated_within.clear()
+            self._forgotten = self._generation
+        return self._generation
+
+    def invalidate_url(self, url: str) -> None:
+        """Removes the cached responses of a url, and of any url it is a parent or child of.
+
+        This is called for every request that isn't a ``GET``, so that editing a resource
+        invalidates both the resource itself and any listing it is part of.
+        """
+        url = url.rstrip("/")
+        generation = self._bump_generation()
+        self._invalidated[url] = generation
+        self._invalidated_within[url] = generation
+        for parent in _parent_urls(url):
+            self._invalidated_within[parent] = generation
+            self._remove_url(parent)
+
+        for cached_url in list(self._urls_within.get(url, ())):
+            self._remove_url(cached_url)
+
+    def invalidate(self, path: str, **parameters: Any) -> None:
+        """Removes the cached responses of a route.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The route path, for example ``"/guilds/{guild_id}/preview"``.
+        \\*\\*parameters
+            The parameters to format the path with.
+        """
+        url = Route("GET", path, **parameters).url
+        self._invalidated_within[url] = self._bump_generation()
+        self._remove_url(url)
+
+    def clear(self) -> None:
+        """Removes every cached response and asset."""
+        self._generation += 1
+        self._forgotten = self._generation
+        self._invalidated.clear()
+        self._invalidated_within.clear()
+        self._entries.clear()
+        self._keys_by_url.clear()
+        self._urls_within.clear()
+        self._assets.clear()
+        self._asset_bytes = 0
+
+    def _get_asset(self, url: str) -> Optional[_AssetEntry]:
+        entry = self._assets.get(url)
+        if entry is not None:
+            self._assets.move_to_end(url)
+        return entry
+
+    def _set_asset(
+        self, url: str, data: bytes, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        if self.asset_ttl is None or len(data) > self.max_asset_bytes:
+            return
+
+        self._remove_asset(url)
+        self._assets[url] = _AssetEntry(
+            time.monotonic() + self.asset_ttl, data, etag, last_modified
+        )
+        self._asset_bytes += len(data)
+
+        while self._asset_bytes > self.max_asset_bytes:
+            self._remove_asset(next(iter(self._assets)))
+
+    def _refresh_asset(self, url: str, entry: _AssetEntry) -> None:
+        if self.asset_ttl is not None and url in self._assets:
+            self._assets[url] = entry._replace(expires=time.monotonic() + self.asset_ttl)
+
+    def _remove_asset(self, url: str) -> None:
+        entry = self._assets.pop(url, None)
+        if entry is not None:
+            self._asset_bytes -= len(entry.data)
@@ -5,10 +5,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 import aiohttp
 
+from . import snapshot
 from .backoff import ExponentialBackoff
 from .client import Client
 from .enums import Status
@@ -28,9 +29,15 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from .activity import BaseActivity
+    from .cache import CacheBackend
+    from .executor import EventExecutor
     from .flags import MemberCacheFlags
-    from .gateway import DiscordWebSocket
+    from .gateway import DiscordWebSocket, GatewayCompression, GatewayEncoding
+    from .guild import Guild
     from .mentions import AllowedMentions
+    from .ratelimits import RateLimitStore
+    from .replay import GatewayRecorder
+    from .response_cache import ResponseCache
 
 __all__ = (
     "AutoShardedClient",
@@ -108,9 +115,9 @@ class Shard:
         if self._task is not None and not self._task.done():
             self._task.cancel()
 
-    async def close(self) -> None:
+    async def close(self, code: int = 1000) -> None:
         self._cancel_task()
-        await self.ws.close(code=1000)
+        await self.ws.close(code=code)
 
     async def disconnect(self) -> None:
         await self.close()
@@ -336,6 +343,19 @@ class AutoShardedClient(Client):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        gateway_encoding: GatewayEncoding = "json",
+        gateway_compression: Optional[GatewayCompression] = "zlib-stream",
+        ignored_events: Optional[Iterable[str]] = None,
+        ratelimit_store: Optional[RateLimitStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        lazy_message_fields: bool = False,
+        chunk_concurrency: int = 10,
+        chunk_priority: Optional[Callable[[Guild], Any]] = None,
+        gateway_recorder: Optional[GatewayRecorder] = None,
+        profile_events: bool = False,
+        event_stats_interval: Optional[float] = None,
+        event_executor: Optional[EventExecutor] = None,
     ) -> None:
         self.shard_ids: Optional[List[int]] = shard_ids
         super().__init__(
@@ -364,6 +384,19 @@ class AutoShardedClient(Client):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            gateway_encoding=gateway_encoding,
+            gateway_compression=gateway_compression,
+            ignored_events=ignored_events,
+            ratelimit_store=ratelimit_store,
+            response_cache=response_cache,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
+            gateway_recorder=gateway_recorder,
+            profile_events=profile_events,
+            event_stats_interval=event_stats_interval,
+            event_executor=event_executor,
         )
 
         if self.shard_ids is not None:
@@ -402,9 +435,14 @@ class AutoShardedClient(Client):
         intents: Intents,
         chunk_guilds_at_startup: bool,
         member_cache_flags: MemberCacheFlags,
+        cache_backend: Optional[CacheBackend],
+        lazy_message_fields: bool,
+        chunk_concurrency: int,
+        chunk_priority: Optional[Callable[[Guild], Any]],
     ) -> AutoShardedConnectionState:
         return AutoShardedConnectionState(
             dispatch=self.dispatch,
+            has_listener=self._has_listener,
             handlers=self._handlers,
             hooks=self._hooks,
             http=self.http,
@@ -419,6 +457,10 @@ class AutoShardedClient(Client):
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_backend=cache_backend,
+            lazy_message_fields=lazy_message_fields,
+            chunk_concurrency=chunk_concurrency,
+            chunk_priority=chunk_priority,
         )
 
     @property
@@ -458,11 +500,32 @@ class AutoShardedClient(Client):
             for shard_id, parent in self.__shards.items()
         }
 
+    def _get_sessions(self) -> snapshot.Sessions:
+        return {
+            shard_id: (shard.ws.session_id, shard.ws.sequence, shard.ws.resume_url)
+            for shard_id, shard in self.__shards.items()
+            if shard.ws.session_id is not None
+        }
+
     async def launch_shard(self, gateway: str, shard_id: int, *, initial: bool = False) -> None:
+        session = self._snapshot_sessions.pop(shard_id, None)
         try:
-            coro = DiscordWebSocket.from_client(
-                self, initial=initial, gateway=gateway, shard_id=shard_id
-            )
+            if session is None:
+                coro = DiscordWebSocket.from_client(
+                    self, initial=initial, gateway=gateway, shard_id=shard_id
+                )
+            else:
+                session_id, sequence, resume_url = session
+                coro = DiscordWebSocket.from_client(
+                    self,
+                    initial=initial,
+                    gateway=resume_url,
+                    shard_id=shard_id,
+                    session=session_id,
+                    sequence=sequence,
+                    resume=True,
+                    format_gateway=True,
+                )
             ws = await asyncio.wait_for(coro, timeout=180.0)
         except Exception:
             _log.exception("Failed to connect for shard_id: %s. Retrying...", shard_id)
@@ -475,10 +538,14 @@ class AutoShardedClient(Client):
         return None
 
     async def launch_shards(self) -> None:
+        encoding = self._gateway_encoding
+        compression = self._gateway_compression
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
+            self.shard_count, gateway = await self.http.get_bot_gateway(
+                encoding=encoding, compress=compression
+            )
         else:
-            gateway = await self.http.get_gateway()
+            gateway = await self.http.get_gateway(encoding=encoding, compress=compression)
 
         self._connection.shard_count = self.shard_count
 
@@ -529,8 +596,11 @@ class AutoShardedClient(Client):
             with contextlib.suppress(Exception):
                 await vc.disconnect(force=True)
 
+        # Closing with 1000 ends the sessions, any other code lets them be resumed.
+        code = 4000 if self._keep_session else 1000
         to_close = [
-            asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()
+            asyncio.ensure_future(shard.close(code), loop=self.loop)
+            for shard in self.__shards.values()
         ]
         if to_close:
             await asyncio.wait(to_close)
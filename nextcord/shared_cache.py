@@ -0,0 +1,528 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    ItemsView,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    ValuesView,
+)
+
+from . import utils
+from .cache import CachePolicy, EvictCallback, MemoryCacheBackend
+from .user import BaseUser, User
+
+if TYPE_CHECKING:
+    from .cache import CacheEntity
+
+has_fcntl: bool
+
+if sys.platform != "win32":
+    import fcntl
+
+    _LOCK_SH, _LOCK_EX, _LOCK_UN = fcntl.LOCK_SH, fcntl.LOCK_EX, fcntl.LOCK_UN
+    _flock = fcntl.flock
+    has_fcntl = True
+else:
+    _LOCK_SH, _LOCK_EX, _LOCK_UN = 1, 2, 8
+
+    def _flock(_fd: int, _operation: int, /) -> None:
+        raise OSError("file locks are not supported on this platform")
+
+    has_fcntl = False
+
+__all__ = ("SharedMemoryCacheBackend",)
+
+_log = logging.getLogger(__name__)
+
+# The file starts with a header, followed by an open addressing hash table of slots
+# and a data region that records are appended to.
+# Header: magic, format, slot count, data size, write position, count, tombstones,
+# live bytes and the last record version.
+_MAGIC = b"NCSC"
+_FORMAT = 1
+_HEADER = struct.Struct("<4sIIIIIIIQ")
+_HEADER_SIZE = 64
+_WRITE_POSITION = 16
+_COUNT = 20
+_TOMBSTONES = 24
+_LIVE = 28
+_LAST_VERSION = 32
+# Slot: ID, version, offset in the data region, length, references and padding.
+_SLOT = struct.Struct("<QQIIII")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_EMPTY = 0
+_TOMBSTONE = 1
+_MAX_LOAD = 0.75
+_MIN_SIZE = 256 * 1024
+
+# The user attributes kept in a record, in order.
+_FIELDS = (
+    "name",
+    "discriminator",
+    "global_name",
+    "_avatar",
+    "_banner",
+    "_accent_colour",
+    "_avatar_decoration",
+    "_public_flags",
+    "bot",
+    "system",
+)
+
+
+class _SharedTable:
+    # A hash table of {ID: bytes} records in a memory-mapped file. Readers take a shared lock
+    # on the file and writers an exclusive one. Every write stamps its record with a version
+    # that is unique within the file, which lets processes check whether a record they decoded
+    # earlier is still current without locking.
+
+    def __init__(self, path: str, size: int) -> None:
+        self.path: str = path
+        self._size: int = size
+        self._open()
+
+        magic, fmt, slot_count, data_size, *_ = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or fmt != _FORMAT:
+            self._map.close()
+            os.close(self._fd)
+            raise ValueError(f"{path} is not a shared cache file")
+
+        self._slot_count: int = slot_count
+        self._shift: int = 64 - (slot_count.bit_length() - 1)
+        self._max_count: int = int(slot_count * _MAX_LOAD)
+        self._data_start: int = _HEADER_SIZE + slot_count * _SLOT.size
+        self._data_size: int = data_size
+
+    def _open(self) -> None:
+        self._pid: int = os.getpid()
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            _flock(self._fd, _LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size == 0:
+                    self._initialize()
+                self._map: mmap.mmap = mmap.mmap(self._fd, os.fstat(self._fd).st_size)
+            finally:
+                _flock(self._fd, _LOCK_UN)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _initialize(self) -> None:
+        slot_count = 1 << max(10, (self._size // 160).bit_length())
+        data_size = self._size - _HEADER_SIZE - slot_count * _SLOT.size
+        os.ftruncate(self._fd, self._size)
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, _HEADER.pack(_MAGIC, _FORMAT, slot_count, data_size, 0, 0, 0, 0, 0))
+
+    @contextlib.contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        if self._pid != os.getpid():
+            # Locks are held by open files, which a forked process shares with its parent.
+            self._open()
+
+        _flock(self._fd, operation)
+        try:
+            yield
+        finally:
+            _flock(self._fd, _LOCK_UN)
+
+    def _get(self, offset: int) -> int:
+        return _U32.unpack_from(self._map, offset)[0]
+
+    def _put(self, offset: int, value: int) -> None:
+        _U32.pack_into(self._map, offset, value)
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT.size
+
+    def _find(self, key: int) -> Tuple[int, bool]:
+        # Returns the slot holding the key, otherwise the slot it should be inserted in.
+        mask = self._slot_count - 1
+        index = ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+        free = -1
+        unpack, m = _U64.unpack_from, self._map
+        for _ in range(self._slot_count):
+            slot_key = unpack(m, _HEADER_SIZE + index * _SLOT.size)[0]
+            if slot_key == key:
+                return index, True
+            if slot_key == _EMPTY:
+                return (index if free == -1 else free), False
+            if slot_key == _TOMBSTONE and free == -1:
+                free = index
+            index = (index + 1) & mask
+        return free, False
+
+    def version_at(self, index: int) -> int:
+        return _U64.unpack_from(self._map, self._slot_offset(index) + 8)[0]
+
+    def read(self, key: int) -> Optional[Tuple[int, int, bytes]]:
+        with self._locked(_LOCK_SH):
+            index, found = self._find(key)
+            if not found:
+                return None
+
+            _, version, offset, length, _, _ = _SLOT.unpack_from(
+                self._map, self._slot_offset(index)
+            )
+            start = self._data_start + offset
+            return index, version, self._map[start : start + length]
+
+    def store(self, key: int, data: bytes, *, acquire: bool) -> Optional[Tuple[int, int]]:
+        with self._locked(_LOCK_EX):
+            index, found = self._find(key)
+            if found:
+                _, _, offset, length, references, _ = _SLOT.unpack_from(
+                    self._map, self._slot_offset(index)
+                )
+            else:
+                offset = length = references = 0
+                count = self._get(_COUNT)
+                if count >= self._max_count:
+                    return None
+                if count + self._get(_TOMBSTONES) >= self._max_count:
+                    self._compact()
+                    index, _ = self._find(key)
+
+            if len(data) > length:
+                new_offset = self._allocate(len(data))
+                if new_offset is None:
+                    return None
+                offset = new_offset
+                # Allocating may have compacted the table, moving the slots.
+                index, _ = self._find(key)
+
+            if not found:
+                if _U64.unpack_from(self._map, self._slot_offset(index))[0] == _TOMBSTONE:
+                    self._put(_TOMBSTONES, self._get(_TOMBSTONES) - 1)
+                self._put(_COUNT, self._get(_COUNT) + 1)
+
+            version = _U64.unpack_from(self._map, _LAST_VERSION)[0] + 1
+            _U64.pack_into(self._map, _LAST_VERSION, version)
+            self._put(_LIVE, self._get(_LIVE) + len(data) - length)
+            start = self._data_start + offset
+            self._map[start : start + len(data)] = data
+            _SLOT.pack_into(
+                self._map,
+                self._slot_offset(index),
+                key,
+                version,
+                offset,
+                len(data),
+                references + acquire,
+                0,
+            )
+            return index, version
+
+    def release(self, key: int) -> None:
+        with self._locked(_LOCK_EX):
+            index, found = self._find(key)
+            if not found:
+                return
+
+            position = self._slot_offset(index)
+            _, _, _, length, references, _ = _SLOT.unpack_from(self._map, position)
+            if references > 1:
+                self._put(position + 24, references - 1)
+                return
+
+            _SLOT.pack_into(self._map, position, _TOMBSTONE, 0, 0, 0, 0, 0)
+            self._put(_COUNT, self._get(_COUNT) - 1)
+            self._put(_TOMBSTONES, self._get(_TOMBSTONES) + 1)
+            self._put(_LIVE, self._get(_LIVE) - length)
+
+    def _allocate(self, size: int) -> Optional[int]:
+        # Returns where a record of `size` bytes can be appended, compacting the data if needed.
+        write_position = self._get(_WRITE_POSITION)
+        if write_position + size > self._data_size:
+            if self._get(_LIVE) + size > self._data_size:
+                return None
+            self._compact()
+            write_position = self._get(_WRITE_POSITION)
+
+        self._put(_WRITE_POSITION, write_position + size)
+        return write_position
+
+    def _compact(self) -> None:
+        m = self._map
+        records: List[Tuple[int, int, bytes, int]] = []
+        for index in range(self._slot_count):
+            key, version, offset, length, references, _ = _SLOT.unpack_from(
+                m, self._slot_offset(index)
+            )
+            if key > _TOMBSTONE:
+                start = self._data_start + offset
+                records.append((key, version, m[start : start + length], references))
+
+        m[_HEADER_SIZE : self._data_start] = bytes(self._data_start - _HEADER_SIZE)
+        position = 0
+        for key, version, data, references in records:
+            index, _ = self._find(key)
+            start = self._data_start + position
+            m[start : start + len(data)] = data
+            _SLOT.pack_into(
+                m, self._slot_offset(index), key, version, position, len(data), references, 0
+            )
+            position += len(data)
+
+        self._put(_WRITE_POSITION, position)
+        self._put(_TOMBSTONES, 0)
+        self._put(_LIVE, position)
+
+
+def _dump(user: BaseUser) -> bytes:
+    return utils.to_json([getattr(user, name) for name in _FIELDS]).encode("utf-8")
+
+
+class _SharedUser(User):
+    # A user whose attributes are read from its record in a shared file instead of being
+    # kept in the object. When it stops being shared, the attributes are copied into the
+    # slots inherited from BaseUser and read from there.
+
+    __slots__ = ("_store",)
+
+    if TYPE_CHECKING:
+        _store: Optional[_SharedUserStore]
+
+    @classmethod
+    def _copy(cls, user: User) -> User:
+        # Copies are snapshots, which must not write to the shared record.
+        return User._copy(user)
+
+    def _detach(self, fields: Tuple[Any, ...]) -> None:
+        for name, value in zip(_FIELDS, fields, strict=True):
+            getattr(BaseUser, name).__set__(self, value)
+        self._store = None
+
+
+def _shared_field(name: str, position: int) -> property:
+    slot = getattr(BaseUser, name)
+
+    def getter(self: _SharedUser) -> Any:
+        store = self._store
+        if store is None:
+            return slot.__get__(self, _SharedUser)
+        return store._fields(self)[position]
+
+    def setter(self: _SharedUser, value: Any) -> None:
+        store = self._store
+        if store is None:
+            slot.__set__(self, value)
+        else:
+            store._set_field(self, position, value)
+
+    return property(getter, setter)
+
+
+for _position, _name in enumerate(_FIELDS):
+    setattr(_SharedUser, _name, _shared_field(_name, _position))
+
+
+class _SharedUserStore(MutableMapping[int, User]):
+    # The users store of a ConnectionState. It holds a view for every user it stores, and a
+    # reference to the user's record in the shared table so that it is kept while any
+    # process uses it. Users that don't fit in the table are kept as regular users.
+
+    def __init__(self, table: _SharedTable, max_decoded: int) -> None:
+        self._table: _SharedTable = table
+        self._users: Dict[int, User] = {}
+        self._decoded: OrderedDict[int, Tuple[int, int, Tuple[Any, ...]]] = OrderedDict()
+        """{ID: (slot, version, fields)} of recently read records, least recently used first."""
+        self._max_decoded: int = max_decoded
+
+    def _remember(self, user_id: int, slot: int, version: int, fields: Tuple[Any, ...]) -> None:
+        decoded = self._decoded
+        decoded[user_id] = (slot, version, fields)
+        decoded.move_to_end(user_id)
+        if len(decoded) > self._max_decoded:
+            decoded.popitem(last=False)
+
+    def _fields(self, user: _SharedUser) -> Tuple[Any, ...]:
+        user_id = user.id
+        cached = self._decoded.get(user_id)
+        # Versions are unique within the file, so a matching one means the record is unchanged.
+        if cached is not None and self._table.version_at(cached[0]) == cached[1]:
+            self._decoded.move_to_end(user_id)
+            return cached[2]
+
+        result = self._table.read(user_id)
+        if result is None:
+            raise RuntimeError(f"user {user_id} is missing from {self._table.path}")
+
+        slot, version, data = result
+        fields = tuple(utils.from_json(data))
+        self._remember(user_id, slot, version, fields)
+        return fields
+
+    def _set_field(self, user: _SharedUser, position: int, value: Any) -> None:
+        fields = list(self._fields(user))
+        fields[position] = value
+        self._write(user, tuple(fields))
+
+    def _write(self, user: _SharedUser, fields: Tuple[Any, ...]) -> None:
+        result = self._table.store(user.id, utils.to_json(fields).encode("utf-8"), acquire=False)
+        if result is None:
+            _log.warning("%s is full, user %s is no longer shared.", self._table.path, user.id)
+            self._decoded.pop(user.id, None)
+            user._detach(fields)
+            self._table.release(user.id)
+        else:
+            self._remember(user.id, *result, fields)
+
+    def _release(self, user: User) -> None:
+        if isinstance(user, _SharedUser) and user._store is self:
+            user._detach(self._fields(user))
+            self._decoded.pop(user.id, None)
+            self._table.release(user.id)
+
+    def __getitem__(self, key: int) -> User:
+        return self._users[key]
+
+    def get(self, key: int, default: Any = None) -> Any:
+        return self._users.get(key, default)
+
+    def __setitem__(self, key: int, value: User) -> None:
+        current = self._users.get(key)
+        if current is value:
+            return
+
+        if isinstance(current, _SharedUser) and current._store is self:
+            self._write(current, tuple(getattr(value, name) for name in _FIELDS))
+            return
+
+        data = _dump(value)
+        result = self._table.store(key, data, acquire=True)
+        if result is None:
+            _log.debug("%s is full, keeping user %s in this process only.", self._table.path, key)
+            self._users[key] = value
+            return
+
+        user = _SharedUser.__new__(_SharedUser)
+        user.id = key
+        user._state = value._state
+        user._stored = False
+        user._store = self
+        self._users[key] = user
+        self._remember(key, *result, tuple(utils.from_json(data)))
+
+    def __delitem__(self, key: int) -> None:
+        self._release(self._users.pop(key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._users
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._users)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def keys(self) -> KeysView[int]:
+        return self._users.keys()
+
+    def values(self) -> ValuesView[User]:
+        return self._users.values()
+
+    def items(self) -> ItemsView[int, User]:
+        return self._users.items()
+
+    def clear(self) -> None:
+        users, self._users = self._users, {}
+        for user in users.values():
+            self._release(user)
+
+    def __del__(self) -> None:
+        # Let go of the references to the records when the state drops the store.
+        with contextlib.suppress(Exception):
+            self.clear()
+
+
+class SharedMemoryCacheBackend(MemoryCacheBackend):
+    """A :class:`CacheBackend` that keeps users in a memory-mapped file shared by every
+    process on the host that uses the same path, such as the processes of a bot running its
+    shards with :class:`AutoShardedClient` split across them.
+
+    Users in guilds of several processes are only stored once in the file. Each process keeps
+    lightweight :class:`User` objects whose attributes are read from the file, with the most
+    recently read ones kept decoded. Updates made by any process are seen by all of them.
+    A record is removed once no process references it anymore, while references of processes
+    that didn't shut down cleanly stay until the file is recreated.
+
+    Users that don't fit in the file anymore are kept in the memory of their process. Other
+    entities are kept in memory like :class:`MemoryCacheBackend` does.
+
+    This requires a Unix platform.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file, which is created if it doesn't exist yet. Placing it on a
+        memory-backed file system, such as ``/dev/shm`` on Linux, keeps it out of the disk.
+    size: :class:`int`
+        The size of the file in bytes when creating it. Records take roughly 100 bytes each.
+        Defaults to 64 MiB.
+    max_decoded: :class:`int`
+        The amount of recently read users to keep decoded in each process.
+    policies: Optional[Mapping[:class:`str`, Optional[:class:`CachePolicy`]]]
+        The policy of each entity type other than ``"users"``, like in
+        :class:`MemoryCacheBackend`.
+    compact_members: :class:`bool`
+        Whether to keep members in a :class:`CompactMemberStore`, like in
+        :class:`MemoryCacheBackend`.
+
+    Raises
+    ------
+    RuntimeError
+        The platform does not support file locks.
+    ValueError
+        ``size`` is invalid, the file is not a shared cache file or a policy was given
+        for ``"users"``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        size: int = 64 * 1024 * 1024,
+        max_decoded: int = 4096,
+        policies: Optional[Mapping[str, Optional[CachePolicy]]] = None,
+        compact_members: bool = False,
+    ) -> None:
+        if not has_fcntl:
+            raise RuntimeError("SharedMemoryCacheBackend requires a platform with file locks")
+        if not _MIN_SIZE <= size < 2**32:
+            raise ValueError(f"size must be at least {_MIN_SIZE} bytes and less than 4 GiB")
+        if policies is not None and "users" in policies:
+            raise ValueError("users are always stored in the shared file")
+
+        super().__init__(policies=policies, compact_members=compact_members)
+        self.path: str = path
+        self.max_decoded: int = max_decoded
+        self._table: _SharedTable = _SharedTable(path, size)
+
+    def create_store(
+        self, entity: CacheEntity, *, on_evict: Optional[EvictCallback] = None
+    ) -> MutableMapping[int, Any]:
+        if entity == "users":
+            return _SharedUserStore(self._table, self.max_decoded)
+        return super().create_store(entity, on_evict=on_evict)
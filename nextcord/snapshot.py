@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import os
+import pickle
+from typing import IO, TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, TypeVar
+
+from .cache import CacheStore
+from .guild import Guild
+from .member import Member
+from .member_store import CompactMemberStore, _MemberView
+from .shared_cache import _SharedUser, _SharedUserStore
+from .user import User
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from .cache import CacheEntity
+    from .state import ConnectionState
+
+    T = TypeVar("T")
+
+# The session ID, sequence and resume gateway URL of each shard.
+Sessions = Dict[Optional[int], Tuple[str, Optional[int], str]]
+
+_MAGIC = b"NCSS"
+_FORMAT = 1
+
+# {"ConnectionState attribute": "entity"} of the stores kept in snapshots.
+_STATE_STORES: Dict[str, CacheEntity] = {
+    "_users": "users",
+    "_guilds": "guilds",
+    "_emojis": "emojis",
+    "_stickers": "stickers",
+    "_private_channels": "private_channels",
+}
+# {"Guild attribute": "entity"} of the stores of each guild.
+_GUILD_STORES: Dict[str, CacheEntity] = {
+    "_channels": "channels",
+    "_members": "members",
+    "_roles": "roles",
+    "_threads": "threads",
+}
+_STORE_TYPES = (CacheStore, CompactMemberStore, _SharedUserStore)
+
+
+def _slot_values(obj: Any, cls: type) -> Dict[str, Any]:
+    values = {}
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            # Cached properties are computed again when needed.
+            if name.startswith("_cs_") or name in ("__weakref__", "__dict__"):
+                continue
+            value = getattr(obj, name, MISSING)
+            if value is not MISSING:
+                values[name] = value
+    return values
+
+
+def _restore(cls: Type[T], values: Dict[str, Any]) -> T:
+    obj = cls.__new__(cls)
+    for name, value in values.items():
+        setattr(obj, name, value)
+    return obj
+
+
+class _Pickler(pickle.Pickler):
+    # Pickles the cache of a state without the state itself, which the state loading the
+    # snapshot takes the place of. Stores are pickled as dicts, and created again by the
+    # backend of the state loading the snapshot.
+
+    def __init__(self, file: IO[bytes], state: ConnectionState) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._state: ConnectionState = state
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return "state" if obj is self._state else None
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, _STORE_TYPES):
+            return dict, (list(obj.items()),)
+        if isinstance(obj, _MemberView):
+            return _restore, (Member, _slot_values(obj, Member))
+        if isinstance(obj, _SharedUser):
+            return _restore, (User, _slot_values(obj, User))
+        if isinstance(obj, Guild):
+            values = _slot_values(obj, Guild)
+            # These are added again when the application commands are.
+            values["_application_commands"] = {}
+            return _restore, (Guild, values)
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], state: ConnectionState) -> None:
+        super().__init__(file)
+        self._state: ConnectionState = state
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "state":
+            return self._state
+        raise pickle.UnpicklingError(f"unknown persistent ID {pid!r}")
+
+
+def save(state: ConnectionState, sessions: Sessions, path: str) -> None:
+    data = {
+        "shard_count": state.shard_count,
+        "sessions": sessions,
+        "application_id": state.application_id,
+        "application_flags": getattr(state, "application_flags", None),
+        "user": state.user,
+        "stores": {attribute: getattr(state, attribute) for attribute in _STATE_STORES},
+        "private_channels_by_user": state._private_channels_by_user,
+    }
+
+    # Write to another file first, so that a crash doesn't leave a partial snapshot behind.
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(_MAGIC + bytes((_FORMAT,)))
+        _Pickler(file, state).dump(data)
+    os.replace(temporary, path)
+
+
+def load(state: ConnectionState, path: str) -> Dict[str, Any]:
+    # Only reads the snapshot, so that it can be checked before the cache is replaced with
+    # restore.
+    with open(path, "rb") as file:
+        header = file.read(len(_MAGIC) + 1)
+        if header != _MAGIC + bytes((_FORMAT,)):
+            raise ValueError(f"{path} is not a snapshot saved by this version of the library")
+        data = _Unpickler(file, state).load()
+
+    sessions = data.get("sessions") if isinstance(data, dict) else None
+    if not isinstance(sessions, dict) or not all(
+        isinstance(session, tuple) and len(session) == 3 for session in sessions.values()
+    ):
+        raise ValueError(f"{path} is not a valid snapshot")
+    return data
+
+
+def restore(state: ConnectionState, data: Dict[str, Any]) -> None:
+    state.clear(views=False, modals=False)
+    backend = state._cache_backend
+    for guild in data["stores"]["_guilds"].values():
+        for attribute, entity in _GUILD_STORES.items():
+            store = backend.create_store(entity)
+            store.update(getattr(guild, attribute))
+            setattr(guild, attribute, store)
+
+    for attribute, items in data["stores"].items():
+        getattr(state, attribute).update(items)
+    state._private_channels_by_user.update(data["private_channels_by_user"])
+
+    # Stores may keep their own objects for users, which members should refer to.
+    users = state._users
+    for guild in state._guilds.values():
+        for member in guild._members.values():
+            user = users.get(member._user.id)
+            if user is not None and user is not member._user:
+                member._user = user
+
+    state.user = data["user"]
+    if state.application_id is None:
+        state.application_id = data["application_id"]
+        if data["application_flags"] is not None:
+            state.application_flags = data["application_flags"]
@@ -5,25 +5,29 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import heapq
 import inspect
 import itertools
 import logging
 import os
 import warnings
-from collections import OrderedDict, deque
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
-    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    MutableMapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
     Union,
+    overload,
 )
 
 from . import utils
@@ -31,6 +35,7 @@ from .activity import BaseActivity
 from .application_command import BaseApplicationCommand
 from .audit_logs import AuditLogEntry
 from .auto_moderation import AutoModerationActionExecution, AutoModerationRule
+from .cache import CacheBackend, MemoryCacheBackend
 from .channel import *
 from .channel import _channel_factory
 from .emoji import Emoji
@@ -56,8 +61,6 @@ from .ui.view import View, ViewStore
 from .user import ClientUser, User
 
 if TYPE_CHECKING:
-    from asyncio import Future
-
     from .abc import MessageableChannel, PrivateChannel
     from .application_command import SlashApplicationSubcommand
     from .client import Client
@@ -131,6 +134,229 @@ class ChunkRequest:
                 future.set_result(self.buffer)
 
 
+class _CommandRoute:
+    # The subcommands of an application command, keyed by their name and by each of their
+    # localized names, compiled once when the command is added to the state.
+    __slots__ = ("command", "children", "localized_children")
+
+    def __init__(self, command: Union[BaseApplicationCommand, SlashApplicationSubcommand]) -> None:
+        self.command: Union[BaseApplicationCommand, SlashApplicationSubcommand] = command
+        self.children: Dict[str, _CommandRoute] = {}
+        self.localized_children: Dict[str, _CommandRoute] = {}
+        children: Dict[str, SlashApplicationSubcommand] = getattr(command, "children", {})
+        for name, child in children.items():
+            route = _CommandRoute(child)
+            self.children[name] = route
+            if child.name_localizations:
+                for localized_name in child.name_localizations.values():
+                    self.localized_children.setdefault(localized_name, route)
+
+
+def _member_count(guild: Guild) -> int:
+    return guild._member_count or 0
+
+
+class ChunkScheduler:
+    # Chunks the guilds received while connecting, with at most `chunk_concurrency` guilds
+    # per shard waiting for their members at a time. Waiting guilds are chunked in order of
+    # `chunk_priority`, and each guild is dispatched as soon as it is chunked.
+
+    # The sends of each gateway rate limit window left for other commands.
+    reserved_sends: int = 10
+    timeout: float = 60.0
+
+    def __init__(self, state: ConnectionState) -> None:
+        self.state: ConnectionState = state
+        self.chunked: int = 0
+        self.total: int = 0
+        self._queues: Dict[int, List[Tuple[Any, int, Guild]]] = {}
+        """{shard ID: heap of (priority, order added, guild)}"""
+        self._running: Dict[int, int] = {}
+        self._remaining: Dict[int, int] = {}
+        self._idle: Dict[int, asyncio.Event] = {}
+        self._send_locks: Dict[int, asyncio.Lock] = {}
+        self._order: Iterator[int] = itertools.count()
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def add(self, guild: Guild) -> None:
+        shard_id = guild.shard_id
+        if shard_id not in self._queues:
+            self._queues[shard_id] = []
+            self._running[shard_id] = 0
+            self._remaining[shard_id] = 0
+            self._idle[shard_id] = asyncio.Event()
+            self._send_locks[shard_id] = asyncio.Lock()
+
+        self.total += 1
+        self._remaining[shard_id] += 1
+        self._idle[shard_id].clear()
+        priority = self.state.chunk_priority(guild)
+        heapq.heappush(self._queues[shard_id], (priority, next(self._order), guild))
+        self._start(shard_id)
+
+    def _start(self, shard_id: int) -> None:
+        queue = self._queues[shard_id]
+        while queue and self._running[shard_id] < self.state.chunk_concurrency:
+            _, _, guild = heapq.heappop(queue)
+            self._running[shard_id] += 1
+            task = asyncio.create_task(self._chunk(guild))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _request(self, guild: Guild) -> Union[List[Member], asyncio.Future[List[Member]]]:
+        # Requests are sent one at a time per shard, so that the check for room in the
+        # rate limit window holds until the request is sent.
+        async with self._send_locks[guild.shard_id]:
+            ratelimiter = self.state._get_websocket(guild.id)._rate_limiter
+            while delay := ratelimiter.get_reserved_delay(self.reserved_sends):
+                _log.debug(
+                    "Shard ID %s waiting %.2f seconds for the next gateway rate limit window "
+                    "to request chunks.",
+                    guild.shard_id,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+            return await self.state.chunk_guild(guild, wait=False)
+
+    async def _chunk(self, guild: Guild) -> None:
+        shard_id = guild.shard_id
+        try:
+            members = await self._request(guild)
+            if isinstance(members, asyncio.Future):
+                await asyncio.wait_for(members, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            _log.warning(
+                "Shard ID %s timed out waiting for chunks for guild_id %s.", shard_id, guild.id
+            )
+        except Exception:
+            _log.exception("Shard ID %s failed to chunk guild_id %s.", shard_id, guild.id)
+        finally:
+            self._running[shard_id] -= 1
+            self._start(shard_id)
+
+        if guild.unavailable is False:
+            self.state.dispatch("guild_available", guild)
+        else:
+            self.state.dispatch("guild_join", guild)
+
+        self.chunked += 1
+        self.state.dispatch("chunk_progress", self.chunked, self.total)
+        self._remaining[shard_id] -= 1
+        if not self._remaining[shard_id]:
+            self._idle[shard_id].set()
+
+    async def wait(self, shard_id: Optional[int] = None) -> None:
+        """Waits until every guild added so far, or only those of a shard, is chunked."""
+        if shard_id is not None:
+            if shard_id in self._idle:
+                await self._idle[shard_id].wait()
+            return
+
+        for event in list(self._idle.values()):
+            await event.wait()
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+
+class MessageCache(Sequence[Message]):
+    """Stores up to ``maxlen`` messages, dropping the oldest added message once full.
+
+    Messages are indexed by ID and by channel ID, so that looking up and removing messages
+    doesn't need to scan every cached message.
+    """
+
+    __slots__ = ("maxlen", "_messages", "_channels", "_channel_guilds")
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen: int = maxlen
+        self._messages: Dict[int, Message] = {}
+        """{message ID: Message}, oldest first."""
+        self._channels: Dict[int, Dict[int, Message]] = {}
+        """{channel ID: {message ID: Message}}, oldest first."""
+        self._channel_guilds: Dict[int, Optional[int]] = {}
+        """{channel ID: guild ID} of channels with cached messages."""
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._messages.values())
+
+    def __contains__(self, message: object) -> bool:
+        return isinstance(message, Message) and self._messages.get(message.id) is message
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Message]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Message, List[Message]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        length = len(self._messages)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("message cache index out of range")
+
+        # Walk from whichever end is closer, recent messages are the ones usually asked for.
+        if index < length // 2:
+            return next(itertools.islice(self, index, None))
+        return next(itertools.islice(reversed(self), length - index - 1, None))
+
+    def get(self, message_id: Optional[int]) -> Optional[Message]:
+        return self._messages.get(message_id)  # pyright: ignore [reportArgumentType]
+
+    def append(self, message: Message) -> None:
+        self.pop(message.id)
+        self._messages[message.id] = message
+        channel_id = message.channel.id
+        if (channel := self._channels.get(channel_id)) is None:
+            channel = self._channels[channel_id] = {}
+            self._channel_guilds[channel_id] = message.guild.id if message.guild else None
+        channel[message.id] = message
+
+        if len(self._messages) > self.maxlen:
+            self.pop(next(iter(self._messages)))
+
+    def pop(self, message_id: int) -> Optional[Message]:
+        message = self._messages.pop(message_id, None)
+        if message is None:
+            return None
+
+        channel_id = message.channel.id
+        channel = self._channels[channel_id]
+        del channel[message_id]
+        if not channel:
+            del self._channels[channel_id]
+            del self._channel_guilds[channel_id]
+        return message
+
+    def get_many(self, message_ids: Iterable[int]) -> List[Message]:
+        """Returns the cached messages with the given IDs, oldest first."""
+        messages = [message for message_id in message_ids if (message := self.get(message_id))]
+        messages.sort(key=lambda message: message.id)
+        return messages
+
+    def remove_guild(self, guild_id: int) -> None:
+        """Removes the cached messages of every channel in a guild."""
+        for channel_id in [
+            channel_id
+            for channel_id, channel_guild_id in self._channel_guilds.items()
+            if channel_guild_id == guild_id
+        ]:
+            for message_id in list(self._channels[channel_id]):
+                self.pop(message_id)
+
+
 _log = logging.getLogger(__name__)
 
 
@@ -151,6 +377,7 @@ class ConnectionState:
         self,
         *,
         dispatch: Callable,
+        has_listener: Optional[Callable[[str], bool]] = None,
         handlers: Dict[str, Callable],
         hooks: Dict[str, Callable],
         http: HTTPClient,
@@ -165,14 +392,23 @@ class ConnectionState:
         intents: Intents = Intents.default(),
         chunk_guilds_at_startup: bool = MISSING,
         member_cache_flags: MemberCacheFlags = MISSING,
+        cache_backend: Optional[CacheBackend] = None,
+        lazy_message_fields: bool = False,
+        chunk_concurrency: int = 10,
+        chunk_priority: Optional[Callable[[Guild], Any]] = None,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = loop
         self.http: HTTPClient = http
+        self._cache_backend: CacheBackend = (
+            MemoryCacheBackend() if cache_backend is None else cache_backend
+        )
         self.max_messages: Optional[int] = max_messages
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
+        self.lazy_message_fields: bool = lazy_message_fields
 
         self.dispatch: Callable = dispatch
+        self._has_listener: Callable[[str], bool] = has_listener or (lambda _: True)
         self.handlers: Dict[str, Callable] = handlers
         self.hooks: Dict[str, Callable] = hooks
         self.shard_count: Optional[int] = None
@@ -182,6 +418,11 @@ class ConnectionState:
         self.guild_ready_timeout: float = guild_ready_timeout
         if self.guild_ready_timeout < 0:
             raise ValueError("guild_ready_timeout cannot be negative")
+        if chunk_concurrency < 1:
+            raise ValueError("chunk_concurrency must be at least 1")
+
+        self.chunk_concurrency: int = chunk_concurrency
+        self.chunk_priority: Callable[[Guild], Any] = chunk_priority or _member_count
 
         if allowed_mentions is not None and not isinstance(allowed_mentions, AllowedMentions):
             raise TypeError("allowed_mentions parameter must be AllowedMentions")
@@ -189,6 +430,8 @@ class ConnectionState:
         self.allowed_mentions: Optional[AllowedMentions] = allowed_mentions
         self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
         self._chunk_tasks: Dict[Union[int, str], asyncio.Task[None]] = {}
+        self._restored_shards: Set[Optional[int]] = set()
+        """The shards whose session from a snapshot is yet to be resumed."""
         self._background_tasks: Set[asyncio.Task] = set()
 
         if activity is not None:
@@ -238,6 +481,12 @@ class ConnectionState:
         self._application_command_signatures: Dict[
             Tuple[Optional[str], int, Optional[int]], BaseApplicationCommand
         ] = {}
+        # The same signatures, but with each localized name of the commands instead of their name.
+        self._application_command_localizations: Dict[
+            Tuple[Optional[str], int, Optional[int]], BaseApplicationCommand
+        ] = {}
+        # The compiled subcommand tree of each command, to resolve qualified names without iterating.
+        self._application_command_routes: Dict[BaseApplicationCommand, _CommandRoute] = {}
         # A dictionary of Discord Application Command ID's and the ApplicationCommand object they correspond to.
         self._application_command_ids: Dict[int, BaseApplicationCommand] = {}
 
@@ -266,15 +515,20 @@ class ConnectionState:
         # references now using a regular dictionary with eviction being done
         # using __del__. Testing this for memory leaks led to no discernible leaks,
         # though more testing will have to be done.
-        self._users: Dict[int, User] = {}
-        self._emojis: Dict[int, Emoji] = {}
-        self._stickers: Dict[int, GuildSticker] = {}
-        self._guilds: Dict[int, Guild] = {}
+        backend = self._cache_backend
+        self._users: MutableMapping[int, User] = backend.create_store(
+            "users", on_evict=self._user_evicted
+        )
+        self._emojis: MutableMapping[int, Emoji] = backend.create_store("emojis")
+        self._stickers: MutableMapping[int, GuildSticker] = backend.create_store("stickers")
+        self._guilds: MutableMapping[int, Guild] = backend.create_store("guilds")
         # TODO: Why aren't the above and stuff below application_commands declared in __init__?
         self._application_commands = set()
         # Thought about making these two weakref.WeakValueDictionary's, but the bot could theoretically be holding on
         # to them in a dev-defined, which would desync the bot from itself.
         self._application_command_signatures = {}
+        self._application_command_localizations = {}
+        self._application_command_routes = {}
         self._application_command_ids = {}
         if views:
             self._view_store: ViewStore = ViewStore(self)
@@ -283,14 +537,16 @@ class ConnectionState:
 
         self._voice_clients: Dict[int, VoiceProtocol] = {}
 
-        # LRU of max size 128
-        self._private_channels: OrderedDict[int, PrivateChannel] = OrderedDict()
+        # LRU of max size 128 by default
+        self._private_channels: MutableMapping[int, PrivateChannel] = backend.create_store(
+            "private_channels", on_evict=self._private_channel_evicted
+        )
         # extra dict to look up private channels by user id
         self._private_channels_by_user: Dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(maxlen=self.max_messages)
+            self._messages: Optional[MessageCache] = MessageCache(self.max_messages)
         else:
-            self._messages: Optional[Deque[Message]] = None
+            self._messages: Optional[MessageCache] = None
 
     def process_chunk_requests(
         self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool
@@ -359,6 +615,8 @@ class ConnectionState:
             user = User(state=self, data=data)
             if user.discriminator != "0000":
                 self._users[user_id] = user
+                # The store may keep a different object, such as a view of a shared record.
+                user = self._users.get(user_id, user)
                 user._stored = True
             return user
 
@@ -450,14 +708,8 @@ class ConnectionState:
         return list(self._private_channels.values())
 
     def _get_private_channel(self, channel_id: Optional[int]) -> Optional[PrivateChannel]:
-        try:
-            # the keys of self._private_channels are ints
-            value = self._private_channels[channel_id]  # type: ignore
-        except KeyError:
-            return None
-        else:
-            self._private_channels.move_to_end(channel_id)  # type: ignore
-            return value
+        # the keys of self._private_channels are ints
+        return self._private_channels.get(channel_id)  # type: ignore
 
     def _get_private_channel_by_user(self, user_id: Optional[int]) -> Optional[DMChannel]:
         # the keys of self._private_channels are ints
@@ -467,13 +719,20 @@ class ConnectionState:
         channel_id = channel.id
         self._private_channels[channel_id] = channel
 
-        if len(self._private_channels) > 128:
-            _, to_remove = self._private_channels.popitem(last=False)
-            if isinstance(to_remove, DMChannel) and to_remove.recipient:
-                self._private_channels_by_user.pop(to_remove.recipient.id, None)
+        if (
+            isinstance(channel, DMChannel)
+            and channel.recipient
+            and channel_id in self._private_channels
+        ):
+            self._private_channels_by_user[channel.recipient.id] = channel
 
+    def _private_channel_evicted(self, channel_id: int, channel: PrivateChannel) -> None:
         if isinstance(channel, DMChannel) and channel.recipient:
-            self._private_channels_by_user[channel.recipient.id] = channel
+            self._private_channels_by_user.pop(channel.recipient.id, None)
+
+    def _user_evicted(self, user_id: int, user: User) -> None:
+        # The store no longer holds the user, so it must not deref a newer one once collected.
+        user._stored = False
 
     def add_dm_channel(self, data: DMChannelPayload) -> DMChannel:
         # self.user is *always* cached when this is called
@@ -489,11 +748,7 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: Optional[int]) -> Optional[Message]:
-        return (
-            utils.find(lambda m: m.id == msg_id, reversed(self._messages))
-            if self._messages
-            else None
-        )
+        return self._messages.get(msg_id) if self._messages is not None else None
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
@@ -543,52 +798,38 @@ class ConnectionState:
         guild_id: Optional[int],
         search_localizations: bool = False,
     ) -> Optional[Union[BaseApplicationCommand, SlashApplicationSubcommand]]:
-        def get_parent_command(name: str, /) -> Optional[BaseApplicationCommand]:
-            found = self._application_command_signatures.get((name, type, guild_id))
-            if not search_localizations:
-                return found
-
-            for command in self._application_command_signatures.values():
-                if command.name_localizations and name in command.name_localizations.values():
-                    found = command
-                    break
-
-            return found
-
-        def find_children(
-            parent: Union[BaseApplicationCommand, SlashApplicationSubcommand], name: str, /
-        ) -> Optional[Union[BaseApplicationCommand, SlashApplicationSubcommand]]:
-            children: Dict[str, SlashApplicationSubcommand] = getattr(parent, "children", {})
-            if not children:
-                return parent
-
-            found = children.get(name)
-            if not search_localizations:
-                return found
-
-            subcommand: Union[BaseApplicationCommand, SlashApplicationSubcommand]
-            for subcommand in children.values():
-                if subcommand.name_localizations and name in subcommand.name_localizations.values():
-                    found = subcommand
-                    break
-
-            return found
-
-        parent: Optional[Union[BaseApplicationCommand, SlashApplicationSubcommand]] = None
-
         if not qualified_name:
             return None
 
         if type != ApplicationCommandType.chat_input or " " not in qualified_name:
-            return get_parent_command(qualified_name)
+            names = [qualified_name]
+        else:
+            names = qualified_name.split(" ")
+
+        signature = (names[0], type, guild_id)
+        command = self._application_command_signatures.get(signature)
+        if search_localizations:
+            command = self._application_command_localizations.get(signature, command)
+        if command is None or len(names) == 1:
+            return command
+
+        route = self._application_command_routes.get(command)
+        if route is None:
+            route = self._application_command_routes[command] = _CommandRoute(command)
+        for name in names[1:]:
+            if not route.children:
+                # Extra names past a command without subcommands are ignored.
+                break
 
-        for command_name in qualified_name.split(" "):
-            if parent is None:
-                parent = get_parent_command(command_name)
-            else:
-                parent = find_children(parent, command_name)
+            child = route.children.get(name)
+            if search_localizations:
+                child = route.localized_children.get(name, child)
+            if child is None:
+                return None
+
+            route = child
 
-        return parent
+        return route.command
 
     def get_guild_application_commands(
         self, guild_id: Optional[int] = None, rollout: bool = False
@@ -654,7 +895,7 @@ class ConnectionState:
                     )
                 # No else because we do not care if the command has its own signature already in.
             else:
-                self._application_command_signatures[signature] = command
+                self._add_application_command_signature(signature, command)
         for command_id in command.command_ids.values():
             # PyCharm flags found_command as it "might be referenced before assignment", but that can't happen due to it
             #  being in an AND statement.
@@ -671,6 +912,8 @@ class ConnectionState:
             self._application_command_ids[command_id] = command
         # TODO: Add the command to guilds. Should it? Check if it does in the Guild add.
         self._application_commands.add(command)
+        self._application_command_routes[command] = _CommandRoute(command)
+        command._interaction_checks.clear()
 
     def remove_application_command(self, command: BaseApplicationCommand) -> None:
         """Removes the command and all signatures + associated IDs from the state.
@@ -683,10 +926,35 @@ class ConnectionState:
         """
         signature_set = command.get_rollout_signatures()
         for signature in signature_set:
-            self._application_command_signatures.pop(signature, None)
+            self._remove_application_command_signature(signature)
         for cmd_id in command.command_ids.values():
             self._application_command_ids.pop(cmd_id, None)
         self._application_commands.discard(command)
+        self._application_command_routes.pop(command, None)
+        command._interaction_checks.clear()
+
+    def _add_application_command_signature(
+        self, signature: Tuple[Optional[str], int, Optional[int]], command: BaseApplicationCommand
+    ) -> None:
+        self._application_command_signatures[signature] = command
+        if command.name_localizations:
+            _, cmd_type, guild_id = signature
+            localizations = self._application_command_localizations
+            for localized_name in command.name_localizations.values():
+                localizations[(localized_name, cmd_type, guild_id)] = command
+
+    def _remove_application_command_signature(
+        self, signature: Tuple[Optional[str], int, Optional[int]]
+    ) -> None:
+        command = self._application_command_signatures.pop(signature, None)
+        if command is None or not command.name_localizations:
+            return
+
+        _, cmd_type, guild_id = signature
+        for localized_name in command.name_localizations.values():
+            localized_signature = (localized_name, cmd_type, guild_id)
+            if self._application_command_localizations.get(localized_signature) is command:
+                del self._application_command_localizations[localized_signature]
 
     def add_all_rollout_signatures(self) -> None:
         """This adds all command signatures for rollouts to the signature cache."""
@@ -1122,7 +1390,7 @@ class ConnectionState:
                 )
 
             self._application_command_ids.pop(command.command_ids[guild_id], None)
-            self._application_command_signatures.pop(command.get_signature(guild_id), None)
+            self._remove_application_command_signature(command.get_signature(guild_id))
 
         except KeyError as e:
             if guild_id:
@@ -1208,8 +1476,8 @@ class ConnectionState:
             raise
 
     async def _delay_ready(self) -> None:
+        scheduler = ChunkScheduler(self)
         try:
-            states = []
             while True:
                 # this snippet of code is basically waiting N seconds
                 # until the last GUILD_CREATE was sent
@@ -1221,27 +1489,14 @@ class ConnectionState:
                     break
                 else:
                     if self._guild_needs_chunking(guild):
-                        future = await self.chunk_guild(guild, wait=False)
-                        states.append((guild, future))
+                        # Chunk the guild in the background while GUILD_CREATEs keep streaming in
+                        scheduler.add(guild)
                     elif guild.unavailable is False:
                         self.dispatch("guild_available", guild)
                     else:
                         self.dispatch("guild_join", guild)
 
-            for guild, future in states:
-                try:
-                    await asyncio.wait_for(future, timeout=5.0)
-                except asyncio.TimeoutError:
-                    _log.warning(
-                        "Shard ID %s timed out waiting for chunks for guild_id %s.",
-                        guild.shard_id,
-                        guild.id,
-                    )
-
-                if guild.unavailable is False:
-                    self.dispatch("guild_available", guild)
-                else:
-                    self.dispatch("guild_join", guild)
+            await scheduler.wait()
 
             # remove the state
             # AttributeError: already been deleted somehow
@@ -1249,7 +1504,7 @@ class ConnectionState:
                 del self._ready_state
 
         except asyncio.CancelledError:
-            pass
+            scheduler.cancel()
         else:
             # dispatch the event
             self.call_handlers("ready")
@@ -1262,6 +1517,7 @@ class ConnectionState:
             self._ready_task.cancel()
 
         self._ready_state = asyncio.Queue()
+        self._restored_shards.clear()
         self.clear(views=False)
         self.user = ClientUser(state=self, data=data["user"])
         self.store_user(data["user"])
@@ -1283,7 +1539,16 @@ class ConnectionState:
         self._ready_task = asyncio.create_task(self._delay_ready())
 
     def parse_resumed(self, data) -> None:
+        restored = data["__shard_id__"] in self._restored_shards
+        if restored:
+            # The session of a snapshot was resumed instead of receiving READY.
+            self._restored_shards.clear()
+            self.dispatch("connect")
+
         self.dispatch("resumed")
+        if restored:
+            self.call_handlers("ready")
+            self.dispatch("ready")
 
     def parse_message_create(self, data) -> None:
         channel, _ = self._get_guild_channel(data)
@@ -1303,29 +1568,28 @@ class ConnectionState:
         self.dispatch("raw_message_delete", raw)
         if self._messages is not None and found is not None:
             self.dispatch("message_delete", found)
-            self._messages.remove(found)
+            self._messages.pop(found.id)
 
     def parse_message_delete_bulk(self, data) -> None:
         raw = RawBulkMessageDeleteEvent(data)
-        if self._messages:
-            found_messages = [
-                message for message in self._messages if message.id in raw.message_ids
-            ]
-        else:
-            found_messages = []
+        found_messages = self._messages.get_many(raw.message_ids) if self._messages else []
         raw.cached_messages = found_messages
         self.dispatch("raw_bulk_message_delete", raw)
         if found_messages:
             self.dispatch("bulk_message_delete", found_messages)
             for msg in found_messages:
                 # self._messages won't be None here
-                self._messages.remove(msg)  # type: ignore
+                self._messages.pop(msg.id)  # type: ignore
 
     def parse_message_update(self, data) -> None:
         raw = RawMessageUpdateEvent(data)
         message = self._get_message(raw.message_id)
         if message is not None:
-            older_message = copy.copy(message)
+            if self._has_listener("message_edit") or self._has_listener("raw_message_edit"):
+                older_message = copy.copy(message)
+            else:
+                # Nothing would see the message before the edit.
+                older_message = message
             raw.cached_message = older_message
             self.dispatch("raw_message_edit", raw)
             message._update(data)
@@ -1444,7 +1708,7 @@ class ConnectionState:
             )
             return
 
-        old_member = Member._copy(member)
+        old_member = Member._copy(member) if self._has_listener("presence_update") else member
         user_update = member._presence_update(data=data, user=user)
         if user_update:
             self.dispatch("user_update", user_update[0], user_update[1])
@@ -1612,7 +1876,7 @@ class ConnectionState:
         except KeyError:
             # If not provided, then the entire guild is being synced
             # So all previous thread data should be overwritten
-            previous_threads = guild._threads.copy()
+            previous_threads = dict(guild._threads)
             guild._clear_threads()
         else:
             previous_threads = guild._filter_threads(channel_ids)
@@ -1746,7 +2010,7 @@ class ConnectionState:
 
         member = guild.get_member(user_id)
         if member is not None:
-            old_member = Member._copy(member)
+            old_member = Member._copy(member) if self._has_listener("member_update") else member
             member._update(data)
             user_update = member._update_inner_user(user)
             if user_update:
@@ -1767,7 +2031,13 @@ class ConnectionState:
                 "GUILD_MEMBER_UPDATE referencing an unknown member ID: %s. Discarding.", user_id
             )
 
+    def _invalidate_response(self, path: str, **parameters: Any) -> None:
+        cache = self.http._response_cache
+        if cache is not None:
+            cache.invalidate(path, **parameters)
+
     def parse_guild_emojis_update(self, data) -> None:
+        self._invalidate_response("/guilds/{guild_id}/preview", guild_id=data["guild_id"])
         guild = self._get_guild(int(data["guild_id"]))
         if guild is None:
             _log.debug(
@@ -1783,6 +2053,9 @@ class ConnectionState:
         self.dispatch("guild_emojis_update", guild, before_emojis, guild.emojis)
 
     def parse_guild_stickers_update(self, data) -> None:
+        self._invalidate_response("/guilds/{guild_id}/preview", guild_id=data["guild_id"])
+        for sticker_data in data["stickers"]:
+            self._invalidate_response("/stickers/{sticker_id}", sticker_id=sticker_data["id"])
         guild = self._get_guild(int(data["guild_id"]))
         if guild is None:
             _log.debug(
@@ -1794,6 +2067,7 @@ class ConnectionState:
         before_stickers = guild.stickers
         for emoji in before_stickers:
             self._stickers.pop(emoji.id, None)
+            self._invalidate_response("/stickers/{sticker_id}", sticker_id=emoji.id)
         guild.stickers = tuple([self.store_sticker(guild, d) for d in data["stickers"]])
         self.dispatch("guild_stickers_update", guild, before_stickers, guild.stickers)
 
@@ -1869,6 +2143,7 @@ class ConnectionState:
             self.dispatch("guild_join", guild)
 
     def parse_guild_update(self, data) -> None:
+        self._invalidate_response("/guilds/{guild_id}/preview", guild_id=data["id"])
         guild = self._get_guild(int(data["id"]))
         if guild is not None:
             old_guild = copy.copy(guild)
@@ -1878,6 +2153,7 @@ class ConnectionState:
             _log.debug("GUILD_UPDATE referencing an unknown guild ID: %s. Discarding.", data["id"])
 
     def parse_guild_delete(self, data) -> None:
+        self._invalidate_response("/guilds/{guild_id}/preview", guild_id=data["id"])
         guild = self._get_guild(int(data["id"]))
         if guild is None:
             _log.debug("GUILD_DELETE referencing an unknown guild ID: %s. Discarding.", data["id"])
@@ -1892,9 +2168,7 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(
-                (msg for msg in self._messages if msg.guild != guild), maxlen=self.max_messages
-            )
+            self._messages.remove_guild(guild.id)
 
         self._remove_guild(guild)
         self.dispatch("guild_remove", guild)
@@ -2404,9 +2678,8 @@ class AutoShardedConnectionState(ConnectionState):
 
     async def _delay_ready(self) -> None:
         await self.shards_launched.wait()
-        processed = []
-        max_concurrency = len(self.shard_ids) * 2
-        current_bucket = []
+        scheduler = ChunkScheduler(self)
+        shard_ids: Set[int] = set()
         while True:
             # this snippet of code is basically waiting N seconds
             # until the last GUILD_CREATE was sent
@@ -2417,56 +2690,23 @@ class AutoShardedConnectionState(ConnectionState):
             except asyncio.TimeoutError:
                 break
             else:
+                shard_ids.add(guild.shard_id)
                 if self._guild_needs_chunking(guild):
                     _log.debug(
                         "Guild ID %d requires chunking, will be done in the background.", guild.id
                     )
-                    if len(current_bucket) >= max_concurrency:
-                        try:
-                            await utils.sane_wait_for(
-                                current_bucket, timeout=max_concurrency * 70.0
-                            )
-                        except asyncio.TimeoutError:
-                            fmt = "Shard ID %s failed to wait for chunks from a sub-bucket with length %d"
-                            _log.warning(fmt, guild.shard_id, len(current_bucket))
-                        finally:
-                            current_bucket = []
-
-                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming
-                    future = asyncio.ensure_future(self.chunk_guild(guild))
-                    current_bucket.append(future)
-                else:
-                    future = self.loop.create_future()
-                    future.set_result([])
-
-                processed.append((guild, future))
-
-        processed: list[tuple[Guild, Future]]
-        key: Callable[[tuple[Guild, Future[list[Member]]]], int] = lambda g: g[0].shard_id
-        guilds = sorted(processed, key=key)
-        for shard_id, info in itertools.groupby(guilds, key=key):
-            children: Tuple[Guild]
-            futures: Tuple[Future]
-            children, futures = zip(*info, strict=False)
-            # 110 reqs/minute w/ 1 req/guild plus some buffer
-            timeout = 61 * (len(children) / 110)
-            try:
-                await utils.sane_wait_for(futures, timeout=timeout)
-            except asyncio.TimeoutError:
-                _log.warning(
-                    "Shard ID %s failed to wait for chunks (timeout=%.2f) for %d guilds",
-                    shard_id,
-                    timeout,
-                    len(guilds),
-                )
-            for guild in children:
-                if guild.unavailable is False:
+                    scheduler.add(guild)
+                elif guild.unavailable is False:
                     self.dispatch("guild_available", guild)
                 else:
                     self.dispatch("guild_join", guild)
 
+        async def shard_ready(shard_id: int) -> None:
+            await scheduler.wait(shard_id)
             self.dispatch("shard_ready", shard_id)
 
+        await asyncio.gather(*(shard_ready(shard_id) for shard_id in sorted(shard_ids)))
+
         # remove the state
         # AttributeError if already been deleted somehow
         with contextlib.suppress(AttributeError):
@@ -2484,6 +2724,7 @@ class AutoShardedConnectionState(ConnectionState):
     def parse_ready(self, data) -> None:
         if not hasattr(self, "_ready_state"):
             self._ready_state = asyncio.Queue()
+        self._restored_shards.discard(data["__shard_id__"])
 
         self.user = user = ClientUser(state=self, data=data["user"])
         # self._users is a list of Users, we're setting a ClientUser
@@ -2511,5 +2752,18 @@ class AutoShardedConnectionState(ConnectionState):
             self._ready_task = asyncio.create_task(self._delay_ready())
 
     def parse_resumed(self, data) -> None:
+        shard_id = data["__shard_id__"]
+        restored = shard_id in self._restored_shards
+        if restored:
+            # The session of a snapshot was resumed instead of receiving READY.
+            self._restored_shards.discard(shard_id)
+            self.dispatch("connect")
+            self.dispatch("shard_connect", shard_id)
+
         self.dispatch("resumed")
-        self.dispatch("shard_resumed", data["__shard_id__"])
+        self.dispatch("shard_resumed", shard_id)
+        if restored:
+            self.dispatch("shard_ready", shard_id)
+            if not self._restored_shards and self._ready_task is None:
+                self.call_handlers("ready")
+                self.dispatch("ready")